@@ -5,6 +5,8 @@ import base64
 import base58
 import binascii
 
+from random import random
+
 from ontology.crypto.curve import Curve
 from ontology.crypto.digest import Digest
 from ontology.crypto.scrypt import Scrypt
@@ -18,10 +20,14 @@ from ontology.io.memory_stream import StreamManager
 from ontology.exception.error_code import ErrorCode
 from ontology.exception.exception import SDKException
 from ontology.crypto.signature_scheme import SignatureScheme
+from ontology.crypto.sign_verify_mode import SignVerifyMode
 from ontology.crypto.signature_handler import SignatureHandler
 
 
 class Account(object):
+    __default_sign_verify_mode = SignVerifyMode.ON
+    __default_sign_verify_rate = 1.0
+
     def __init__(self, private_key: str or bytes, scheme=SignatureScheme.SHA256withECDSA):
         self.__signature_scheme = scheme
         if scheme == SignatureScheme.SHA256withECDSA:
@@ -44,22 +50,63 @@ class Account(object):
             raise SDKException(ErrorCode.invalid_private_key)
         self.__curve_name = Curve.P256
         self.__public_key = Signature.ec_get_public_key_by_private_key(self.__private_key, self.__curve_name)
+        self.__public_key_hex = binascii.b2a_hex(self.__public_key).decode('ascii')
         self.__address = Address.address_from_bytes_pubkey(self.__public_key)
+        self.__handler = SignatureHandler(self.__key_type, self.__signature_scheme)
+        self.__signing_key = None
+        self.__sign_verify_mode = None
+        self.__sign_verify_rate = None
+
+    @staticmethod
+    def set_default_sign_verify_mode(mode: SignVerifyMode, rate: float = 0.01):
+        """
+        This interface is used to set whether the accounts verify their signatures after signing by default.
+
+        :param mode: verify every signature, no signature, or a sampled part of signatures.
+        :param rate: the rate of signatures to be verified in sampled mode.
+        """
+        if not isinstance(mode, SignVerifyMode):
+            raise SDKException(ErrorCode.param_err('a SignVerifyMode object is required.'))
+        Account.__default_sign_verify_mode = mode
+        Account.__default_sign_verify_rate = rate
+
+    def set_sign_verify_mode(self, mode: SignVerifyMode or None, rate: float = 0.01):
+        """
+        This interface is used to set whether the account verifies its signatures after signing,
+        None means using the default mode of accounts.
+
+        :param mode: verify every signature, no signature, or a sampled part of signatures.
+        :param rate: the rate of signatures to be verified in sampled mode.
+        """
+        if mode is not None and not isinstance(mode, SignVerifyMode):
+            raise SDKException(ErrorCode.param_err('a SignVerifyMode object is required.'))
+        self.__sign_verify_mode = mode
+        self.__sign_verify_rate = rate
+
+    def __is_sign_verified(self) -> bool:
+        if self.__sign_verify_mode is None:
+            mode, rate = Account.__default_sign_verify_mode, Account.__default_sign_verify_rate
+        else:
+            mode, rate = self.__sign_verify_mode, self.__sign_verify_rate
+        if mode == SignVerifyMode.ON:
+            return True
+        if mode == SignVerifyMode.OFF:
+            return False
+        return random() < rate
 
     def generate_signature(self, msg: bytes):
-        handler = SignatureHandler(self.__key_type, self.__signature_scheme)
-        signature_value = handler.generate_signature(binascii.b2a_hex(self.__private_key), msg)
+        if self.__signing_key is None:
+            self.__signing_key = self.__handler.derive_private_key(binascii.b2a_hex(self.__private_key))
+        signature_value = self.__handler.generate_signature(self.__signing_key, msg)
         bytes_signature = Signature(self.__signature_scheme, signature_value).to_bytes()
-        result = handler.verify_signature(self.__public_key, msg, bytes_signature)
-        if not result:
+        if self.__is_sign_verified() and not self.__handler.verify_signature(self.__public_key, msg, bytes_signature):
             raise SDKException(ErrorCode.invalid_signature_data)
         return bytes_signature
 
     def verify_signature(self, msg: bytes, signature: bytes):
         if msg is None or signature is None:
             raise Exception(ErrorCode.param_err("param should not be None"))
-        handler = SignatureHandler(self.__key_type, self.__signature_scheme)
-        return handler.verify_signature(self.get_public_key_bytes(), msg, signature)
+        return self.__handler.verify_signature(self.__public_key, msg, signature)
 
     def get_ont_id(self):
         return DID_ONT + self.get_address_base58()
@@ -213,7 +260,7 @@ class Account(object):
 
         :return: the hexadecimal public key in the form of string.
         """
-        return binascii.b2a_hex(self.__public_key).decode('ascii')
+        return self.__public_key_hex
 
     def export_wif(self) -> str:
         """
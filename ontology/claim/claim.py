@@ -7,7 +7,9 @@ import base64
 import binascii
 
 from time import time, sleep
+from typing import List
 
+from ontology.common.define import DID_ONT
 from ontology.claim.header import Header
 from ontology.crypto.digest import Digest
 from ontology.claim.payload import Payload
@@ -112,6 +114,54 @@ class Claim(object):
                 break
         return result
 
+    def validate_signatures(self, b64_claims: List[str], max_workers: int = 0) -> List[bool]:
+        """
+        This interface is used to validate the signatures of many claims at once.
+        The public keys of each issuer are queried only once, and the signatures are verified in batch.
+
+        :param b64_claims: a list of base64 encoded claims.
+        :param max_workers: the number of threads to verify the signatures, 0 means verifying in current thread.
+        :return: a list of validation results in the same order as b64_claims, a malformed claim is not valid.
+        """
+        issuer_pub_keys = dict()
+        items = list()
+        indexes = list()
+        for index, b64_claim in enumerate(b64_claims):
+            try:
+                head, iss_ont_id, msg, signature = Claim.__decode_b64_claim(b64_claim)
+            except (SDKException, ValueError, TypeError, AttributeError):
+                continue
+            if iss_ont_id not in issuer_pub_keys:
+                pub_keys = self.__sdk.native_vm.ont_id().get_public_keys(iss_ont_id)
+                issuer_pub_keys[iss_ont_id] = {pk_info.get('PubKeyId', ''): pk_info.get('Value', '') for pk_info in
+                                               pub_keys}
+            pk = issuer_pub_keys[iss_ont_id].get(head.kid, '')
+            if len(pk) == 0:
+                continue
+            try:
+                pk = binascii.a2b_hex(pk)
+            except ValueError:
+                continue
+            items.append((pk, msg, signature))
+            indexes.append(index)
+        results = [False] * len(b64_claims)
+        for index, result in zip(indexes, SignatureHandler.verify_many(items, max_workers)):
+            results[index] = result
+        return results
+
+    @staticmethod
+    def __decode_b64_claim(b64_claim: str) -> tuple:
+        try:
+            b64_head, b64_payload, b64_signature, _ = b64_claim.split('.')
+        except ValueError:
+            raise SDKException(ErrorCode.invalid_b64_claim_data)
+        head = Header.from_base64(b64_head)
+        iss_ont_id = Payload.from_base64(b64_payload).iss
+        if not isinstance(iss_ont_id, str) or not iss_ont_id.startswith(DID_ONT):
+            raise SDKException(ErrorCode.invalid_ont_id_format(iss_ont_id))
+        msg = f'{b64_head}.{b64_payload}'.encode('ascii')
+        return head, iss_ont_id, msg, base64.b64decode(b64_signature)
+
     def validate_blk_proof(self):
         return self.blk_proof.validate_blk_proof()
 
@@ -2,9 +2,11 @@
 # -*- coding: utf-8 -*-
 
 import binascii
-from typing import List
+from hashlib import sha256
+from typing import List, Tuple, Dict
+from itertools import product
+from functools import lru_cache
 
-import base58
 from binascii import a2b_hex
 
 from ontology.vm.op_code import CHECKSIG
@@ -17,6 +19,9 @@ from ontology.exception.exception import SDKException
 
 class Address(object):
     __COIN_VERSION = b'\x17'
+    __B58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+    __B58_INDEX = {char: index for index, char in enumerate(__B58_ALPHABET)}
+    __B58_PAIRS = [''.join(pair) for pair in product(__B58_ALPHABET, repeat=2)]
 
     def __init__(self, script_hash: bytes):
         if not isinstance(script_hash, bytes):
@@ -25,17 +30,39 @@ class Address(object):
             raise SDKException(ErrorCode.other_error('Invalid script hash.'))
         self.ZERO = script_hash
 
+    @property
+    def ZERO(self) -> bytes:
+        return self.__zero
+
+    @ZERO.setter
+    def ZERO(self, script_hash: bytes):
+        self.__zero = script_hash
+        self.__b58_address = ''
+        self.__hex_address = ''
+        self.__reverse_hex_address = ''
+
     @staticmethod
     def to_script_hash(byte_script) -> bytes:
         return a2b_hex(Digest.hash160(msg=byte_script, is_hex=True))
 
     @staticmethod
     def address_from_bytes_pubkey(public_key: bytes):
+        """
+        This interface is used to get the address of a public key, the recently used addresses are cached.
+        The returned Address object is shared by all callers with the same public key, and should not be modified.
+
+        :param public_key: the public key in the form of bytes.
+        :return: an Address object.
+        """
+        return Address.__address_from_bytes_pubkey(bytes(public_key))
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def __address_from_bytes_pubkey(public_key: bytes):
         builder = ParamsBuilder()
         builder.emit_push_byte_array(bytearray(public_key))
         builder.emit(CHECKSIG)
-        addr = Address(Address.to_script_hash(builder.to_bytes()))
-        return addr
+        return Address(Address.to_script_hash(builder.to_bytes()))
 
     @staticmethod
     def address_from_multi_pub_keys(m: int, pub_keys: List[bytes]):
@@ -56,10 +83,79 @@ class Address(object):
         return Address(script_hash)
 
     def b58encode(self):
-        script_builder = Address.__COIN_VERSION + self.ZERO
-        c256 = Digest.hash256(script_builder)[0:4]
-        out_byte_array = script_builder + bytearray(c256)
-        return base58.b58encode(bytes(out_byte_array)).decode('utf-8')
+        if len(self.__b58_address) == 0:
+            self.__b58_address = Address.__b58encode_script_hash(self.ZERO)
+        return self.__b58_address
+
+    @staticmethod
+    def __b58encode_script_hash(script_hash: bytes) -> str:
+        data = Address.__COIN_VERSION + script_hash
+        value = int.from_bytes(data + sha256(sha256(data).digest()).digest()[0:4], 'big')
+        pairs = Address.__B58_PAIRS
+        chars = list()
+        while value > 0:
+            value, remainder = divmod(value, 3364)
+            chars.append(pairs[remainder])
+        return ''.join(reversed(chars)).lstrip('1')
+
+    @staticmethod
+    def __b58decode_script_hash(address: str) -> bytes:
+        if not isinstance(address, str) or address.startswith('1'):
+            raise SDKException(ErrorCode.param_error)
+        index = Address.__B58_INDEX
+        value = 0
+        try:
+            for char in address:
+                value = value * 58 + index[char]
+            data = value.to_bytes(25, 'big')
+        except (KeyError, OverflowError):
+            raise SDKException(ErrorCode.param_error)
+        if data[0:1] != Address.__COIN_VERSION:
+            raise SDKException(ErrorCode.param_error)
+        if data[21:25] != sha256(sha256(data[0:21]).digest()).digest()[0:4]:
+            raise SDKException(ErrorCode.param_error)
+        return data[1:21]
+
+    @staticmethod
+    def b58encode_many(addresses: List['Address' or bytes]) -> Tuple[List[str or None], Dict[int, SDKException]]:
+        """
+        This interface is used to encode many addresses or script hashes into base58 encode addresses.
+
+        :param addresses: a list of Address objects or 20 bytes script hashes.
+        :return: a list of base58 encode addresses in the same order as addresses, with None for the invalid ones,
+                 and a dict which maps the index of each invalid one to its error.
+        """
+        b58_addresses = list()
+        errors = dict()
+        for index, address in enumerate(addresses):
+            if isinstance(address, Address):
+                b58_addresses.append(address.b58encode())
+            elif isinstance(address, bytes) and len(address) == 20:
+                b58_addresses.append(Address.__b58encode_script_hash(address))
+            else:
+                b58_addresses.append(None)
+                errors[index] = SDKException(ErrorCode.other_error('Invalid script hash.'))
+        return b58_addresses, errors
+
+    @staticmethod
+    def b58decode_many(addresses: List[str]) -> Tuple[List['Address' or None], Dict[int, SDKException]]:
+        """
+        This interface is used to decode many base58 encode addresses, and check all of them instead of raising
+        an exception at the first invalid one.
+
+        :param addresses: a list of base58 encode addresses.
+        :return: a list of Address objects in the same order as addresses, with None for the invalid ones,
+                 and a dict which maps the index of each invalid one to its error.
+        """
+        decoded = list()
+        errors = dict()
+        for index, address in enumerate(addresses):
+            try:
+                decoded.append(Address(Address.__b58decode_script_hash(address)))
+            except SDKException as e:
+                decoded.append(None)
+                errors[index] = e
+        return decoded, errors
 
     def to_bytes(self):
         return self.ZERO
@@ -68,21 +164,15 @@ class Address(object):
         return bytearray(self.ZERO)
 
     def to_hex_str(self):
-        return binascii.b2a_hex(self.ZERO).decode('ascii')
+        if len(self.__hex_address) == 0:
+            self.__hex_address = binascii.b2a_hex(self.ZERO).decode('ascii')
+        return self.__hex_address
 
     def to_reverse_hex_str(self):
-        bytearray_zero = bytearray(self.ZERO)
-        bytearray_zero.reverse()
-        return binascii.b2a_hex(bytearray_zero).decode('ascii')
+        if len(self.__reverse_hex_address) == 0:
+            self.__reverse_hex_address = binascii.b2a_hex(self.ZERO[::-1]).decode('ascii')
+        return self.__reverse_hex_address
 
     @staticmethod
     def b58decode(address: str):
-        data = base58.b58decode(address)
-        if len(data) != 25:
-            raise SDKException(ErrorCode.param_error)
-        if data[0] != int.from_bytes(Address.__COIN_VERSION, "little"):
-            raise SDKException(ErrorCode.param_error)
-        checksum = Digest.hash256(data[0:21])
-        if data[21:25] != checksum[0:4]:
-            raise SDKException(ErrorCode.param_error)
-        return Address(data[1:21])
+        return Address(Address.__b58decode_script_hash(address))
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+
+from collections import deque
+from itertools import islice
+from typing import List, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+
+from ontology.core.sig import Sig
+from ontology.crypto.digest import Digest
+from ontology.account.account import Account
+from ontology.core.transaction import Transaction
+from ontology.io.binary_writer import BinaryWriter
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+
+_worker_signers = list()
+
+
+def _init_worker(keys: List[tuple]):
+    global _worker_signers
+    _worker_signers = [Account(private_key, scheme) for private_key, scheme in keys]
+
+
+def _sign_chunk(unsigned_list: List[bytes]) -> List[bytes]:
+    signed_list = list()
+    for unsigned in unsigned_list:
+        tx_hash = Digest.hash256(unsigned)
+        chunks = [unsigned, BinaryWriter.pack_var_int(len(_worker_signers))]
+        for signer in _worker_signers:
+            sig = Sig([signer.get_public_key_bytes()], 1, [signer.generate_signature(tx_hash)])
+            chunks.append(sig.serialize())
+        signed_list.append(b''.join(chunks))
+    return signed_list
+
+
+class BulkTransactionSigner(object):
+    """
+    Sign a large number of transactions by the same signers on a process pool.
+
+    The private keys are sent to each worker process only once when it starts, and then only the unsigned
+    serialization of transactions is sent to workers in chunks. Each transaction is signed by every signer in order,
+    which is the same as calling sign_transaction for the first signer and add_sign_transaction for the others.
+
+    :param signers: a list of Account objects to sign every transaction.
+    :param max_workers: the number of worker processes, the number of CPUs by default.
+    :param chunk_size: the number of transactions sent to a worker at a time.
+    """
+
+    def __init__(self, signers: List[Account], max_workers: int = None, chunk_size: int = 256):
+        if len(signers) == 0:
+            raise SDKException(ErrorCode.param_err('at least one signer is required.'))
+        if chunk_size <= 0:
+            raise SDKException(ErrorCode.param_err('the chunk size should be greater than 0.'))
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        keys = [(signer.get_private_key_hex(), signer.get_signature_scheme()) for signer in signers]
+        self.__max_workers = max_workers
+        self.__chunk_size = chunk_size
+        self.__executor = ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=(keys,))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def sign(self, txs: Iterable[Transaction]) -> Iterator[bytes]:
+        """
+        This interface is used to sign the transactions, the existing signatures of them are ignored.
+
+        :param txs: an iterable of unsigned Transaction objects.
+        :return: an iterator of the serialized signed transactions, in the same order as txs.
+        """
+        txs = iter(txs)
+        pending = deque()
+        while True:
+            while len(pending) < self.__max_workers * 2:
+                chunk = [tx.serialize_unsigned(is_hex=False) for tx in islice(txs, self.__chunk_size)]
+                if len(chunk) == 0:
+                    break
+                pending.append(self.__executor.submit(_sign_chunk, chunk))
+            if len(pending) == 0:
+                return
+            for signed in pending.popleft().result():
+                yield signed
+
+    def close(self):
+        self.__executor.shutdown()
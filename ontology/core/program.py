@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import struct
 import binascii
 from typing import List
 
@@ -9,9 +10,7 @@ from ontology.exception.error_code import ErrorCode
 from ontology.exception.exception import SDKException
 from ontology.io.binary_reader import BinaryReader
 from ontology.vm.op_code import PUSHBYTES75, PUSHBYTES1, PUSHDATA1, PUSHDATA2, PUSHDATA4, CHECKSIG, CHECKMULTISIG, PUSH1
-from ontology.io.binary_writer import BinaryWriter
 from ontology.io.memory_stream import StreamManager
-from ontology.utils.utils import bytes_reader
 from ontology.vm.params_builder import ParamsBuilder
 from ecdsa import util
 from ontology.common import define
@@ -35,27 +34,21 @@ class ProgramBuilder(object):
 
     @staticmethod
     def push_bytes(data):
-        ms = StreamManager.get_stream()
-        writer = BinaryWriter(ms)
         if len(data) == 0:
             raise ValueError("push data error: data is null")
+        res = bytearray()
         if len(data) <= int.from_bytes(PUSHBYTES75, 'little') + 1 - int.from_bytes(PUSHBYTES1, 'little'):
-            num = len(data) + int.from_bytes(PUSHBYTES1, 'little') - 1
-            writer.write_byte(num)
+            res.append(len(data) + int.from_bytes(PUSHBYTES1, 'little') - 1)
         elif len(data) < 0x100:
-            writer.write_byte(PUSHDATA1)
-            writer.write_uint8(len(data))
+            res += PUSHDATA1
+            res += struct.pack('<B', len(data))
         elif len(data) < 0x10000:
-            writer.write_byte(PUSHDATA2)
-            writer.write_uint16(len(data))
+            res += PUSHDATA2
+            res += struct.pack('<H', len(data))
         else:
-            writer.write_byte(PUSHDATA4)
-            writer.write_uint32(len(data))
-        writer.write_bytes(data)
-        ms.flush()
-        res = ms.to_bytes()
-        StreamManager.release_stream(ms)
-        res = bytes_reader(res)
+            res += PUSHDATA4
+            res += struct.pack('<I', len(data))
+        res += data
         return res
 
     @staticmethod
@@ -3,7 +3,6 @@
 
 import binascii
 
-from ontology.utils.utils import bytes_reader
 from ontology.core.program import ProgramBuilder
 from ontology.io.binary_reader import BinaryReader
 from ontology.io.binary_writer import BinaryWriter
@@ -46,15 +45,8 @@ class Sig(object):
             verification_script = ProgramBuilder.program_from_pubkey(self.public_keys[0])
         else:
             verification_script = ProgramBuilder.program_from_multi_pubkey(self.m, self.public_keys)
-        ms = StreamManager.get_stream()
-        writer = BinaryWriter(ms)
-        writer.write_var_bytes(invoke_script)
-        writer.write_var_bytes(verification_script)
-        ms.flush()
-        res = ms.to_bytes()
-        res = bytes_reader(res)
-        StreamManager.release_stream(ms)
-        return res
+        return b''.join([BinaryWriter.pack_var_int(len(invoke_script)), bytes(invoke_script),
+                         BinaryWriter.pack_var_int(len(verification_script)), bytes(verification_script)])
 
     @staticmethod
     def deserialize_from(sig_bytes: bytes):
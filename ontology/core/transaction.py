@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import struct
 import binascii
 
+from io import BytesIO
 from typing import List
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
 from ontology.core.sig import Sig
@@ -31,6 +34,10 @@ class TransactionType(Enum):
 
 
 class Transaction(object):
+    __header = struct.Struct('<BBIQQ')
+    __unsigned_serial = None
+    __hash = None
+
     def __init__(self, version=0, tx_type=None, nonce=None, gas_price=None, gas_limit=None, payer=None, payload=None,
                  attributes=None, sigs: List[Sig] = None):
         self.version = version
@@ -45,6 +52,12 @@ class Transaction(object):
         self.attributes = attributes
         self.sigs = sigs
 
+    def __setattr__(self, name: str, value):
+        super().__setattr__(name, value)
+        if name != 'sigs' and not name.startswith('_Transaction__'):
+            self.__unsigned_serial = None
+            self.__hash = None
+
     def __iter__(self):
         data = dict()
         data['version'] = self.version
@@ -61,68 +74,84 @@ class Transaction(object):
         for key, value in data.items():
             yield (key, value)
 
-    def serialize_unsigned(self) -> bytes:
-        ms = StreamManager.get_stream()
-        writer = BinaryWriter(ms)
-        writer.write_uint8(self.version)
-        writer.write_uint8(self.tx_type)
-        writer.write_uint32(self.nonce)
-        writer.write_uint64(self.gas_price)
-        writer.write_uint64(self.gas_limit)
-        writer.write_bytes(self.payer)
-        self.serialize_exclusive_data(writer)
+    def __serialize_exclusive_data(self) -> bytes:
+        if type(self).serialize_exclusive_data is Transaction.serialize_exclusive_data:
+            return b''
+        stream = BytesIO()
+        self.serialize_exclusive_data(BinaryWriter(stream))
+        return stream.getvalue()
+
+    def __get_payer_bytes(self) -> bytes:
+        payer = bytes(self.payer)
+        if len(payer) != 20:
+            try:
+                payer = binascii.a2b_hex(payer)
+            except (binascii.Error, ValueError):
+                pass
+        return payer
+
+    def __serialize_unsigned(self) -> bytes:
+        chunks = [self.__get_payer_bytes(), self.__serialize_exclusive_data()]
         if self.payload is not None:
-            writer.write_var_bytes(bytes(self.payload))
-        writer.write_var_int(len(self.attributes))
-        ms.flush()
-        res = ms.to_bytes()
-        StreamManager.release_stream(ms)
-        return res
+            chunks.append(BinaryWriter.pack_var_int(len(self.payload)))
+            chunks.append(self.payload)
+        chunks.append(BinaryWriter.pack_var_int(len(self.attributes)))
+        buffer = bytearray(self.__header.size + sum(len(chunk) for chunk in chunks))
+        self.__header.pack_into(buffer, 0, self.version, self.tx_type, self.nonce, self.gas_price, self.gas_limit)
+        view = memoryview(buffer)
+        offset = self.__header.size
+        for chunk in chunks:
+            view[offset:offset + len(chunk)] = chunk
+            offset += len(chunk)
+        return bytes(buffer)
+
+    def __get_unsigned_serial(self) -> bytes:
+        if self.__unsigned_serial is None:
+            self.__unsigned_serial = self.__serialize_unsigned()
+        return self.__unsigned_serial
+
+    def __get_hash(self) -> bytes:
+        if self.__hash is None:
+            self.__hash = Digest.hash256(self.__get_unsigned_serial())
+        return self.__hash
+
+    def serialize_unsigned(self, is_hex: bool = True) -> bytes:
+        """
+        This interface is used to serialize the transaction without signatures.
+        The result is cached until a field other than sigs is assigned, so the payload and attributes
+        should be reassigned rather than modified in place.
+
+        :param is_hex: return the hexadecimal encoded bytes if True, otherwise the raw bytes.
+        """
+        tx_serial = self.__get_unsigned_serial()
+        if is_hex:
+            return binascii.b2a_hex(tx_serial)
+        return tx_serial
 
     def serialize_exclusive_data(self, writer):
         pass
 
     def hash256_explorer(self) -> str:
-        tx_serial = self.serialize_unsigned()
-        tx_serial = binascii.a2b_hex(tx_serial)
-        digest = Digest.hash256(tx_serial)
-        if isinstance(digest, bytes):
-            return binascii.b2a_hex(digest[::-1]).decode('ascii')
-        else:
-            return ''
+        return binascii.b2a_hex(self.__get_hash()[::-1]).decode('ascii')
 
     def hash256_bytes(self) -> bytes:
-        tx_serial = self.serialize_unsigned()
-        tx_serial = binascii.a2b_hex(tx_serial)
-        r = Digest.hash256(tx_serial, False)
-        if isinstance(r, bytes):
-            return r
-        else:
-            raise RuntimeError
+        return self.__get_hash()
 
     def hash256_hex(self) -> str:
-        tx_serial = self.serialize_unsigned()
-        tx_serial = binascii.a2b_hex(tx_serial)
-        r = Digest.hash256(tx_serial, True)
-        if isinstance(r, str):
-            return r
-        else:
-            raise RuntimeError
+        return binascii.b2a_hex(self.__get_hash()).decode('ascii')
 
     def serialize(self, is_hex: bool = False) -> bytes:
-        ms = StreamManager.get_stream()
-        writer = BinaryWriter(ms)
-        writer.write_bytes(self.serialize_unsigned())
-        writer.write_var_int(len(self.sigs))
-        for sig in self.sigs:
-            writer.write_bytes(sig.serialize())
-        ms.flush()
-        bytes_tx = ms.to_bytes()
-        StreamManager.release_stream(ms)
+        """
+        This interface is used to serialize the signed transaction in a single pass.
+
+        :param is_hex: return the hexadecimal encoded bytes if True, otherwise the raw bytes.
+        """
+        chunks = [self.__get_unsigned_serial(), BinaryWriter.pack_var_int(len(self.sigs))]
+        chunks.extend([sig.serialize() for sig in self.sigs])
+        bytes_tx = b''.join(chunks)
         if is_hex:
-            return bytes_tx
-        else:
-            return binascii.a2b_hex(bytes_tx)
+            return binascii.b2a_hex(bytes_tx)
+        return bytes_tx
 
     @staticmethod
     def deserialize_from(bytes_tx: bytes):
@@ -204,3 +233,59 @@ class Transaction(object):
                     return
         sig = Sig(pub_keys, m, [sig_data])
         self.sigs.append(sig)
+
+    def sign_batch(self, signers: List[Account] = None, multi_sig_groups: List[tuple] = None, max_workers: int = 0):
+        """
+        This interface is used to sign the transaction by many accounts at once.
+        The transaction is hashed only once, and the signatures are added in the same layout as calling
+        add_sign_transaction for each signer, and add_multi_sign_transaction for each signer of each multi-sig group.
+
+        :param signers: a list of Account objects, each of which adds a single signature.
+        :param multi_sig_groups: a list of (m, pub_keys, signers) tuples, each of which adds a multi signature.
+        :param max_workers: the number of threads to generate signatures, 0 means signing in current thread.
+        """
+        if signers is None:
+            signers = list()
+        if multi_sig_groups is None:
+            multi_sig_groups = list()
+        if self.sigs is None:
+            self.sigs = list()
+        groups = list()
+        new_sigs = list()
+        for m, pub_keys, group_signers in multi_sig_groups:
+            pub_keys = [pk.encode('ascii') if isinstance(pk, str) else pk for pk in pub_keys]
+            pub_keys = ProgramBuilder.sort_public_keys(pub_keys)
+            sig = None
+            for item in self.sigs + new_sigs:
+                if item.public_keys == pub_keys:
+                    sig = item
+                    break
+            if sig is None:
+                sig = Sig(pub_keys, m, list())
+                new_sigs.append(sig)
+            elif sig.m != m:
+                raise SDKException(ErrorCode.param_err('M error'))
+            groups.append((sig, group_signers))
+        if len(self.sigs) + len(signers) + len(new_sigs) > define.TX_MAX_SIG_SIZE:
+            raise SDKException(ErrorCode.param_err('the number of transaction signatures should not be over 16'))
+        sig_data_count = dict()
+        for sig, group_signers in groups:
+            sig_data_count[id(sig)] = sig_data_count.get(id(sig), len(sig.sig_data)) + len(group_signers)
+            if sig_data_count[id(sig)] > len(sig.public_keys):
+                raise SDKException(ErrorCode.param_err('too more sigData'))
+        accounts = list(signers)
+        for _, group_signers in groups:
+            accounts.extend(group_signers)
+        tx_hash = self.hash256_bytes()
+        if max_workers > 1 and len(accounts) > 1:
+            with ThreadPoolExecutor(max_workers) as executor:
+                sig_data_list = list(executor.map(lambda acct: acct.generate_signature(tx_hash), accounts))
+        else:
+            sig_data_list = [acct.generate_signature(tx_hash) for acct in accounts]
+        for signer, sig_data in zip(signers, sig_data_list):
+            self.sigs.append(Sig([signer.get_public_key_bytes()], 1, [sig_data]))
+        self.sigs.extend(new_sigs)
+        index = len(signers)
+        for sig, group_signers in groups:
+            sig.sig_data.extend(sig_data_list[index:index + len(group_signers)])
+            index += len(group_signers)
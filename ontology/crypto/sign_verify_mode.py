@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from enum import Enum, unique
+
+
+@unique
+class SignVerifyMode(Enum):
+    ON = 'on'
+    OFF = 'off'
+    SAMPLED = 'sampled'
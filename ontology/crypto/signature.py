@@ -3,7 +3,9 @@
 
 import binascii
 
-from ecdsa import util, curves, SigningKey
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
 
 from ontology.crypto.curve import Curve
 from ontology.exception.error_code import ErrorCode
@@ -19,16 +21,12 @@ class Signature(object):
     @staticmethod
     def ec_get_public_key_by_private_key(private_key: bytes, curve_name) -> bytes:
         if curve_name == Curve.P256:
-            private_key = SigningKey.from_string(string=private_key, curve=curves.NIST256p)
-            verifying_key = private_key.get_verifying_key()
-            order = verifying_key.pubkey.order
-            x_int = verifying_key.pubkey.point.x()
-            y_int = verifying_key.pubkey.point.y()
-            x_str = util.number_to_string(x_int, order)
-            if y_int % 2 == 0:
-                point_str = util.b('\x02') + x_str
-            else:
-                point_str = util.b('\x03') + x_str
+            try:
+                private_key = ec.derive_private_key(int.from_bytes(private_key, 'big'), ec.SECP256R1(),
+                                                    default_backend())
+            except ValueError:
+                raise SDKException(ErrorCode.invalid_private_key)
+            point_str = private_key.public_key().public_bytes(Encoding.X962, PublicFormat.CompressedPoint)
         elif curve_name == Curve.P224:
             raise SDKException(ErrorCode.unsupported_key_type)
         elif curve_name == Curve.P384:
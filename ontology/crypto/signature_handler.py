@@ -3,14 +3,15 @@
 
 from ecdsa import (
     NIST256p,
-    VerifyingKey,
     ellipticcurve,
     numbertheory,
-    util,
-    keys
+    util
 )
 
-from hashlib import sha256
+from typing import List
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from cryptography.exceptions import InvalidSignature
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.asymmetric import ec
@@ -27,45 +28,95 @@ class SignatureHandler(object):
         self.__type = key_type
         self.__scheme = scheme
 
-    def generate_signature(self, pri_key: str, msg: bytes) -> str:
+    def __get_curve_and_hash(self) -> tuple:
         if self.__scheme == SignatureScheme.SHA224withECDSA:
-            private_key = ec.derive_private_key(int(pri_key, 16), ec.SECP224R1(), default_backend())
-            signature = private_key.sign(
-                msg,
-                ec.ECDSA(hashes.SHA224())
-            )
+            return ec.SECP224R1(), hashes.SHA224()
         elif self.__scheme == SignatureScheme.SHA256withECDSA:
-            private_key = ec.derive_private_key(int(pri_key, 16), ec.SECP256R1(), default_backend())
-            signature = private_key.sign(
-                msg,
-                ec.ECDSA(hashes.SHA256())
-            )
+            return ec.SECP256R1(), hashes.SHA256()
         elif self.__scheme == SignatureScheme.SHA384withECDSA:
-            private_key = ec.derive_private_key(int(pri_key, 16), ec.SECP384R1(), default_backend())
-            signature = private_key.sign(
-                msg,
-                ec.ECDSA(hashes.SHA384())
-            )
+            return ec.SECP384R1(), hashes.SHA384()
         else:
             raise SDKException(ErrorCode.other_error('Invalid signature scheme.'))
+
+    def derive_private_key(self, pri_key: str or bytes) -> ec.EllipticCurvePrivateKey:
+        """
+        This interface is used to derive the private key object, which can be reused for generating signatures.
+
+        :param pri_key: the hexadecimal private key.
+        """
+        curve, _ = self.__get_curve_and_hash()
+        return ec.derive_private_key(int(pri_key, 16), curve, default_backend())
+
+    def generate_signature(self, pri_key: str or bytes or ec.EllipticCurvePrivateKey, msg: bytes) -> str:
+        if not isinstance(pri_key, ec.EllipticCurvePrivateKey):
+            pri_key = self.derive_private_key(pri_key)
+        _, hash_algorithm = self.__get_curve_and_hash()
+        signature = pri_key.sign(msg, ec.ECDSA(hash_algorithm))
         sign = SignatureHandler.dsa_der_to_plain(signature)
         return sign
 
     @staticmethod
-    def verify_signature(public_key: bytes, msg: bytes, signature: bytes):
-        if public_key.startswith(b'\x02') or public_key.startswith(b'\x03'):
-            public_key = SignatureHandler.uncompress_public_key(public_key)
-        elif public_key.startswith(b'\x04'):
-            pass
-        else:
+    @lru_cache(maxsize=4096)
+    def load_public_key(public_key: bytes) -> ec.EllipticCurvePublicKey:
+        """
+        This interface is used to parse a compressed or uncompressed public key, the parsed keys are cached.
+
+        :param public_key: the public key in bytes.
+        """
+        if not (public_key.startswith(b'\x02') or public_key.startswith(b'\x03') or public_key.startswith(b'\x04')):
             raise SDKException(ErrorCode.unknown_asymmetric_key_type)
+        try:
+            return ec.EllipticCurvePublicKey.from_encoded_point(ec.SECP256R1(), public_key)
+        except ValueError:
+            raise SDKException(ErrorCode.unknown_asymmetric_key_type) from None
+
+    @staticmethod
+    def verify_signature(public_key: bytes, msg: bytes, signature: bytes):
+        key = SignatureHandler.load_public_key(bytes(public_key))
         if len(signature) == 65:
             signature = signature[1:]
-        vk = VerifyingKey.from_string(public_key, curve=NIST256p)
+        if len(signature) != 64:
+            return False
+        r = int.from_bytes(signature[:32], 'big')
+        s = int.from_bytes(signature[32:], 'big')
         try:
-            return vk.verify(signature, msg, hashfunc=sha256)
-        except (AssertionError, keys.BadSignatureError, keys.BadDigestError):
+            key.verify(utils.encode_dss_signature(r, s), msg, ec.ECDSA(hashes.SHA256()))
+        except (InvalidSignature, ValueError):
             return False
+        return True
+
+    @staticmethod
+    def __verify_group(public_key: bytes, items: List[tuple]) -> List[tuple]:
+        try:
+            SignatureHandler.load_public_key(public_key)
+        except SDKException:
+            return [(index, False) for index, _, _ in items]
+        verify = SignatureHandler.verify_signature
+        return [(index, verify(public_key, msg, signature)) for index, msg, signature in items]
+
+    @staticmethod
+    def verify_many(items: List[tuple], max_workers: int = 0) -> List[bool]:
+        """
+        This interface is used to verify many signatures at once.
+        The items are grouped by public key, so that each public key is parsed only once.
+
+        :param items: a list of (public_key, msg, signature) tuples.
+        :param max_workers: the number of threads to verify the groups, 0 means verifying in current thread.
+        :return: a list of verification results in the same order as items, False for an invalid public key.
+        """
+        groups = dict()
+        for index, (public_key, msg, signature) in enumerate(items):
+            groups.setdefault(bytes(public_key), list()).append((index, msg, signature))
+        if max_workers > 1 and len(groups) > 1:
+            with ThreadPoolExecutor(max_workers) as executor:
+                group_results = list(executor.map(SignatureHandler.__verify_group, groups.keys(), groups.values()))
+        else:
+            group_results = [SignatureHandler.__verify_group(public_key, group) for public_key, group in groups.items()]
+        results = [False] * len(items)
+        for group_result in group_results:
+            for index, result in group_result:
+                results[index] = result
+        return results
 
     @staticmethod
     def dsa_der_to_plain(signature):
@@ -284,6 +284,34 @@ class BinaryWriter(StreamManager):
             endian = ">"
         return self.pack('%sQ' % endian, value)
 
+    @staticmethod
+    def pack_var_int(value):
+        """
+        Pack an integer value in the same space saving way as `write_var_int`, without a stream.
+
+        Args:
+            value (int):
+
+        Raises:
+            SDKException: if `value` is not of type int.
+            SDKException: if `value` is < 0.
+
+        Returns:
+            bytes: the packed value.
+        """
+        if not isinstance(value, int):
+            raise SDKException(ErrorCode.param_err('%s not int type.' % value))
+        if value < 0:
+            raise SDKException(ErrorCode.param_err('%d too small.' % value))
+        elif value < 0xfd:
+            return bytes([value])
+        elif value <= 0xffff:
+            return b'\xfd' + struct.pack('<H', value)
+        elif value <= 0xFFFFFFFF:
+            return b'\xfe' + struct.pack('<I', value)
+        else:
+            return b'\xff' + struct.pack('<Q', value)
+
     def write_var_int(self, value, little_endian=True):
         """
         Write an integer value in a space saving way to the stream.
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+
+import aiohttp
+
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+
+
+class AsyncHttpConnectionPool(object):
+    """
+    A keep-alive asyncio HTTP connection pool shared by AsyncRpcClient and AsyncRestfulClient.
+
+    :param pool_maxsize: the maximum number of connections kept by the pool.
+    :param pool_maxsize_per_host: the maximum number of connections for each host, 0 means no limit.
+    :param max_concurrency: the maximum number of in-flight requests.
+    :param connect_timeout: timeout in seconds for establishing a connection.
+    :param read_timeout: timeout in seconds for waiting the response.
+    """
+    _default_pool_lock = threading.Lock()
+
+    def __init__(self, pool_maxsize: int = 100, pool_maxsize_per_host: int = 0, max_concurrency: int = 100,
+                 connect_timeout: float = 10, read_timeout: float = 10):
+        if pool_maxsize <= 0 or max_concurrency <= 0:
+            raise SDKException(ErrorCode.param_err('the size of connection pool should be greater than 0.'))
+        self.__pool_maxsize = pool_maxsize
+        self.__pool_maxsize_per_host = pool_maxsize_per_host
+        self.__max_concurrency = max_concurrency
+        self.__timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+        self.__loop = None
+        self.__session = None
+        self.__semaphore = None
+        self.__in_flight = 0
+
+    @staticmethod
+    def get_default_pool():
+        if not hasattr(AsyncHttpConnectionPool, '_default_pool'):
+            with AsyncHttpConnectionPool._default_pool_lock:
+                if not hasattr(AsyncHttpConnectionPool, '_default_pool'):
+                    AsyncHttpConnectionPool._default_pool = AsyncHttpConnectionPool()
+        return AsyncHttpConnectionPool._default_pool
+
+    def __get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self.__session is None or self.__session.closed or self.__loop is not loop:
+            self.__close_session()
+            connector = aiohttp.TCPConnector(limit=self.__pool_maxsize, limit_per_host=self.__pool_maxsize_per_host)
+            self.__session = aiohttp.ClientSession(connector=connector, timeout=self.__timeout)
+            self.__semaphore = asyncio.Semaphore(self.__max_concurrency)
+            self.__loop = loop
+        return self.__session
+
+    def __close_session(self):
+        """
+        Close the session created on another event loop, whose connections can not be reused on the current one.
+        """
+        session, loop = self.__session, self.__loop
+        self.__session = None
+        self.__loop = None
+        if session is None or session.closed or loop is None:
+            return
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        elif not loop.is_closed():
+            asyncio.ensure_future(session.close(), loop=loop)
+        else:
+            # nothing is left to wait for on a closed loop, so closing the session finishes without suspending.
+            closing = session.close()
+            try:
+                closing.send(None)
+            except StopIteration:
+                pass
+            else:
+                closing.close()
+
+    async def request(self, method: str, url: str, **kwargs) -> tuple:
+        """
+        This interface is used to send a HTTP request through the pool.
+
+        :return: the status code and the utf-8 decoded content of response.
+        """
+        session = self.__get_session()
+        async with self.__semaphore:
+            self.__in_flight += 1
+            try:
+                async with session.request(method, url, **kwargs) as response:
+                    content = await response.read()
+                    return response.status, content.decode('utf-8')
+            finally:
+                self.__in_flight -= 1
+
+    async def post(self, url: str, **kwargs) -> tuple:
+        return await self.request('POST', url, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> tuple:
+        return await self.request('GET', url, **kwargs)
+
+    def get_statistics(self) -> dict:
+        return dict(in_flight=self.__in_flight, max_concurrency=self.__max_concurrency)
+
+    async def close(self):
+        """
+        This interface is used to close the session of pool, which should be awaited before its event loop is closed.
+
+        A session left on a closed event loop is released when the pool is used on a new loop, but the connections of
+        it can not be shut down gracefully any more.
+        """
+        if self.__session is not None and not self.__session.closed:
+            await self.__session.close()
+        self.__session = None
+        self.__loop = None
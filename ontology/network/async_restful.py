@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import asyncio
+import binascii
+
+from time import time
+from typing import List
+
+import aiohttp
+
+from ontology.account.account import Account
+from ontology.smart_contract.neo_vm import NeoVm
+from ontology.core.transaction import Transaction
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+from ontology.network.restful import RestfulMethod, BaseRestfulClient
+from ontology.network.async_connection_pool import AsyncHttpConnectionPool
+from ontology.smart_contract.neo_contract.abi.abi_function import AbiFunction
+from ontology.smart_contract.neo_contract.abi.build_params import BuildParams
+from ontology.smart_contract.neo_contract.invoke_function import InvokeFunction
+
+
+class AsyncRestfulClient(BaseRestfulClient):
+    def __init__(self, url: str = '', pool: AsyncHttpConnectionPool = None):
+        if pool is None:
+            pool = AsyncHttpConnectionPool.get_default_pool()
+        super().__init__(url, pool)
+
+    def set_connection_pool(self, pool: AsyncHttpConnectionPool):
+        if not isinstance(pool, AsyncHttpConnectionPool):
+            raise SDKException(ErrorCode.param_err('a AsyncHttpConnectionPool object is required.'))
+        super().set_connection_pool(pool)
+
+    def get_connection_pool(self) -> AsyncHttpConnectionPool:
+        return super().get_connection_pool()
+
+    async def __request(self, method: str, url: str, **kwargs) -> dict:
+        try:
+            status, content = await self.get_connection_pool().request(method, url, **kwargs)
+        except aiohttp.InvalidURL as e:
+            raise SDKException(ErrorCode.connect_err(''.join(['InvalidURL: ', str(e.args[0])]))) from None
+        except aiohttp.ClientConnectorError:
+            raise SDKException(ErrorCode.other_error(''.join(['ConnectionError: ', url]))) from None
+        except asyncio.TimeoutError:
+            raise SDKException(ErrorCode.other_error(''.join(['ReadTimeout: ', url]))) from None
+        except aiohttp.ClientError:
+            raise SDKException(ErrorCode.other_error(''.join(['ConnectionError: ', url]))) from None
+        except UnicodeDecodeError as e:
+            raise SDKException(ErrorCode.other_error(str(e))) from None
+        return self._decode_response(status, content)
+
+    async def __route(self, method: str, url: str, is_idempotent: bool, **kwargs) -> dict:
+        balancer = self.get_load_balancer()
+        if balancer is None:
+            return await self.__request(method, url, **kwargs)
+        path = self._get_path(url)
+        return await balancer.request_async(lambda endpoint: self.__request(method, endpoint + path, **kwargs),
+                                            is_idempotent)
+
+    async def __post(self, url: str, data: str):
+        return self._check_post_error(await self.__route('POST', url, url.endswith('preExec=1'), data=data))
+
+    async def __get(self, url: str):
+        return self._check_get_error(await self.__route('GET', url, True))
+
+    async def get_version(self, is_full: bool = False):
+        url = RestfulMethod.get_version(self.get_address())
+        response = await self.__get(url)
+        if is_full:
+            return response
+        return response['Result']
+
+    async def get_connection_count(self, is_full: bool = False) -> int:
+        url = RestfulMethod.get_connection_count(self.get_address())
+        response = await self.__get(url)
+        if is_full:
+            return response
+        return response['Result']
+
+    async def get_gas_price(self, is_full: bool = False) -> int or dict:
+        url = RestfulMethod.get_gas_price(self.get_address())
+        response = await self.__get(url)
+        if is_full:
+            return response
+        return response['Result']['gasprice']
+
+    async def get_network_id(self, is_full: bool = False) -> int or dict:
+        url = RestfulMethod.get_network_id(self.get_address())
+        response = await self.__get(url)
+        if is_full:
+            return response
+        return response['Result']
+
+    async def get_block_height(self, is_full: bool = False) -> int or dict:
+        url = RestfulMethod.get_block_height(self.get_address())
+        response = await self.__get(url)
+        if is_full:
+            return response
+        return response['Result']
+
+    async def get_block_height_by_tx_hash(self, tx_hash: str, is_full: bool = False):
+        url = RestfulMethod.get_block_height_by_tx_hash(self.get_address(), tx_hash)
+        response = await self.__get(url)
+        if is_full:
+            return response
+        return response['Result']
+
+    async def get_block_count_by_tx_hash(self, tx_hash: str, is_full: bool = False):
+        response = await self.get_block_height_by_tx_hash(tx_hash, is_full=True)
+        response['Result'] += 1
+        if is_full:
+            return response
+        return response['Result']
+
+    async def get_block_count(self, is_full: bool = False) -> int or dict:
+        response = await self.get_block_height(is_full=True)
+        response['Result'] += 1
+        if is_full:
+            return response
+        return response['Result']
+
+    async def get_block_by_hash(self, block_hash: str, is_full: bool = False) -> int or dict:
+        url = RestfulMethod.get_block_by_hash(self.get_address(), block_hash)
+        response = await self.__get(url)
+        if is_full:
+            return response
+        return response['Result']
+
+    async def get_block_by_height(self, height: int, is_full: bool = False):
+        url = RestfulMethod.get_block_by_height(self.get_address(), height)
+        response = await self.__get(url)
+        if is_full:
+            return response
+        return response['Result']
+
+    async def get_balance(self, b58_address: str, is_full: bool = False):
+        url = RestfulMethod.get_account_balance(self.get_address(), b58_address)
+        response = await self.__get(url)
+        if is_full:
+            return response
+        return response['Result']
+
+    async def get_grant_ong(self, b58_address: str, is_full: bool = False):
+        url = RestfulMethod.get_grant_ong(self.get_address(), b58_address)
+        response = await self.__get(url)
+        if is_full:
+            return response
+        return int(response['Result'])
+
+    async def get_allowance(self, asset: str, b58_from_address: str, b58_to_address: str, is_full: bool = False):
+        url = RestfulMethod.get_allowance(self.get_address(), asset, b58_from_address, b58_to_address)
+        response = await self.__get(url)
+        if is_full:
+            return response
+        return response['Result']
+
+    async def get_smart_contract(self, contract_address: str, is_full: bool = False):
+        url = RestfulMethod.get_smart_contract(self.get_address(), contract_address)
+        response = await self.__get(url)
+        if is_full:
+            return response
+        return response['Result']
+
+    async def get_smart_contract_event_by_height(self, height: int, is_full: bool = False) -> List[dict]:
+        url = RestfulMethod.get_smart_contract_event_by_height(self.get_address(), height)
+        response = await self.__get(url)
+        if is_full:
+            return response
+        result = response['Result']
+        if result == '':
+            result = list()
+        return result
+
+    async def get_smart_contract_event_by_count(self, count: int, is_full: bool = False) -> List[dict]:
+        return await self.get_smart_contract_event_by_height(count - 1, is_full)
+
+    async def get_smart_contract_event_by_tx_hash(self, tx_hash: str, is_full: bool = False):
+        url = RestfulMethod.get_smart_contract_event_by_tx_hash(self.get_address(), tx_hash)
+        response = await self.__get(url)
+        if is_full:
+            return response
+        return response['Result']
+
+    async def get_storage(self, hex_contract_address: str, hex_key: str, is_full: bool = False) -> str or dict:
+        url = RestfulMethod.get_storage(self.get_address(), hex_contract_address, hex_key)
+        response = await self.__get(url)
+        if is_full:
+            return response
+        return response['Result']
+
+    async def get_transaction_by_tx_hash(self, tx_hash: str, is_full: bool = False):
+        url = RestfulMethod.get_transaction(self.get_address(), tx_hash)
+        response = await self.__get(url)
+        if is_full:
+            return response
+        return response['Result']
+
+    async def send_raw_transaction(self, tx: Transaction, is_full: bool = False):
+        hex_tx_data = tx.serialize(is_hex=True).decode('ascii')
+        data = f'{{"Action":"sendrawtransaction", "Version":"1.0.0","Data":"{hex_tx_data}"}}'
+        url = RestfulMethod.send_transaction(self.get_address())
+        response = await self.__post(url, data)
+        if is_full:
+            return response
+        return response['Result']
+
+    async def send_raw_transaction_pre_exec(self, tx: Transaction, is_full: bool = False):
+        hex_tx_data = tx.serialize(is_hex=True).decode('ascii')
+        data = f'{{"Action":"sendrawtransaction", "Version":"1.0.0","Data":"{hex_tx_data}"}}'
+        url = RestfulMethod.send_transaction_pre_exec(self.get_address())
+        response = await self.__post(url, data)
+        if is_full:
+            return response
+        return response['Result']
+
+    async def get_merkle_proof(self, tx_hash: str, is_full: bool = False):
+        url = RestfulMethod.get_merkle_proof(self.get_address(), tx_hash)
+        response = await self.__get(url)
+        if is_full:
+            return response
+        return response['Result']
+
+    async def get_memory_pool_tx_count(self, is_full: bool = False):
+        url = RestfulMethod.get_mem_pool_tx_count(self.get_address())
+        response = await self.__get(url)
+        if is_full:
+            return response
+        return response['Result']
+
+    async def get_memory_pool_tx_state(self, tx_hash: str, is_full: bool = False) -> List[dict] or dict:
+        url = RestfulMethod.get_mem_pool_tx_state(self.get_address(), tx_hash)
+        response = await self.__get(url)
+        if is_full:
+            return response
+        return response['Result']['State']
+
+    async def send_neo_vm_transaction(self, contract_address: str or bytes or bytearray, acct: Account, payer_acct: Account,
+                                gas_limit: int, gas_price: int, func: AbiFunction or InvokeFunction, pre_exec: bool,
+                                is_full: bool = False):
+        if isinstance(func, AbiFunction):
+            params = BuildParams.serialize_abi_function(func)
+        elif isinstance(func, InvokeFunction):
+            params = func.create_invoke_code()
+        else:
+            raise SDKException(ErrorCode.other_error('the type of func is error.'))
+        if isinstance(contract_address, str) and len(contract_address) == 40:
+            contract_address = bytearray(binascii.a2b_hex(contract_address))
+            contract_address.reverse()
+        if pre_exec:
+            if isinstance(contract_address, bytes):
+                tx = NeoVm.make_invoke_transaction(bytearray(contract_address), bytearray(params), b'', 0, 0)
+            elif isinstance(contract_address, bytearray):
+                tx = NeoVm.make_invoke_transaction(contract_address, bytearray(params), b'', 0, 0)
+            else:
+                raise SDKException(ErrorCode.param_err('the data type of contract address is incorrect.'))
+            if acct is not None:
+                tx.sign_transaction(acct)
+            return await self.send_raw_transaction_pre_exec(tx, is_full)
+        else:
+            unix_time_now = int(time())
+            params.append(0x67)
+            for i in contract_address:
+                params.append(i)
+            if payer_acct is None:
+                raise SDKException(ErrorCode.param_err('payer account is None.'))
+            tx = Transaction(0, 0xd1, unix_time_now, gas_price, gas_limit, payer_acct.get_address().to_bytes(),
+                             params, bytearray(), [])
+            tx.sign_transaction(payer_acct)
+            if isinstance(acct, Account) and acct.get_address_base58() != payer_acct.get_address_base58():
+                tx.add_sign_transaction(acct)
+            return await self.send_raw_transaction(tx, is_full)
@@ -0,0 +1,479 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import asyncio
+import binascii
+
+from time import time
+from typing import List
+
+import aiohttp
+
+from ontology.account.account import Account
+from ontology.smart_contract.neo_vm import NeoVm
+from ontology.core.transaction import Transaction
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+from ontology.network.rpc import RpcMethod, BaseRpcClient
+from ontology.network.async_connection_pool import AsyncHttpConnectionPool
+from ontology.smart_contract.neo_contract.abi.abi_function import AbiFunction
+from ontology.smart_contract.neo_contract.abi.build_params import BuildParams
+from ontology.smart_contract.neo_contract.invoke_function import InvokeFunction
+
+
+class AsyncRpcClient(BaseRpcClient):
+    def __init__(self, url: str = '', qid: int = 0, pool: AsyncHttpConnectionPool = None):
+        if pool is None:
+            pool = AsyncHttpConnectionPool.get_default_pool()
+        super().__init__(url, qid, pool)
+
+    def set_connection_pool(self, pool: AsyncHttpConnectionPool):
+        if not isinstance(pool, AsyncHttpConnectionPool):
+            raise SDKException(ErrorCode.param_err('a AsyncHttpConnectionPool object is required.'))
+        super().set_connection_pool(pool)
+
+    def get_connection_pool(self) -> AsyncHttpConnectionPool:
+        return super().get_connection_pool()
+
+    async def __route(self, func, payload):
+        balancer = self.get_load_balancer()
+        if balancer is None:
+            return await func(self.get_address(), payload)
+        return await balancer.request_async(lambda endpoint: func(endpoint, payload), self._is_idempotent(payload))
+
+    async def __post(self, payload):
+        content = await self.__route(self.__post_json, payload)
+        error = self._parse_error(content)
+        if error is not None:
+            raise error
+        return content
+
+    async def __post_immutable(self, payload: dict) -> dict:
+        cache = self.get_response_cache()
+        if cache is None:
+            return await self.__post(payload)
+        key = cache.generate_key(payload['method'], payload['params'])
+        response = cache.get(key)
+        if response is not None:
+            return response
+        response = await self.__post(payload)
+        if response.get('result') not in (None, '', dict(), list()):
+            cache.put(key, response)
+        return response
+
+    async def __post_json(self, url, payload: dict or list) -> dict or list:
+        status, content = await self.__send_post(url, payload)
+        return self._decode_response(status, content)
+
+    async def __send_post(self, url, payload: dict or list) -> tuple:
+        header = {'Content-type': 'application/json'}
+        try:
+            return await self.get_connection_pool().post(url, json=payload, headers=header)
+        except aiohttp.InvalidURL as e:
+            raise SDKException(ErrorCode.connect_err(''.join(['InvalidURL: ', str(e.args[0])]))) from None
+        except aiohttp.ClientConnectorError:
+            raise SDKException(ErrorCode.other_error(''.join(['ConnectionError: ', url]))) from None
+        except asyncio.TimeoutError:
+            raise SDKException(ErrorCode.other_error(''.join(['ReadTimeout: ', url]))) from None
+        except aiohttp.ClientError:
+            raise SDKException(ErrorCode.other_error(''.join(['ConnectionError: ', url]))) from None
+        except UnicodeDecodeError as e:
+            raise SDKException(ErrorCode.other_error(str(e))) from None
+
+    async def send_batch(self, calls: List[tuple], is_full: bool = False) -> list:
+        """
+        This interface is used to send many RPC calls in one JSON-RPC 2.0 batch request.
+
+        :param calls: a list of (method, params) tuples, e.g. [(RpcMethod.GET_BALANCE, [b58_address, 1])].
+        :param is_full: Whether to return all information.
+        :return: a list which is in the same order of calls. Each item is the result of the call,
+                 or a SDKException object if the call failed.
+        """
+        if len(calls) == 0:
+            return list()
+        batch_payload = self.generate_json_rpc_batch_payload(calls)
+        response_map = None
+        if self._is_batch_supported():
+            response_map = self._parse_batch_response(*await self.__route(self.__send_post, batch_payload))
+        if response_map is None:
+            response_map = await self.__post_each(batch_payload)
+        return self._parse_batch_result(batch_payload, response_map, is_full)
+
+    async def __post_each(self, batch_payload: List[dict]) -> dict:
+        """
+        Fall back to concurrent requests over the connection pool for nodes without batch support.
+        """
+        tasks = [self.__route(self.__post_json, payload) for payload in batch_payload]
+        content = await asyncio.gather(*tasks, return_exceptions=True)
+        response_map = dict()
+        for payload, response in zip(batch_payload, content):
+            if isinstance(response, Exception) and not isinstance(response, SDKException):
+                raise response
+            response_map[payload['id']] = response
+        return response_map
+
+    async def get_version(self, is_full: bool = False) -> dict or str:
+        """
+        This interface is used to get the version information of the connected node in current network.
+
+        Return:
+            the version information of the connected node.
+        """
+        payload = self.generate_json_rpc_payload(RpcMethod.GET_VERSION)
+        response = await self.__post(payload)
+        if is_full:
+            return response
+        return response['result']
+
+    async def get_connection_count(self, is_full: bool = False) -> int:
+        """
+        This interface is used to get the current number of connections for the node in current network.
+
+        Return:
+            the number of connections.
+        """
+        payload = self.generate_json_rpc_payload(RpcMethod.GET_NODE_COUNT)
+        response = await self.__post(payload)
+        if is_full:
+            return response
+        return response['result']
+
+    async def get_gas_price(self, is_full: bool = False) -> int or dict:
+        """
+        This interface is used to get the gas price in current network.
+
+        Return:
+            the value of gas price.
+        """
+        payload = self.generate_json_rpc_payload(RpcMethod.GET_GAS_PRICE)
+        if is_full:
+            return await self.__post(payload)
+        query_cache = self.get_query_cache()
+        if query_cache is None:
+            return (await self.__post(payload))['result']['gasprice']
+
+        async def query():
+            return (await self.__post(payload))['result']['gasprice']
+
+        return await query_cache.get_or_query_async((self.get_address(), RpcMethod.GET_GAS_PRICE), query)
+
+    async def get_network_id(self, is_full: bool = False) -> int:
+        """
+        This interface is used to get the network id of current network.
+
+        Return:
+            the network id of current network.
+        """
+
+        payload = self.generate_json_rpc_payload(RpcMethod.GET_NETWORK_ID)
+        response = await self.__post(payload)
+        if is_full:
+            return response
+        return response['result']
+
+    async def get_block_by_hash(self, block_hash: str, is_full: bool = False) -> dict:
+        """
+        This interface is used to get the hexadecimal hash value of specified block height in current network.
+
+        :param block_hash: a hexadecimal value of block hash.
+        :param is_full:
+        :return: the block information of the specified block hash.
+        """
+        payload = self.generate_json_rpc_payload(RpcMethod.GET_BLOCK, [block_hash, 1])
+        response = await self.__post_immutable(payload)
+        if is_full:
+            return response
+        return response['result']
+
+    async def get_block_by_height(self, height: int, is_full: bool = False) -> dict:
+        """
+        This interface is used to get the block information by block height in current network.
+
+        Return:
+            the decimal total number of blocks in current network.
+        """
+        payload = self.generate_json_rpc_payload(RpcMethod.GET_BLOCK, [height, 1])
+        response = await self.__post_immutable(payload)
+        if is_full:
+            return response
+        return response['result']
+
+    async def get_block_count(self, is_full: bool = False) -> int or dict:
+        """
+        This interface is used to get the decimal block number in current network.
+
+        Return:
+            the decimal total number of blocks in current network.
+        """
+        payload = self.generate_json_rpc_payload(RpcMethod.GET_BLOCK_COUNT)
+        response = await self.__post(payload)
+        if is_full:
+            return response
+        return response['result']
+
+    async def get_block_height(self, is_full: bool = False) -> int or dict:
+        """
+        This interface is used to get the decimal block height in current network.
+
+        Return:
+            the decimal total height of blocks in current network.
+        """
+        response = await self.get_block_count(is_full=True)
+        response['result'] -= 1
+        if is_full:
+            return response
+        return response['result']
+
+    async def get_block_height_by_tx_hash(self, tx_hash: str, is_full: bool = False):
+        payload = self.generate_json_rpc_payload(RpcMethod.GET_BLOCK_HEIGHT_BY_HASH, [tx_hash])
+        response = await self.__post(payload)
+        if is_full:
+            return response
+        return response['result']
+
+    async def get_block_count_by_tx_hash(self, tx_hash: str, is_full: bool = False):
+        response = await self.get_block_height_by_tx_hash(tx_hash, is_full=True)
+        response['result'] += 1
+        if is_full:
+            return response
+        return response['result']
+
+    async def get_current_block_hash(self, is_full: bool = False) -> str:
+        """
+        This interface is used to get the hexadecimal hash value of the highest block in current network.
+
+        Return:
+            the hexadecimal hash value of the highest block in current network.
+        """
+        payload = self.generate_json_rpc_payload(RpcMethod.GET_CURRENT_BLOCK_HASH)
+        response = await self.__post(payload)
+        if is_full:
+            return response
+        return response['result']
+
+    async def get_block_hash_by_height(self, height: int, is_full: bool = False) -> str:
+        """
+        This interface is used to get the hexadecimal hash value of specified block height in current network.
+
+        :param height: a decimal block height value.
+        :param is_full:
+        :return: the hexadecimal hash value of the specified block height.
+        """
+        payload = self.generate_json_rpc_payload(RpcMethod.GET_BLOCK_HASH, [height, 1])
+        response = await self.__post_immutable(payload)
+        if is_full:
+            return response
+        return response['result']
+
+    async def get_balance(self, b58_address: str, is_full: bool = False) -> dict:
+        """
+        This interface is used to get the account balance of specified base58 encoded address in current network.
+
+        :param b58_address: a base58 encoded account address.
+        :param is_full:
+        :return: the value of account balance in dictionary form.
+        """
+        payload = self.generate_json_rpc_payload(RpcMethod.GET_BALANCE, [b58_address, 1])
+        response = await self.__post(payload)
+        if is_full:
+            return response
+        return response['result']
+
+    async def get_grant_ong(self, b58_address: str, is_full: bool = False):
+        payload = self.generate_json_rpc_payload(RpcMethod.GET_GRANT_ONG, [b58_address])
+        response = await self.__post(payload)
+        if is_full:
+            return response
+        return int(response['result'])
+
+    async def get_allowance(self, asset_name: str, from_address: str, to_address: str, is_full: bool = False) -> str:
+        """
+        This interface is used to get the the allowance
+        from transfer-from account to transfer-to account in current network.
+
+        :param asset_name:
+        :param from_address: a base58 encoded account address.
+        :param to_address: a base58 encoded account address.
+        :param is_full:
+        :return: the information of allowance in dictionary form.
+        """
+        payload = self.generate_json_rpc_payload(RpcMethod.GET_ALLOWANCE, [asset_name, from_address, to_address])
+        response = await self.__post(payload)
+        if is_full:
+            return response
+        return response['result']
+
+    async def get_storage(self, hex_contract_address: str, hex_key: str, is_full: bool = False) -> str:
+        """
+        This interface is used to get the corresponding stored value
+        based on hexadecimal contract address and stored key.
+
+        :param hex_contract_address: hexadecimal contract address.
+        :param hex_key: a hexadecimal stored key.
+        :param is_full:
+        :return: the information of contract storage.
+        """
+        payload = self.generate_json_rpc_payload(RpcMethod.GET_STORAGE, [hex_contract_address, hex_key, 1])
+        response = await self.__post(payload)
+        if is_full:
+            return response
+        return response['result']
+
+    async def get_smart_contract_event_by_tx_hash(self, tx_hash: str, is_full: bool = False) -> dict:
+        """
+        This interface is used to get the corresponding smart contract event based on the height of block.
+
+        :param tx_hash: a hexadecimal hash value.
+        :param is_full:
+        :return: the information of smart contract event in dictionary form.
+        """
+        payload = self.generate_json_rpc_payload(RpcMethod.GET_SMART_CONTRACT_EVENT, [tx_hash, 1])
+        response = await self.__post(payload)
+        if is_full:
+            return response
+        return response['result']
+
+    async def get_smart_contract_event_by_height(self, height: int, is_full: bool = False) -> List[dict]:
+        """
+        This interface is used to get the corresponding smart contract event based on the height of block.
+
+        :param height: a decimal height value.
+        :param is_full:
+        :return: the information of smart contract event in dictionary form.
+        """
+        payload = self.generate_json_rpc_payload(RpcMethod.GET_SMART_CONTRACT_EVENT, [height, 1])
+        response = await self.__post(payload)
+        if is_full:
+            return response
+        event_list = response['result']
+        if event_list is None:
+            event_list = list()
+        return event_list
+
+    async def get_smart_contract_event_by_count(self, count: int, is_full: bool = False) -> List[dict]:
+        return await self.get_smart_contract_event_by_height(count - 1, is_full)
+
+    async def get_transaction_by_tx_hash(self, tx_hash: str, is_full: bool = False) -> dict:
+        """
+        This interface is used to get the corresponding transaction information based on the specified hash value.
+
+        :param tx_hash: str, a hexadecimal hash value.
+        :param is_full:
+        :return: dict
+        """
+        payload = self.generate_json_rpc_payload(RpcMethod.GET_TRANSACTION, [tx_hash, 1])
+        response = await self.__post_immutable(payload)
+        if is_full:
+            return response
+        return response['result']
+
+    async def get_smart_contract(self, hex_contract_address: str, is_full: bool = False) -> dict:
+        """
+        This interface is used to get the information of smart contract based on the specified hexadecimal hash value.
+
+        :param hex_contract_address: str, a hexadecimal hash value.
+        :param is_full:
+        :return: the information of smart contract in dictionary form.
+        """
+        if not isinstance(hex_contract_address, str):
+            raise SDKException(ErrorCode.param_err('a hexadecimal contract address is required.'))
+        if len(hex_contract_address) != 40:
+            raise SDKException(ErrorCode.param_err('the length of the contract address should be 40 bytes.'))
+        payload = self.generate_json_rpc_payload(RpcMethod.GET_SMART_CONTRACT, [hex_contract_address, 1])
+        response = await self.__post_immutable(payload)
+        if is_full:
+            return response
+        return response['result']
+
+    async def get_merkle_proof(self, tx_hash: str, is_full: bool = False) -> dict:
+        """
+        This interface is used to get the corresponding merkle proof based on the specified hexadecimal hash value.
+
+        :param tx_hash: an hexadecimal transaction hash value.
+        :param is_full:
+        :return: the merkle proof in dictionary form.
+        """
+        payload = self.generate_json_rpc_payload(RpcMethod.GET_MERKLE_PROOF, [tx_hash, 1])
+        response = await self.__post_immutable(payload)
+        if is_full:
+            return response
+        return response['result']
+
+    async def get_memory_pool_tx_count(self, is_full: bool = False):
+        payload = self.generate_json_rpc_payload(RpcMethod.GET_MEM_POOL_TX_COUNT)
+        response = await self.__post(payload)
+        if is_full:
+            return response
+        return response['result']
+
+    async def get_memory_pool_tx_state(self, tx_hash: str, is_full: bool = False):
+        payload = self.generate_json_rpc_payload(RpcMethod.GET_MEM_POOL_TX_STATE, [tx_hash])
+        response = await self.__post(payload)
+        if is_full:
+            return response
+        return response['result']['State']
+
+    async def send_raw_transaction(self, tx: Transaction, is_full: bool = False) -> str:
+        """
+        This interface is used to send the transaction into the network.
+        :param tx: Transaction object in ontology Python SDK.
+        :param is_full:
+        :return: a hexadecimal transaction hash value.
+        """
+        tx_data = tx.serialize(is_hex=True).decode('ascii')
+        payload = self.generate_json_rpc_payload(RpcMethod.SEND_TRANSACTION, [tx_data])
+        response = await self.__post(payload)
+        if is_full:
+            return response
+        return response['result']
+
+    async def send_raw_transaction_pre_exec(self, tx: Transaction, is_full: bool = False):
+        """
+        This interface is used to send the transaction that is prepare to execute.
+
+        :param tx: Transaction object in ontology Python SDK.
+        :param is_full: Whether to return all information.
+        :return: the execution result of transaction that is prepare to execute.
+        """
+        tx_data = tx.serialize(is_hex=True).decode('ascii')
+        payload = self.generate_json_rpc_payload(RpcMethod.SEND_TRANSACTION, [tx_data, 1])
+        response = await self.__post(payload)
+        if is_full:
+            return response
+        return response['result']
+
+    async def send_neo_vm_transaction(self, contract_address: str or bytes or bytearray, acct: Account or None,
+                                payer_acct: Account or None, gas_limit: int, gas_price: int,
+                                func: AbiFunction or InvokeFunction, pre_exec: bool, is_full: bool = False):
+        if isinstance(func, AbiFunction):
+            params = BuildParams.serialize_abi_function(func)
+        elif isinstance(func, InvokeFunction):
+            params = func.create_invoke_code()
+        else:
+            raise SDKException(ErrorCode.other_error('the type of func is error.'))
+        if isinstance(contract_address, str) and len(contract_address) == 40:
+            contract_address = bytearray(binascii.a2b_hex(contract_address))
+            contract_address.reverse()
+        if pre_exec:
+            if isinstance(contract_address, bytes):
+                tx = NeoVm.make_invoke_transaction(bytearray(contract_address), bytearray(params), b'', 0, 0)
+            elif isinstance(contract_address, bytearray):
+                tx = NeoVm.make_invoke_transaction(contract_address, bytearray(params), b'', 0, 0)
+            else:
+                raise SDKException(ErrorCode.param_err('the data type of contract address is incorrect.'))
+            if acct is not None:
+                tx.sign_transaction(acct)
+            return await self.send_raw_transaction_pre_exec(tx, is_full)
+        else:
+            unix_time_now = int(time())
+            params.append(0x67)
+            for i in contract_address:
+                params.append(i)
+            if payer_acct is None:
+                raise SDKException(ErrorCode.param_err('payer account is None.'))
+            tx = Transaction(0, 0xd1, unix_time_now, gas_price, gas_limit, payer_acct.get_address().to_bytes(),
+                             params, bytearray(), [])
+            tx.sign_transaction(payer_acct)
+            if isinstance(acct, Account) and acct.get_address_base58() != payer_acct.get_address_base58():
+                tx.add_sign_transaction(acct)
+            return await self.send_raw_transaction(tx, is_full)
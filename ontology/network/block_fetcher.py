@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import asyncio
+import inspect
+
+from concurrent.futures import ThreadPoolExecutor
+
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+
+
+class BlockRangeFetcher(object):
+    """
+    Fetch the blocks or smart contract events of a height range with bounded concurrency.
+
+    The requests of the next max_concurrency heights are kept in flight, and the results are yielded in height order.
+    The next height to be yielded is recorded as checkpoint, which is saved into checkpoint_path if given,
+    so that a fetching interrupted by failure can be resumed from the checkpoint.
+
+    :param client: an AsyncRpcClient, AsyncRestfulClient, multiplexed WebsocketClient, RpcClient or RestfulClient.
+    :param max_concurrency: the maximum number of in-flight requests.
+    :param max_retries: the number of retries for each height.
+    :param retry_delay: the delay in seconds before the first retry, which is doubled for every retry.
+    :param checkpoint_path: the file to save checkpoint.
+    :param checkpoint_interval: save checkpoint every checkpoint_interval heights.
+    """
+
+    def __init__(self, client, max_concurrency: int = 16, max_retries: int = 3, retry_delay: float = 1,
+                 checkpoint_path: str = '', checkpoint_interval: int = 100):
+        if max_concurrency <= 0:
+            raise SDKException(ErrorCode.param_err('the max concurrency should be greater than 0.'))
+        self.__client = client
+        self.__max_concurrency = max_concurrency
+        self.__max_retries = max_retries
+        self.__retry_delay = retry_delay
+        self.__checkpoint_path = checkpoint_path
+        self.__checkpoint_interval = max(1, checkpoint_interval)
+        self.__checkpoint = None
+        self.__executor = None
+
+    @property
+    def checkpoint(self) -> int or None:
+        """
+        The next height to be yielded.
+        """
+        return self.__checkpoint
+
+    def load_checkpoint(self) -> int or None:
+        if len(self.__checkpoint_path) == 0 or not os.path.isfile(self.__checkpoint_path):
+            return None
+        with open(self.__checkpoint_path, 'r') as f:
+            content = f.read().strip()
+        try:
+            return int(content)
+        except ValueError:
+            raise SDKException(ErrorCode.other_error(f'invalid checkpoint: {content}'))
+
+    def save_checkpoint(self):
+        if len(self.__checkpoint_path) == 0 or self.__checkpoint is None:
+            return
+        temp_path = self.__checkpoint_path + '.tmp'
+        with open(temp_path, 'w') as f:
+            f.write(str(self.__checkpoint))
+        os.replace(temp_path, self.__checkpoint_path)
+
+    def clear_checkpoint(self):
+        self.__checkpoint = None
+        if len(self.__checkpoint_path) != 0 and os.path.isfile(self.__checkpoint_path):
+            os.remove(self.__checkpoint_path)
+
+    async def __call(self, func, height: int):
+        if inspect.iscoroutinefunction(func):
+            return await func(height)
+        if self.__executor is None:
+            self.__executor = ThreadPoolExecutor(self.__max_concurrency)
+        return await asyncio.get_running_loop().run_in_executor(self.__executor, func, height)
+
+    async def __fetch(self, func, height: int):
+        delay = self.__retry_delay
+        for attempt in range(self.__max_retries + 1):
+            try:
+                return await self.__call(func, height)
+            except SDKException:
+                if attempt == self.__max_retries:
+                    raise
+            await asyncio.sleep(delay)
+            delay *= 2
+
+    async def __fetch_range(self, func, start: int, end: int, is_resumed: bool):
+        if start > end:
+            raise SDKException(ErrorCode.param_err('the start height should not be greater than the end height.'))
+        if is_resumed:
+            checkpoint = self.load_checkpoint()
+            if checkpoint is not None and start <= checkpoint <= end + 1:
+                start = checkpoint
+        self.__checkpoint = start
+        tasks = dict()
+        next_height = start
+        try:
+            for height in range(start, end + 1):
+                while next_height <= end and next_height < height + self.__max_concurrency:
+                    tasks[next_height] = asyncio.ensure_future(self.__fetch(func, next_height))
+                    next_height += 1
+                result = await tasks.pop(height)
+                yield height, result
+                self.__checkpoint = height + 1
+                if (height + 1 - start) % self.__checkpoint_interval == 0:
+                    self.save_checkpoint()
+        finally:
+            for task in tasks.values():
+                task.cancel()
+            self.save_checkpoint()
+
+    def fetch_blocks(self, start: int, end: int, is_resumed: bool = True):
+        """
+        This interface is used to fetch the blocks from start height to end height (inclusive).
+
+        :param start: the first height to fetch.
+        :param end: the last height to fetch.
+        :param is_resumed: whether to start from the saved checkpoint if it is in range.
+        :return: an asynchronous generator of height and block in dictionary form.
+        """
+        return self.__fetch_range(self.__client.get_block_by_height, start, end, is_resumed)
+
+    def fetch_events(self, start: int, end: int, is_resumed: bool = True):
+        """
+        This interface is used to fetch the smart contract events from start height to end height (inclusive).
+
+        :param start: the first height to fetch.
+        :param end: the last height to fetch.
+        :param is_resumed: whether to start from the saved checkpoint if it is in range.
+        :return: an asynchronous generator of height and the list of smart contract event.
+        """
+        return self.__fetch_range(self.__client.get_smart_contract_event_by_height, start, end, is_resumed)
+
+    def close(self):
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False)
+            self.__executor = None
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import threading
+
+import requests
+
+from requests.adapters import HTTPAdapter
+
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+
+
+class HttpConnectionPool(object):
+    """
+    A keep-alive HTTP session pool shared by RpcClient and RestfulClient.
+
+    :param pool_connections: the number of per-host connection pools to cache.
+    :param pool_maxsize: the maximum number of connections kept alive for each host.
+    :param pool_block: whether to block when no free connection is available for a host instead of opening a new one.
+    :param connect_timeout: timeout in seconds for establishing a connection.
+    :param read_timeout: timeout in seconds for waiting the response.
+    """
+    _default_pool_lock = threading.Lock()
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False,
+                 connect_timeout: float = 10, read_timeout: float = 10):
+        if pool_connections <= 0 or pool_maxsize <= 0:
+            raise SDKException(ErrorCode.param_err('the size of connection pool should be greater than 0.'))
+        self.__pool_connections = pool_connections
+        self.__pool_maxsize = pool_maxsize
+        self.__pool_block = pool_block
+        self.__timeout = (connect_timeout, read_timeout)
+        self.__lock = threading.Lock()
+        self.__in_flight = 0
+        self.__session = None
+        self.__adapter = None
+        self.__new_session()
+
+    @staticmethod
+    def get_default_pool():
+        if not hasattr(HttpConnectionPool, '_default_pool'):
+            with HttpConnectionPool._default_pool_lock:
+                if not hasattr(HttpConnectionPool, '_default_pool'):
+                    HttpConnectionPool._default_pool = HttpConnectionPool()
+        return HttpConnectionPool._default_pool
+
+    def __new_session(self):
+        self.__adapter = HTTPAdapter(pool_connections=self.__pool_connections, pool_maxsize=self.__pool_maxsize,
+                                     pool_block=self.__pool_block)
+        self.__session = requests.Session()
+        self.__session.mount('http://', self.__adapter)
+        self.__session.mount('https://', self.__adapter)
+
+    @property
+    def timeout(self) -> tuple:
+        return self.__timeout
+
+    def set_timeout(self, connect_timeout: float, read_timeout: float):
+        self.__timeout = (connect_timeout, read_timeout)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault('timeout', self.__timeout)
+        with self.__lock:
+            self.__in_flight += 1
+        try:
+            return self.__session.request(method, url, **kwargs)
+        finally:
+            with self.__lock:
+                self.__in_flight -= 1
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def get_statistics(self) -> dict:
+        """
+        This interface is used to get the statistics of connection pool.
+
+        :return: the number of requests served by a kept-alive connection (hits),
+                 the number of opened connections and the number of in-flight requests.
+        """
+        num_requests = 0
+        num_connections = 0
+        pools = self.__adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            num_requests += pool.num_requests
+            num_connections += pool.num_connections
+        with self.__lock:
+            in_flight = self.__in_flight
+        return dict(hits=max(num_requests - num_connections, 0), new_connections=num_connections,
+                    in_flight=in_flight)
+
+    def close(self):
+        self.__session.close()
+        self.__new_session()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+from collections import OrderedDict
+from typing import List, Callable
+
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+from ontology.network.websocket_pool import WebsocketPool
+from ontology.utils.contract_data_parser import ContractDataParser
+from ontology.network.websocket import WebsocketClient, BackpressurePolicy
+
+
+class ContractEventStream(object):
+    """
+    An asynchronous iterator over the contract notifications pushed by websocket subscription.
+
+    Each notify of a smart contract event is yielded as a dict with the keys of TxHash, State, ContractAddress,
+    EventName and States. The notifications are filtered and decoded in a background task, and buffered in
+    a bounded queue which is handled by the backpressure policy when it is full:
+        BLOCK: stop reading from websocket until the consumer catches up. A multiplexed connection is only paused
+            while no request is pending on it, see WebsocketClient.set_subscribe_buffer().
+        DROP_OLDEST: discard the oldest notify in queue.
+        COALESCE: replace the queued notify which has the same coalesce key, otherwise discard the oldest one.
+            The connection buffer is then bounded with BLOCK, so no notification is discarded before coalescing.
+
+    :param source: a WebsocketClient or a WebsocketPool.
+    :param hex_contract_address_list: the contracts to subscribe.
+    :param event_names: only the notify of these event names is yielded if given.
+    :param max_size: the maximum number of notify in queue.
+    :param policy: the backpressure policy.
+    :param is_oep4_transfer: decode the transfer notify into event name, b58 address and amount.
+    :param coalesce_key: a function which returns the coalesce key of notify, ContractAddress and EventName by default.
+    """
+
+    def __init__(self, source, hex_contract_address_list: List[str] or str, event_names: List[str] = None,
+                 max_size: int = 1024, policy: BackpressurePolicy = BackpressurePolicy.BLOCK,
+                 is_oep4_transfer: bool = False, coalesce_key: Callable[[dict], object] = None):
+        if max_size <= 0:
+            raise SDKException(ErrorCode.param_err('the size of event queue should be greater than 0.'))
+        if not isinstance(policy, BackpressurePolicy):
+            raise SDKException(ErrorCode.param_err('a BackpressurePolicy object is required.'))
+        if isinstance(hex_contract_address_list, str):
+            hex_contract_address_list = [hex_contract_address_list]
+        if isinstance(event_names, str):
+            event_names = [event_names]
+        if coalesce_key is None:
+            coalesce_key = ContractEventStream.__default_coalesce_key
+        self.__source = source
+        self.__contract_address_list = hex_contract_address_list
+        self.__event_names = None if event_names is None else set(event_names)
+        self.__max_size = max_size
+        self.__policy = policy
+        self.__is_oep4_transfer = is_oep4_transfer
+        self.__coalesce_key = coalesce_key
+        self.__buffer = OrderedDict()
+        self.__sequence = 0
+        self.__not_empty = None
+        self.__not_full = None
+        self.__pump_task = None
+        self.__error = None
+        self.__is_closed = False
+        self.__received = 0
+        self.__delivered = 0
+        self.__dropped = 0
+        self.__coalesced = 0
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> dict:
+        if self.__pump_task is None and not self.__is_closed:
+            await self.start()
+        while len(self.__buffer) == 0:
+            if self.__error is not None:
+                raise self.__error
+            if self.__is_closed:
+                raise StopAsyncIteration
+            self.__not_empty.clear()
+            await self.__not_empty.wait()
+        _, event = self.__buffer.popitem(last=False)
+        self.__delivered += 1
+        self.__not_full.set()
+        return event
+
+    async def start(self):
+        """
+        This interface is used to subscribe the contract events and start receiving the notifications.
+        """
+        if self.__pump_task is not None:
+            return
+        self.__not_empty = asyncio.Event()
+        self.__not_full = asyncio.Event()
+        if isinstance(self.__source, (WebsocketClient, WebsocketPool)):
+            policy = self.__policy
+            if policy == BackpressurePolicy.COALESCE:
+                policy = BackpressurePolicy.BLOCK
+            self.__source.set_subscribe_buffer(self.__max_size, policy)
+        await self.__source.subscribe(self.__contract_address_list, is_event=True)
+        self.__pump_task = asyncio.ensure_future(self.__pump())
+
+    async def close(self):
+        """
+        This interface is used to stop receiving the notifications, the queued notifications can still be iterated.
+        """
+        self.__is_closed = True
+        if self.__pump_task is not None:
+            self.__pump_task.cancel()
+            try:
+                await self.__pump_task
+            except asyncio.CancelledError:
+                pass
+        if self.__not_empty is not None:
+            self.__not_empty.set()
+
+    def get_statistics(self) -> dict:
+        return dict(received=self.__received, delivered=self.__delivered, dropped=self.__dropped,
+                    coalesced=self.__coalesced, pending=len(self.__buffer))
+
+    @staticmethod
+    def __default_coalesce_key(event: dict):
+        return event['ContractAddress'], event['EventName']
+
+    @staticmethod
+    def __get_event_name(states) -> str:
+        if isinstance(states, list):
+            if len(states) == 0:
+                return ''
+            states = states[0]
+        if not isinstance(states, str):
+            return ''
+        try:
+            return ContractDataParser.to_utf8_str(states)
+        except (SDKException, ValueError):
+            return states
+
+    def __decode(self, tx_hash: str, state: int, notify: dict) -> dict or None:
+        contract_address = notify.get('ContractAddress', '')
+        if len(self.__contract_address_list) != 0 and contract_address not in self.__contract_address_list:
+            return None
+        states = notify.get('States', list())
+        event_name = self.__get_event_name(states)
+        if self.__event_names is not None and event_name not in self.__event_names:
+            return None
+        if isinstance(states, list):
+            states = list(states)
+        event = dict(TxHash=tx_hash, State=state, ContractAddress=contract_address, EventName=event_name,
+                     States=states)
+        if self.__is_oep4_transfer and event_name == 'transfer' and isinstance(states, list) and len(states) == 4:
+            try:
+                ContractDataParser.parser_oep4_transfer_notify(event)
+            except (SDKException, ValueError):
+                event['States'] = list(notify['States'])
+        return event
+
+    async def __put(self, event: dict):
+        self.__received += 1
+        if self.__policy == BackpressurePolicy.COALESCE:
+            key = self.__coalesce_key(event)
+            if key in self.__buffer:
+                self.__buffer[key] = event
+                self.__coalesced += 1
+                return
+        else:
+            key = self.__sequence
+            self.__sequence += 1
+        if len(self.__buffer) >= self.__max_size:
+            if self.__policy == BackpressurePolicy.BLOCK:
+                while len(self.__buffer) >= self.__max_size:
+                    self.__not_full.clear()
+                    await self.__not_full.wait()
+            else:
+                self.__buffer.popitem(last=False)
+                self.__dropped += 1
+        self.__buffer[key] = event
+        self.__not_empty.set()
+
+    async def __pump(self):
+        try:
+            while True:
+                response = await self.__source.recv_subscribe_info(is_full=True)
+                if response.get('Error', 0) != 0:
+                    continue
+                result = response.get('Result')
+                if not isinstance(result, dict) or not isinstance(result.get('Notify'), list):
+                    continue
+                for notify in result['Notify']:
+                    event = self.__decode(result.get('TxHash', ''), result.get('State', 0), notify)
+                    if event is not None:
+                        await self.__put(event)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.__error = e
+            self.__not_empty.set()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import threading
+
+from enum import Enum, unique
+from time import perf_counter, monotonic
+from typing import List, Callable, Awaitable
+
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+
+
+@unique
+class BalanceStrategy(Enum):
+    EWMA = 'ewma'
+    ROUND_ROBIN = 'round_robin'
+
+
+class Endpoint(object):
+    def __init__(self, url: str):
+        self.url = url
+        self.latency = None
+        self.failures = 0
+        self.open_until = 0.0
+        self.requests = 0
+
+    def __iter__(self):
+        data = dict()
+        data['url'] = self.url
+        data['latency'] = self.latency
+        data['failures'] = self.failures
+        data['isHealthy'] = self.is_healthy()
+        data['requests'] = self.requests
+        for key, value in data.items():
+            yield (key, value)
+
+    def is_healthy(self, now: float = None) -> bool:
+        if now is None:
+            now = monotonic()
+        return self.open_until <= now
+
+
+class LoadBalancer(object):
+    """
+    Route requests over a list of node endpoints.
+
+    :param urls: a list of node endpoint.
+    :param strategy: select the endpoint with the lowest EWMA latency, or by round-robin.
+    :param alpha: the weight of the newest latency sample in EWMA.
+    :param failure_threshold: the number of consecutive failures to eject an endpoint.
+    :param recovery_timeout: seconds before an ejected endpoint is probed again.
+    :param max_retries: the number of other endpoints to retry an idempotent request on.
+    :param failure_penalty: the latency in seconds which is recorded at least for a failed request.
+    """
+
+    def __init__(self, urls: List[str], strategy: BalanceStrategy = BalanceStrategy.EWMA, alpha: float = 0.3,
+                 failure_threshold: int = 3, recovery_timeout: float = 30, max_retries: int = 2,
+                 failure_penalty: float = 10):
+        if isinstance(urls, str):
+            urls = [urls]
+        if len(urls) == 0:
+            raise SDKException(ErrorCode.param_err('at least one endpoint is required.'))
+        if not isinstance(strategy, BalanceStrategy):
+            raise SDKException(ErrorCode.param_err('a BalanceStrategy object is required.'))
+        if not 0 < alpha <= 1:
+            raise SDKException(ErrorCode.param_err('alpha should be in (0, 1].'))
+        self.__endpoints = [Endpoint(url) for url in urls]
+        self.__strategy = strategy
+        self.__alpha = alpha
+        self.__failure_threshold = failure_threshold
+        self.__recovery_timeout = recovery_timeout
+        self.__max_retries = max_retries
+        self.__failure_penalty = failure_penalty
+        self.__cursor = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def urls(self) -> List[str]:
+        return [endpoint.url for endpoint in self.__endpoints]
+
+    @property
+    def max_retries(self) -> int:
+        return self.__max_retries
+
+    def __find(self, url: str) -> Endpoint or None:
+        for endpoint in self.__endpoints:
+            if endpoint.url == url:
+                return endpoint
+        return None
+
+    def select(self, excluded: List[str] = None) -> str:
+        """
+        This interface is used to select an endpoint for the next request.
+        Ejected endpoints are skipped until their recovery timeout has passed,
+        and if every endpoint is ejected, the one which recovers first is selected.
+
+        :param excluded: a list of endpoint which should not be selected, e.g. the endpoints already failed.
+        :return: the url of selected endpoint.
+        """
+        if excluded is None:
+            excluded = list()
+        now = monotonic()
+        with self.__lock:
+            candidates = [endpoint for endpoint in self.__endpoints if endpoint.url not in excluded]
+            if len(candidates) == 0:
+                candidates = self.__endpoints
+            healthy = [endpoint for endpoint in candidates if endpoint.is_healthy(now)]
+            if len(healthy) == 0:
+                return min(candidates, key=lambda e: e.open_until).url
+            if self.__strategy == BalanceStrategy.ROUND_ROBIN:
+                endpoint = healthy[self.__cursor % len(healthy)]
+                self.__cursor += 1
+                return endpoint.url
+            unmeasured = [endpoint for endpoint in healthy if endpoint.latency is None]
+            if len(unmeasured) != 0:
+                return unmeasured[0].url
+            return min(healthy, key=lambda e: e.latency).url
+
+    def __update_latency(self, endpoint: Endpoint, latency: float):
+        if endpoint.latency is None:
+            endpoint.latency = latency
+        else:
+            endpoint.latency = self.__alpha * latency + (1 - self.__alpha) * endpoint.latency
+
+    def record_success(self, url: str, latency: float):
+        with self.__lock:
+            endpoint = self.__find(url)
+            if endpoint is None:
+                return
+            endpoint.requests += 1
+            endpoint.failures = 0
+            endpoint.open_until = 0.0
+            self.__update_latency(endpoint, latency)
+
+    def record_failure(self, url: str, latency: float):
+        with self.__lock:
+            endpoint = self.__find(url)
+            if endpoint is None:
+                return
+            endpoint.requests += 1
+            endpoint.failures += 1
+            self.__update_latency(endpoint, max(latency, self.__failure_penalty))
+            if endpoint.failures >= self.__failure_threshold or endpoint.open_until != 0.0:
+                endpoint.open_until = monotonic() + self.__recovery_timeout
+
+    def request(self, func: Callable[[str], object], is_idempotent: bool = True, excluded: List[str] = None):
+        """
+        This interface is used to send a request to the selected endpoint.
+        SDKException raised by func is regarded as the failure of endpoint,
+        and the idempotent request will be retried on another endpoint.
+
+        :param func: a function which send the request to the given url.
+        :param is_idempotent: whether the request can be retried on another endpoint.
+        :param excluded: a list of endpoint which should be avoided.
+        :return: the return value of func.
+        """
+        tried = list() if excluded is None else list(excluded)
+        error = None
+        for _ in range(self.__max_retries + 1 if is_idempotent else 1):
+            url = self.select(tried)
+            start = perf_counter()
+            try:
+                result = func(url)
+            except SDKException as e:
+                self.record_failure(url, perf_counter() - start)
+                tried.append(url)
+                error = e
+                continue
+            self.record_success(url, perf_counter() - start)
+            return result
+        raise error
+
+    async def request_async(self, func: Callable[[str], Awaitable], is_idempotent: bool = True,
+                            excluded: List[str] = None):
+        tried = list() if excluded is None else list(excluded)
+        error = None
+        for _ in range(self.__max_retries + 1 if is_idempotent else 1):
+            url = self.select(tried)
+            start = perf_counter()
+            try:
+                result = await func(url)
+            except SDKException as e:
+                self.record_failure(url, perf_counter() - start)
+                tried.append(url)
+                error = e
+                continue
+            self.record_success(url, perf_counter() - start)
+            return result
+        raise error
+
+    def get_statistics(self) -> List[dict]:
+        with self.__lock:
+            return [dict(endpoint) for endpoint in self.__endpoints]
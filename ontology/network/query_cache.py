@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import inspect
+import threading
+
+from time import monotonic
+from typing import Callable, Awaitable
+
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+
+
+class QueryCache(object):
+    """
+    A cache for the results of queries which only change when a new block is generated, e.g. balances and gas price,
+    and for the results which never change, e.g. the name, symbol and decimals of a token.
+
+    A mutable result is invalidated when the observed block height advances, or when it is older than ttl seconds.
+    The block height is observed by set_block_height(), which can be fed by a websocket subscription,
+    or by polling height_provider at most once every height_check_interval seconds.
+
+    The clients key their queries by the node address, so that a result is never returned after switching networks.
+
+    :param ttl: the maximum age in seconds of a mutable result.
+    :param height_provider: a function which returns the current block height, e.g. RpcClient.get_block_height.
+    :param height_check_interval: the minimum interval in seconds between two calls of height_provider.
+    """
+
+    def __init__(self, ttl: float = 30, height_provider: Callable[[], int] = None, height_check_interval: float = 1):
+        if ttl <= 0:
+            raise SDKException(ErrorCode.param_err('the ttl of query cache should be greater than 0.'))
+        self.__ttl = ttl
+        self.__height_provider = height_provider
+        self.__height_check_interval = height_check_interval
+        self.__height = -1
+        self.__height_checked_at = None
+        self.__mutable = dict()
+        self.__permanent = dict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+
+    @property
+    def block_height(self) -> int:
+        return self.__height
+
+    def get_height_provider(self) -> Callable[[], int] or None:
+        return self.__height_provider
+
+    def set_height_provider(self, height_provider: Callable[[], int] or None):
+        self.__height_provider = height_provider
+        self.__height_checked_at = None
+
+    def set_block_height(self, height: int):
+        """
+        This interface is used to observe the block height, the mutable results are dropped when it advances.
+        """
+        with self.__lock:
+            if height > self.__height:
+                self.__height = height
+                self.__mutable.clear()
+
+    def __is_height_check_due(self) -> bool:
+        if self.__height_provider is None:
+            return False
+        now = monotonic()
+        if self.__height_checked_at is not None and now - self.__height_checked_at < self.__height_check_interval:
+            return False
+        self.__height_checked_at = now
+        return True
+
+    def __get_cached(self, key: tuple, is_permanent: bool, is_height_checked: bool) -> tuple:
+        with self.__lock:
+            if key in self.__permanent:
+                self.__hits += 1
+                return True, self.__permanent[key]
+            if not is_permanent and is_height_checked:
+                entry = self.__mutable.get(key)
+                if entry is not None and monotonic() - entry[1] < self.__ttl:
+                    self.__hits += 1
+                    return True, entry[0]
+        return False, None
+
+    def __put(self, key: tuple, result, height: int, is_permanent: bool):
+        with self.__lock:
+            self.__misses += 1
+            if is_permanent:
+                self.__permanent[key] = result
+            elif height == self.__height:
+                self.__mutable[key] = (result, monotonic())
+
+    def get_or_query(self, key: tuple, query: Callable[[], object], is_permanent: bool = False):
+        """
+        This interface is used to get the cached result of key, or call query and cache its result.
+
+        :param key: a hashable key of query, e.g. the method name and arguments.
+        :param query: a function which returns the result of query.
+        :param is_permanent: whether the result never changes.
+        :return: the result of query.
+        """
+        is_cached, result = self.__get_cached(key, is_permanent, False)
+        if is_cached:
+            return result
+        if not is_permanent:
+            if self.__is_height_check_due():
+                self.set_block_height(self.__height_provider())
+            is_cached, result = self.__get_cached(key, is_permanent, True)
+            if is_cached:
+                return result
+        height = self.__height
+        result = query()
+        self.__put(key, result, height, is_permanent)
+        return result
+
+    async def get_or_query_async(self, key: tuple, query: Callable[[], Awaitable], is_permanent: bool = False):
+        """
+        This interface is used to get the cached result of key, or await query and cache its result.
+        The height provider can be a coroutine function, e.g. AsyncRpcClient.get_block_height.
+        """
+        is_cached, result = self.__get_cached(key, is_permanent, False)
+        if is_cached:
+            return result
+        if not is_permanent:
+            if self.__is_height_check_due():
+                height = self.__height_provider()
+                if inspect.isawaitable(height):
+                    height = await height
+                self.set_block_height(height)
+            is_cached, result = self.__get_cached(key, is_permanent, True)
+            if is_cached:
+                return result
+        height = self.__height
+        result = await query()
+        self.__put(key, result, height, is_permanent)
+        return result
+
+    def invalidate(self, key: tuple = None):
+        """
+        This interface is used to drop the cached result of key, or all cached results if key is None.
+        """
+        with self.__lock:
+            if key is None:
+                self.__mutable.clear()
+                self.__permanent.clear()
+                return
+            self.__mutable.pop(key, None)
+            self.__permanent.pop(key, None)
+
+    async def follow_block_height(self, ws_client):
+        """
+        This interface is used to observe the block height by the json block subscription of a websocket client.
+        """
+        await ws_client.subscribe(list(), is_json_block=True)
+        while True:
+            response = await ws_client.recv_subscribe_info(is_full=True)
+            try:
+                self.set_block_height(response['Result']['Header']['Height'])
+            except (KeyError, TypeError):
+                continue
+
+    def get_statistics(self) -> dict:
+        with self.__lock:
+            return dict(hits=self.__hits, misses=self.__misses, height=self.__height, mutable=len(self.__mutable),
+                        permanent=len(self.__permanent))
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import sqlite3
+import threading
+
+from collections import OrderedDict
+
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+
+
+class ResponseCache(object):
+    """
+    A cache for the responses of immutable chain data, e.g. blocks, transactions, merkle proofs and contracts.
+
+    The responses are kept in a memory LRU, and also in a sqlite database if cache_path is given,
+    so that they can be shared between processes and survive restarts.
+
+    :param max_size: the maximum number of responses in memory.
+    :param cache_path: the path of sqlite database.
+    """
+
+    def __init__(self, max_size: int = 1024, cache_path: str = ''):
+        if max_size <= 0:
+            raise SDKException(ErrorCode.param_err('the size of response cache should be greater than 0.'))
+        self.__max_size = max_size
+        self.__cache_path = cache_path
+        self.__memory = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__disk_hits = 0
+        self.__misses = 0
+        self.__db = None
+        if len(cache_path) != 0:
+            self.__db = sqlite3.connect(cache_path, check_same_thread=False)
+            self.__db.execute('CREATE TABLE IF NOT EXISTS response (key TEXT PRIMARY KEY, value TEXT NOT NULL)')
+            self.__db.commit()
+
+    @staticmethod
+    def generate_key(method: str, params: list) -> str:
+        return json.dumps([method, params], separators=(',', ':'))
+
+    def __put_memory(self, key: str, value: str):
+        self.__memory[key] = value
+        self.__memory.move_to_end(key)
+        if len(self.__memory) > self.__max_size:
+            self.__memory.popitem(last=False)
+
+    def get(self, key: str) -> dict or list or None:
+        """
+        This interface is used to get a cached response, which is a new object for each call.
+        """
+        with self.__lock:
+            value = self.__memory.get(key)
+            if value is not None:
+                self.__memory.move_to_end(key)
+                self.__hits += 1
+            elif self.__db is not None:
+                row = self.__db.execute('SELECT value FROM response WHERE key = ?', (key,)).fetchone()
+                if row is not None:
+                    value = row[0]
+                    self.__put_memory(key, value)
+                    self.__hits += 1
+                    self.__disk_hits += 1
+            if value is None:
+                self.__misses += 1
+                return None
+        return json.loads(value)
+
+    def put(self, key: str, response: dict or list):
+        value = json.dumps(response, separators=(',', ':'))
+        with self.__lock:
+            self.__put_memory(key, value)
+            if self.__db is not None:
+                self.__db.execute('INSERT OR REPLACE INTO response (key, value) VALUES (?, ?)', (key, value))
+                self.__db.commit()
+
+    def clear(self):
+        with self.__lock:
+            self.__memory.clear()
+            if self.__db is not None:
+                self.__db.execute('DELETE FROM response')
+                self.__db.commit()
+
+    def get_statistics(self) -> dict:
+        with self.__lock:
+            return dict(hits=self.__hits, disk_hits=self.__disk_hits, misses=self.__misses, size=len(self.__memory))
+
+    def close(self):
+        with self.__lock:
+            if self.__db is not None:
+                self.__db.close()
+                self.__db = None
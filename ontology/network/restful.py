@@ -15,6 +15,8 @@ from ontology.smart_contract.neo_vm import NeoVm
 from ontology.core.transaction import Transaction
 from ontology.exception.error_code import ErrorCode
 from ontology.exception.exception import SDKException
+from ontology.network.connection_pool import HttpConnectionPool
+from ontology.network.load_balancer import LoadBalancer, BalanceStrategy
 from ontology.smart_contract.neo_contract.abi.abi_function import AbiFunction
 from ontology.smart_contract.neo_contract.abi.build_params import BuildParams
 from ontology.smart_contract.neo_contract.invoke_function import InvokeFunction
@@ -113,58 +115,79 @@ class RestfulMethod(object):
         return f'{url}/api/v1/grantong/{b58_address}'
 
 
-class RestfulClient(object):
-    def __init__(self, url: str = ''):
+class BaseRestfulClient(object):
+    """
+    The settings and the response parsers shared by RestfulClient and AsyncRestfulClient.
+    """
+
+    def __init__(self, url: str, pool):
         self.__url = url
+        self.__pool = pool
+        self.__balancer = None
 
     def set_address(self, url: str):
         self.__url = url
+        self.__balancer = None
 
     def get_address(self):
         return self.__url
 
-    def connect_to_test_net(self):
+    def set_connection_pool(self, pool):
+        self.__pool = pool
+
+    def get_connection_pool(self):
+        return self.__pool
+
+    def set_load_balancer(self, balancer: LoadBalancer):
+        """
+        This interface is used to route every request over the endpoints of load balancer.
+        """
+        if not isinstance(balancer, LoadBalancer):
+            raise SDKException(ErrorCode.param_err('a LoadBalancer object is required.'))
+        self.__url = balancer.urls[0]
+        self.__balancer = balancer
+
+    def get_load_balancer(self) -> LoadBalancer or None:
+        return self.__balancer
+
+    def set_endpoints(self, urls: List[str], strategy: BalanceStrategy = BalanceStrategy.EWMA, **kwargs):
+        self.set_load_balancer(LoadBalancer(urls, strategy, **kwargs))
+
+    def connect_to_test_net(self, is_balanced: bool = False):
+        if is_balanced:
+            self.set_endpoints(TEST_RESTFUL_ADDRESS)
+            return
         restful_address = choice(TEST_RESTFUL_ADDRESS)
         self.set_address(restful_address)
 
-    def connect_to_main_net(self):
+    def connect_to_main_net(self, is_balanced: bool = False):
+        if is_balanced:
+            self.set_endpoints(MAIN_RESTFUL_ADDRESS)
+            return
         restful_address = choice(MAIN_RESTFUL_ADDRESS)
         self.set_address(restful_address)
 
-    def __post(self, url: str, data: str):
-        try:
-            response = requests.post(url, data=data, timeout=10)
-        except requests.exceptions.MissingSchema as e:
-            raise SDKException(ErrorCode.connect_err(e.args[0]))
-        except requests.exceptions.ConnectTimeout:
-            raise SDKException(ErrorCode.other_error(''.join(['ConnectTimeout: ', self.__url])))
-        except requests.exceptions.ConnectionError:
-            raise SDKException(ErrorCode.other_error(''.join(['ConnectionError: ', self.__url])))
-        if response.status_code != 200:
-            raise SDKException(ErrorCode.other_error(response.content.decode('utf-8')))
+    def _get_path(self, url: str) -> str:
+        return url[len(self.__url):]
+
+    @staticmethod
+    def _decode_response(status: int, content: str) -> dict:
+        if status != 200:
+            raise SDKException(ErrorCode.other_error(content))
         try:
-            response = json.loads(response.content.decode('utf-8'))
+            response = json.loads(content)
         except json.decoder.JSONDecodeError as e:
-            raise SDKException(ErrorCode.other_error(e.args[0]))
+            raise SDKException(ErrorCode.other_error(e.args[0])) from None
+        return response
+
+    @staticmethod
+    def _check_post_error(response: dict) -> dict:
         if response['Error'] != 0:
             raise SDKException(ErrorCode.other_error(response['Result']))
         return response
 
-    def __get(self, url: str):
-        try:
-            response = requests.get(url, timeout=10)
-        except requests.exceptions.MissingSchema as e:
-            raise SDKException(ErrorCode.connect_err(e.args[0]))
-        except requests.exceptions.ConnectTimeout:
-            raise SDKException(ErrorCode.other_error(''.join(['ConnectTimeout: ', self.__url])))
-        except requests.exceptions.ConnectionError:
-            raise SDKException(ErrorCode.other_error(''.join(['ConnectionError: ', self.__url])))
-        if response.status_code != 200:
-            raise SDKException(ErrorCode.other_error(response.content.decode('utf-8')))
-        try:
-            response = json.loads(response.content.decode('utf-8'))
-        except json.decoder.JSONDecodeError as e:
-            raise SDKException(ErrorCode.other_error(e.args[0]))
+    @staticmethod
+    def _check_get_error(response: dict) -> dict:
         if response['Error'] != 0:
             if response['Result'] != '':
                 raise SDKException(ErrorCode.other_error(response['Result']))
@@ -172,43 +195,84 @@ class RestfulClient(object):
                 raise SDKException(ErrorCode.other_error(response['Desc']))
         return response
 
+
+class RestfulClient(BaseRestfulClient):
+    def __init__(self, url: str = '', pool: HttpConnectionPool = None):
+        if pool is None:
+            pool = HttpConnectionPool.get_default_pool()
+        super().__init__(url, pool)
+
+    def set_connection_pool(self, pool: HttpConnectionPool):
+        if not isinstance(pool, HttpConnectionPool):
+            raise SDKException(ErrorCode.param_err('a HttpConnectionPool object is required.'))
+        super().set_connection_pool(pool)
+
+    def get_connection_pool(self) -> HttpConnectionPool:
+        return super().get_connection_pool()
+
+    def __request(self, method: str, url: str, **kwargs) -> dict:
+        try:
+            response = self.get_connection_pool().request(method, url, **kwargs)
+        except requests.exceptions.MissingSchema as e:
+            raise SDKException(ErrorCode.connect_err(e.args[0]))
+        except requests.exceptions.ConnectTimeout:
+            raise SDKException(ErrorCode.other_error(''.join(['ConnectTimeout: ', url])))
+        except requests.exceptions.ConnectionError:
+            raise SDKException(ErrorCode.other_error(''.join(['ConnectionError: ', url])))
+        except requests.exceptions.ReadTimeout:
+            raise SDKException(ErrorCode.other_error(''.join(['ReadTimeout: ', url])))
+        return self._decode_response(response.status_code, response.content.decode('utf-8'))
+
+    def __route(self, method: str, url: str, is_idempotent: bool, **kwargs) -> dict:
+        balancer = self.get_load_balancer()
+        if balancer is None:
+            return self.__request(method, url, **kwargs)
+        path = self._get_path(url)
+        return balancer.request(lambda endpoint: self.__request(method, endpoint + path, **kwargs), is_idempotent)
+
+    def __post(self, url: str, data: str):
+        return self._check_post_error(self.__route('POST', url, url.endswith('preExec=1'), data=data))
+
+    def __get(self, url: str):
+        return self._check_get_error(self.__route('GET', url, True))
+
     def get_version(self, is_full: bool = False):
-        url = RestfulMethod.get_version(self.__url)
+        url = RestfulMethod.get_version(self.get_address())
         response = self.__get(url)
         if is_full:
             return response
         return response['Result']
 
     def get_connection_count(self, is_full: bool = False) -> int:
-        url = RestfulMethod.get_connection_count(self.__url)
+        url = RestfulMethod.get_connection_count(self.get_address())
         response = self.__get(url)
         if is_full:
             return response
         return response['Result']
 
     def get_gas_price(self, is_full: bool = False) -> int or dict:
-        url = RestfulMethod.get_gas_price(self.__url)
+        url = RestfulMethod.get_gas_price(self.get_address())
         response = self.__get(url)
         if is_full:
             return response
         return response['Result']['gasprice']
 
     def get_network_id(self, is_full: bool = False) -> int or dict:
-        url = RestfulMethod.get_network_id(self.__url)
+        url = RestfulMethod.get_network_id(self.get_address())
         response = self.__get(url)
         if is_full:
             return response
         return response['Result']
 
     def get_block_height(self, is_full: bool = False) -> int or dict:
-        url = RestfulMethod.get_block_height(self.__url)
+        url = RestfulMethod.get_block_height(self.get_address())
         response = self.__get(url)
         if is_full:
             return response
         return response['Result']
 
     def get_block_height_by_tx_hash(self, tx_hash: str, is_full: bool = False):
-        url = RestfulMethod.get_block_height_by_tx_hash(self.__url, tx_hash)
+        url = RestfulMethod.get_block_height_by_tx_hash(self.get_address(), tx_hash)
         response = self.__get(url)
         if is_full:
             return response
@@ -229,49 +293,49 @@ class RestfulClient(object):
         return response['Result']
 
     def get_block_by_hash(self, block_hash: str, is_full: bool = False) -> int or dict:
-        url = RestfulMethod.get_block_by_hash(self.__url, block_hash)
+        url = RestfulMethod.get_block_by_hash(self.get_address(), block_hash)
         response = self.__get(url)
         if is_full:
             return response
         return response['Result']
 
     def get_block_by_height(self, height: int, is_full: bool = False):
-        url = RestfulMethod.get_block_by_height(self.__url, height)
+        url = RestfulMethod.get_block_by_height(self.get_address(), height)
         response = self.__get(url)
         if is_full:
             return response
         return response['Result']
 
     def get_balance(self, b58_address: str, is_full: bool = False):
-        url = RestfulMethod.get_account_balance(self.__url, b58_address)
+        url = RestfulMethod.get_account_balance(self.get_address(), b58_address)
         response = self.__get(url)
         if is_full:
             return response
         return response['Result']
 
     def get_grant_ong(self, b58_address: str, is_full: bool = False):
-        url = RestfulMethod.get_grant_ong(self.__url, b58_address)
+        url = RestfulMethod.get_grant_ong(self.get_address(), b58_address)
         response = self.__get(url)
         if is_full:
             return response
         return int(response['Result'])
 
     def get_allowance(self, asset: str, b58_from_address: str, b58_to_address: str, is_full: bool = False):
-        url = RestfulMethod.get_allowance(self.__url, asset, b58_from_address, b58_to_address)
+        url = RestfulMethod.get_allowance(self.get_address(), asset, b58_from_address, b58_to_address)
         response = self.__get(url)
         if is_full:
             return response
         return response['Result']
 
     def get_smart_contract(self, contract_address: str, is_full: bool = False):
-        url = RestfulMethod.get_smart_contract(self.__url, contract_address)
+        url = RestfulMethod.get_smart_contract(self.get_address(), contract_address)
         response = self.__get(url)
         if is_full:
             return response
         return response['Result']
 
     def get_smart_contract_event_by_height(self, height: int, is_full: bool = False) -> List[dict]:
-        url = RestfulMethod.get_smart_contract_event_by_height(self.__url, height)
+        url = RestfulMethod.get_smart_contract_event_by_height(self.get_address(), height)
         response = self.__get(url)
         if is_full:
             return response
@@ -284,21 +348,21 @@ class RestfulClient(object):
         return self.get_smart_contract_event_by_height(count - 1, is_full)
 
     def get_smart_contract_event_by_tx_hash(self, tx_hash: str, is_full: bool = False):
-        url = RestfulMethod.get_smart_contract_event_by_tx_hash(self.__url, tx_hash)
+        url = RestfulMethod.get_smart_contract_event_by_tx_hash(self.get_address(), tx_hash)
         response = self.__get(url)
         if is_full:
             return response
         return response['Result']
 
     def get_storage(self, hex_contract_address: str, hex_key: str, is_full: bool = False) -> str or dict:
-        url = RestfulMethod.get_storage(self.__url, hex_contract_address, hex_key)
+        url = RestfulMethod.get_storage(self.get_address(), hex_contract_address, hex_key)
         response = self.__get(url)
         if is_full:
             return response
         return response['Result']
 
     def get_transaction_by_tx_hash(self, tx_hash: str, is_full: bool = False):
-        url = RestfulMethod.get_transaction(self.__url, tx_hash)
+        url = RestfulMethod.get_transaction(self.get_address(), tx_hash)
         response = self.__get(url)
         if is_full:
             return response
@@ -307,7 +371,7 @@ class RestfulClient(object):
     def send_raw_transaction(self, tx: Transaction, is_full: bool = False):
         hex_tx_data = tx.serialize(is_hex=True).decode('ascii')
         data = f'{{"Action":"sendrawtransaction", "Version":"1.0.0","Data":"{hex_tx_data}"}}'
-        url = RestfulMethod.send_transaction(self.__url)
+        url = RestfulMethod.send_transaction(self.get_address())
         response = self.__post(url, data)
         if is_full:
             return response
@@ -316,28 +380,28 @@ class RestfulClient(object):
     def send_raw_transaction_pre_exec(self, tx: Transaction, is_full: bool = False):
         hex_tx_data = tx.serialize(is_hex=True).decode('ascii')
         data = f'{{"Action":"sendrawtransaction", "Version":"1.0.0","Data":"{hex_tx_data}"}}'
-        url = RestfulMethod.send_transaction_pre_exec(self.__url)
+        url = RestfulMethod.send_transaction_pre_exec(self.get_address())
         response = self.__post(url, data)
         if is_full:
             return response
         return response['Result']
 
     def get_merkle_proof(self, tx_hash: str, is_full: bool = False):
-        url = RestfulMethod.get_merkle_proof(self.__url, tx_hash)
+        url = RestfulMethod.get_merkle_proof(self.get_address(), tx_hash)
         response = self.__get(url)
         if is_full:
             return response
         return response['Result']
 
     def get_memory_pool_tx_count(self, is_full: bool = False):
-        url = RestfulMethod.get_mem_pool_tx_count(self.__url)
+        url = RestfulMethod.get_mem_pool_tx_count(self.get_address())
         response = self.__get(url)
         if is_full:
             return response
         return response['Result']
 
     def get_memory_pool_tx_state(self, tx_hash: str, is_full: bool = False) -> List[dict] or dict:
-        url = RestfulMethod.get_mem_pool_tx_state(self.__url, tx_hash)
+        url = RestfulMethod.get_mem_pool_tx_state(self.get_address(), tx_hash)
         response = self.__get(url)
         if is_full:
             return response
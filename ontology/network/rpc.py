@@ -16,6 +16,10 @@ from ontology.smart_contract.neo_vm import NeoVm
 from ontology.core.transaction import Transaction
 from ontology.exception.error_code import ErrorCode
 from ontology.exception.exception import SDKException
+from ontology.network.connection_pool import HttpConnectionPool
+from ontology.network.query_cache import QueryCache
+from ontology.network.response_cache import ResponseCache
+from ontology.network.load_balancer import LoadBalancer, BalanceStrategy
 from ontology.smart_contract.neo_contract.abi.abi_function import AbiFunction
 from ontology.smart_contract.neo_contract.abi.build_params import BuildParams
 from ontology.smart_contract.neo_contract.invoke_function import InvokeFunction
@@ -52,94 +56,289 @@ class RpcMethod(object):
     RPC_VERSION = '2.0'
 
 
-class RpcClient(object):
-    def __init__(self, url: str = '', qid: int = 0):
+class BaseRpcClient(object):
+    """
+    The settings, the payload builders and the response parsers shared by RpcClient and AsyncRpcClient.
+    """
+
+    def __init__(self, url: str, qid: int, pool):
         self.__url = url
         self.__qid = qid
         self.__generate_qid()
+        self.__pool = pool
+        self.__balancer = None
+        self.__is_batch_supported = True
+        self.__cache = None
+        self.__query_cache = None
 
     def set_address(self, url: str):
         self.__url = url
+        self.__balancer = None
+        self.__is_batch_supported = True
 
     def get_address(self):
         return self.__url
 
+    def set_connection_pool(self, pool):
+        self.__pool = pool
+
+    def get_connection_pool(self):
+        return self.__pool
+
+    def set_response_cache(self, cache: ResponseCache or None):
+        """
+        This interface is used to cache the responses of immutable chain data, i.e. the blocks, block hashes,
+        transactions, merkle proofs and contracts. A cache should only be shared by the clients of one network.
+        """
+        if cache is not None and not isinstance(cache, ResponseCache):
+            raise SDKException(ErrorCode.param_err('a ResponseCache object is required.'))
+        self.__cache = cache
+
+    def get_response_cache(self) -> ResponseCache or None:
+        return self.__cache
+
+    def set_query_cache(self, cache: QueryCache or None):
+        """
+        This interface is used to cache the gas price, the balances and the token settings queried by pre-exec.
+        If the cache has no height provider, it observes the block height of this client.
+        """
+        if cache is not None and not isinstance(cache, QueryCache):
+            raise SDKException(ErrorCode.param_err('a QueryCache object is required.'))
+        if cache is not None and cache.get_height_provider() is None:
+            cache.set_height_provider(self.get_block_height)
+        self.__query_cache = cache
+
+    def get_query_cache(self) -> QueryCache or None:
+        return self.__query_cache
+
+    def set_load_balancer(self, balancer: LoadBalancer):
+        """
+        This interface is used to route every request over the endpoints of load balancer.
+        """
+        if not isinstance(balancer, LoadBalancer):
+            raise SDKException(ErrorCode.param_err('a LoadBalancer object is required.'))
+        self.__url = balancer.urls[0]
+        self.__balancer = balancer
+        self.__is_batch_supported = True
+
+    def get_load_balancer(self) -> LoadBalancer or None:
+        return self.__balancer
+
+    def set_endpoints(self, urls: List[str], strategy: BalanceStrategy = BalanceStrategy.EWMA, **kwargs):
+        self.set_load_balancer(LoadBalancer(urls, strategy, **kwargs))
+
     def __generate_qid(self):
         if self.__qid == 0:
             self.__qid = randint(0, maxsize)
         return self.__qid
 
-    def connect_to_test_net(self):
+    def connect_to_test_net(self, is_balanced: bool = False):
+        if is_balanced:
+            self.set_endpoints(TEST_RPC_ADDRESS)
+            return
         rpc_address = choice(TEST_RPC_ADDRESS)
         self.set_address(rpc_address)
 
-    def connect_to_main_net(self):
+    def connect_to_main_net(self, is_balanced: bool = False):
+        if is_balanced:
+            self.set_endpoints(MAIN_RPC_ADDRESS)
+            return
         rpc_address = choice(MAIN_RPC_ADDRESS)
         self.set_address(rpc_address)
 
+    def _is_batch_supported(self) -> bool:
+        return self.__is_batch_supported
+
     @staticmethod
-    def __post(url, payload):
-        header = {'Content-type': 'application/json'}
-        try:
-            response = requests.post(url, json=payload, headers=header, timeout=10)
-        except requests.exceptions.MissingSchema as e:
-            raise SDKException(ErrorCode.connect_err(e.args[0])) from None
-        except requests.exceptions.ConnectTimeout:
-            raise SDKException(ErrorCode.other_error(''.join(['ConnectTimeout: ', url]))) from None
-        except requests.exceptions.ConnectionError:
-            raise SDKException(ErrorCode.other_error(''.join(['ConnectionError: ', url]))) from None
-        except requests.exceptions.ReadTimeout:
-            raise SDKException(ErrorCode.other_error(''.join(['ReadTimeout: ', url]))) from None
-        try:
-            content = response.content.decode('utf-8')
-        except Exception as e:
-            raise SDKException(ErrorCode.other_error(e.args[0])) from None
-        if response.status_code != 200:
+    def _is_idempotent(payload: dict or list) -> bool:
+        if isinstance(payload, list):
+            return all(BaseRpcClient._is_idempotent(item) for item in payload)
+        if payload['method'] != RpcMethod.SEND_TRANSACTION:
+            return True
+        params = payload.get('params', list())
+        return len(params) > 1 and params[1] == 1
+
+    @staticmethod
+    def _decode_response(status: int, content: str) -> dict or list:
+        if status != 200:
             raise SDKException(ErrorCode.other_error(content))
         try:
             content = json.loads(content)
         except json.decoder.JSONDecodeError as e:
             raise SDKException(ErrorCode.other_error(e.args[0])) from None
-        if content['error'] != 0:
-            if content['result'] != '':
-                raise SDKException(ErrorCode.other_error(content['result']))
-            else:
-                raise SDKException(ErrorCode.other_error(content['desc']))
         return content
 
     @staticmethod
-    def __get(url, payload):
+    def _parse_error(content: dict) -> SDKException or None:
+        if content['error'] == 0:
+            return None
+        if content['result'] != '':
+            return SDKException(ErrorCode.other_error(content['result']))
+        return SDKException(ErrorCode.other_error(content['desc']))
+
+    def generate_json_rpc_payload(self, method, param=None):
+        if param is None:
+            param = list()
+        json_rpc_payload = dict(jsonrpc=RpcMethod.RPC_VERSION, id=self.__qid, method=method, params=param)
+        return json_rpc_payload
+
+    def generate_json_rpc_batch_payload(self, calls: List[tuple]) -> List[dict]:
+        """
+        This interface is used to generate a JSON-RPC 2.0 batch payload.
+        The id of each item is its index in the calls list.
+
+        :param calls: a list of (method, params) tuples, params is optional.
+        :return: a list of JSON-RPC payload.
+        """
+        batch_payload = list()
+        for index, call in enumerate(calls):
+            if isinstance(call, str):
+                call = (call,)
+            if not isinstance(call, (tuple, list)) or len(call) == 0 or len(call) > 2:
+                raise SDKException(ErrorCode.param_err('a (method, params) tuple is required in batch calls.'))
+            payload = self.generate_json_rpc_payload(*call)
+            payload['id'] = index
+            batch_payload.append(payload)
+        return batch_payload
+
+    def _parse_batch_response(self, status: int, content: str) -> dict or None:
+        """
+        This interface is used to map the id of each item in a batch response to the item.
+
+        :return: a dict, or None if the node does not support batch requests, which is remembered.
+        """
+        try:
+            content = self._decode_response(status, content)
+        except SDKException:
+            content = None
+        if not isinstance(content, list):
+            self.__is_batch_supported = False
+            return None
+        response_map = dict()
+        for response in content:
+            if isinstance(response, dict) and isinstance(response.get('id'), int):
+                response_map[response['id']] = response
+        return response_map
+
+    @staticmethod
+    def _parse_batch_result(batch_payload: List[dict], response_map: dict, is_full: bool) -> list:
+        """
+        This interface is used to get the results of a batch in the same order of its payload.
+
+        :param batch_payload: the payload of batch.
+        :param response_map: a dict from the id of each item to its response, or to the SDKException raised by it.
+        :param is_full: Whether to return all information.
+        """
+        result = list()
+        for index, payload in enumerate(batch_payload):
+            response = response_map.get(index)
+            if response is None:
+                result.append(SDKException(ErrorCode.other_error(f'no response of {payload["method"]} in batch.')))
+                continue
+            if isinstance(response, SDKException):
+                result.append(response)
+                continue
+            error = BaseRpcClient._parse_error(response)
+            if error is not None:
+                result.append(error)
+            elif is_full:
+                result.append(response)
+            else:
+                result.append(response['result'])
+        return result
+
+
+class RpcClient(BaseRpcClient):
+    def __init__(self, url: str = '', qid: int = 0, pool: HttpConnectionPool = None):
+        if pool is None:
+            pool = HttpConnectionPool.get_default_pool()
+        super().__init__(url, qid, pool)
+
+    def set_connection_pool(self, pool: HttpConnectionPool):
+        if not isinstance(pool, HttpConnectionPool):
+            raise SDKException(ErrorCode.param_err('a HttpConnectionPool object is required.'))
+        super().set_connection_pool(pool)
+
+    def get_connection_pool(self) -> HttpConnectionPool:
+        return super().get_connection_pool()
+
+    def __route(self, func, payload):
+        balancer = self.get_load_balancer()
+        if balancer is None:
+            return func(self.get_address(), payload)
+        return balancer.request(lambda endpoint: func(endpoint, payload), self._is_idempotent(payload))
+
+    def __post(self, payload):
+        content = self.__route(self.__post_json, payload)
+        error = self._parse_error(content)
+        if error is not None:
+            raise error
+        return content
+
+    def __post_immutable(self, payload: dict) -> dict:
+        cache = self.get_response_cache()
+        if cache is None:
+            return self.__post(payload)
+        key = cache.generate_key(payload['method'], payload['params'])
+        response = cache.get(key)
+        if response is not None:
+            return response
+        response = self.__post(payload)
+        if response.get('result') not in (None, '', dict(), list()):
+            cache.put(key, response)
+        return response
+
+    def __post_json(self, url, payload: dict or list) -> dict or list:
+        return self._decode_response(*self.__send_post(url, payload))
+
+    def __send_post(self, url, payload: dict or list) -> tuple:
         header = {'Content-type': 'application/json'}
         try:
-            response = requests.get(url, params=json.dumps(payload), headers=header, timeout=10)
+            response = self.get_connection_pool().post(url, json=payload, headers=header)
         except requests.exceptions.MissingSchema as e:
-            raise SDKException(ErrorCode.connect_err(e.args[0]))
+            raise SDKException(ErrorCode.connect_err(e.args[0])) from None
         except requests.exceptions.ConnectTimeout:
-            raise SDKException(ErrorCode.other_error(''.join(['ConnectTimeout: ', url])))
+            raise SDKException(ErrorCode.other_error(''.join(['ConnectTimeout: ', url]))) from None
         except requests.exceptions.ConnectionError:
-            raise SDKException(ErrorCode.other_error(''.join(['ConnectionError: ', url])))
+            raise SDKException(ErrorCode.other_error(''.join(['ConnectionError: ', url]))) from None
+        except requests.exceptions.ReadTimeout:
+            raise SDKException(ErrorCode.other_error(''.join(['ReadTimeout: ', url]))) from None
         try:
             content = response.content.decode('utf-8')
         except Exception as e:
-            raise SDKException(ErrorCode.other_error(e.args[0]))
-        if response.status_code != 200:
-            raise SDKException(ErrorCode.other_error(content))
-        try:
-            content = json.loads(content)
-        except json.decoder.JSONDecodeError as e:
-            raise SDKException(ErrorCode.other_error(e.args[0]))
-        if content['error'] != 0:
-            if content['result'] != '':
-                raise SDKException(ErrorCode.other_error(content['result']))
-            else:
-                raise SDKException(ErrorCode.other_error(content['desc']))
-        return content
+            raise SDKException(ErrorCode.other_error(e.args[0])) from None
+        return response.status_code, content
 
-    def generate_json_rpc_payload(self, method, param=None):
-        if param is None:
-            param = list()
-        json_rpc_payload = dict(jsonrpc=RpcMethod.RPC_VERSION, id=self.__qid, method=method, params=param)
-        return json_rpc_payload
+    def send_batch(self, calls: List[tuple], is_full: bool = False) -> list:
+        """
+        This interface is used to send many RPC calls in one JSON-RPC 2.0 batch request.
+
+        :param calls: a list of (method, params) tuples, e.g. [(RpcMethod.GET_BALANCE, [b58_address, 1])].
+        :param is_full: Whether to return all information.
+        :return: a list which is in the same order of calls. Each item is the result of the call,
+                 or a SDKException object if the call failed.
+        """
+        if len(calls) == 0:
+            return list()
+        batch_payload = self.generate_json_rpc_batch_payload(calls)
+        response_map = None
+        if self._is_batch_supported():
+            response_map = self._parse_batch_response(*self.__route(self.__send_post, batch_payload))
+        if response_map is None:
+            response_map = self.__post_each(batch_payload)
+        return self._parse_batch_result(batch_payload, response_map, is_full)
+
+    def __post_each(self, batch_payload: List[dict]) -> dict:
+        """
+        Fall back to one request per item over the kept-alive connection for nodes without batch support.
+        """
+        response_map = dict()
+        for payload in batch_payload:
+            try:
+                response_map[payload['id']] = self.__route(self.__post_json, payload)
+            except SDKException as e:
+                response_map[payload['id']] = e
+        return response_map
 
     def get_version(self, is_full: bool = False) -> dict or str:
         """
@@ -149,7 +348,7 @@ class RpcClient(object):
             the version information of the connected node.
         """
         payload = self.generate_json_rpc_payload(RpcMethod.GET_VERSION)
-        response = self.__post(self.__url, payload)
+        response = self.__post(payload)
         if is_full:
             return response
         return response['result']
@@ -162,7 +361,7 @@ class RpcClient(object):
             the number of connections.
         """
         payload = self.generate_json_rpc_payload(RpcMethod.GET_NODE_COUNT)
-        response = self.__post(self.__url, payload)
+        response = self.__post(payload)
         if is_full:
             return response
         return response['result']
@@ -175,10 +374,13 @@ class RpcClient(object):
             the value of gas price.
         """
         payload = self.generate_json_rpc_payload(RpcMethod.GET_GAS_PRICE)
-        response = self.__post(self.__url, payload)
         if is_full:
-            return response
-        return response['result']['gasprice']
+            return self.__post(payload)
+        query_cache = self.get_query_cache()
+        if query_cache is None:
+            return self.__post(payload)['result']['gasprice']
+        return query_cache.get_or_query((self.get_address(), RpcMethod.GET_GAS_PRICE),
+                                        lambda: self.__post(payload)['result']['gasprice'])
 
     def get_network_id(self, is_full: bool = False) -> int:
         """
@@ -189,7 +391,7 @@ class RpcClient(object):
         """
 
         payload = self.generate_json_rpc_payload(RpcMethod.GET_NETWORK_ID)
-        response = self.__post(self.__url, payload)
+        response = self.__post(payload)
         if is_full:
             return response
         return response['result']
@@ -203,7 +405,7 @@ class RpcClient(object):
         :return: the block information of the specified block hash.
         """
         payload = self.generate_json_rpc_payload(RpcMethod.GET_BLOCK, [block_hash, 1])
-        response = self.__post(self.__url, payload)
+        response = self.__post_immutable(payload)
         if is_full:
             return response
         return response['result']
@@ -216,7 +418,7 @@ class RpcClient(object):
             the decimal total number of blocks in current network.
         """
         payload = self.generate_json_rpc_payload(RpcMethod.GET_BLOCK, [height, 1])
-        response = self.__post(self.__url, payload)
+        response = self.__post_immutable(payload)
         if is_full:
             return response
         return response['result']
@@ -229,7 +431,7 @@ class RpcClient(object):
             the decimal total number of blocks in current network.
         """
         payload = self.generate_json_rpc_payload(RpcMethod.GET_BLOCK_COUNT)
-        response = self.__post(self.__url, payload)
+        response = self.__post(payload)
         if is_full:
             return response
         return response['result']
@@ -249,7 +451,7 @@ class RpcClient(object):
 
     def get_block_height_by_tx_hash(self, tx_hash: str, is_full: bool = False):
         payload = self.generate_json_rpc_payload(RpcMethod.GET_BLOCK_HEIGHT_BY_HASH, [tx_hash])
-        response = self.__post(self.__url, payload)
+        response = self.__post(payload)
         if is_full:
             return response
         return response['result']
@@ -269,7 +471,7 @@ class RpcClient(object):
             the hexadecimal hash value of the highest block in current network.
         """
         payload = self.generate_json_rpc_payload(RpcMethod.GET_CURRENT_BLOCK_HASH)
-        response = self.__post(self.__url, payload)
+        response = self.__post(payload)
         if is_full:
             return response
         return response['result']
@@ -283,7 +485,7 @@ class RpcClient(object):
         :return: the hexadecimal hash value of the specified block height.
         """
         payload = self.generate_json_rpc_payload(RpcMethod.GET_BLOCK_HASH, [height, 1])
-        response = self.__post(self.__url, payload)
+        response = self.__post_immutable(payload)
         if is_full:
             return response
         return response['result']
@@ -297,14 +499,14 @@ class RpcClient(object):
         :return: the value of account balance in dictionary form.
         """
         payload = self.generate_json_rpc_payload(RpcMethod.GET_BALANCE, [b58_address, 1])
-        response = self.__post(self.__url, payload)
+        response = self.__post(payload)
         if is_full:
             return response
         return response['result']
 
     def get_grant_ong(self, b58_address: str, is_full: bool = False):
         payload = self.generate_json_rpc_payload(RpcMethod.GET_GRANT_ONG, [b58_address])
-        response = self.__post(self.__url, payload)
+        response = self.__post(payload)
         if is_full:
             return response
         return int(response['result'])
@@ -321,7 +523,7 @@ class RpcClient(object):
         :return: the information of allowance in dictionary form.
         """
         payload = self.generate_json_rpc_payload(RpcMethod.GET_ALLOWANCE, [asset_name, from_address, to_address])
-        response = self.__post(self.__url, payload)
+        response = self.__post(payload)
         if is_full:
             return response
         return response['result']
@@ -337,7 +539,7 @@ class RpcClient(object):
         :return: the information of contract storage.
         """
         payload = self.generate_json_rpc_payload(RpcMethod.GET_STORAGE, [hex_contract_address, hex_key, 1])
-        response = self.__post(self.__url, payload)
+        response = self.__post(payload)
         if is_full:
             return response
         return response['result']
@@ -351,7 +553,7 @@ class RpcClient(object):
         :return: the information of smart contract event in dictionary form.
         """
         payload = self.generate_json_rpc_payload(RpcMethod.GET_SMART_CONTRACT_EVENT, [tx_hash, 1])
-        response = self.__post(self.__url, payload)
+        response = self.__post(payload)
         if is_full:
             return response
         return response['result']
@@ -365,7 +567,7 @@ class RpcClient(object):
         :return: the information of smart contract event in dictionary form.
         """
         payload = self.generate_json_rpc_payload(RpcMethod.GET_SMART_CONTRACT_EVENT, [height, 1])
-        response = self.__post(self.__url, payload)
+        response = self.__post(payload)
         if is_full:
             return response
         event_list = response['result']
@@ -385,7 +587,7 @@ class RpcClient(object):
         :return: dict
         """
         payload = self.generate_json_rpc_payload(RpcMethod.GET_TRANSACTION, [tx_hash, 1])
-        response = self.__post(self.__url, payload)
+        response = self.__post_immutable(payload)
         if is_full:
             return response
         return response['result']
@@ -403,7 +605,7 @@ class RpcClient(object):
         if len(hex_contract_address) != 40:
             raise SDKException(ErrorCode.param_err('the length of the contract address should be 40 bytes.'))
         payload = self.generate_json_rpc_payload(RpcMethod.GET_SMART_CONTRACT, [hex_contract_address, 1])
-        response = self.__post(self.__url, payload)
+        response = self.__post_immutable(payload)
         if is_full:
             return response
         return response['result']
@@ -417,21 +619,21 @@ class RpcClient(object):
         :return: the merkle proof in dictionary form.
         """
         payload = self.generate_json_rpc_payload(RpcMethod.GET_MERKLE_PROOF, [tx_hash, 1])
-        response = self.__post(self.__url, payload)
+        response = self.__post_immutable(payload)
         if is_full:
             return response
         return response['result']
 
     def get_memory_pool_tx_count(self, is_full: bool = False):
         payload = self.generate_json_rpc_payload(RpcMethod.GET_MEM_POOL_TX_COUNT)
-        response = self.__post(self.__url, payload)
+        response = self.__post(payload)
         if is_full:
             return response
         return response['result']
 
     def get_memory_pool_tx_state(self, tx_hash: str, is_full: bool = False):
         payload = self.generate_json_rpc_payload(RpcMethod.GET_MEM_POOL_TX_STATE, [tx_hash])
-        response = self.__post(self.__url, payload)
+        response = self.__post(payload)
         if is_full:
             return response
         return response['result']['State']
@@ -445,7 +647,7 @@ class RpcClient(object):
         """
         tx_data = tx.serialize(is_hex=True).decode('ascii')
         payload = self.generate_json_rpc_payload(RpcMethod.SEND_TRANSACTION, [tx_data])
-        response = self.__post(self.__url, payload)
+        response = self.__post(payload)
         if is_full:
             return response
         return response['result']
@@ -460,7 +662,7 @@ class RpcClient(object):
         """
         tx_data = tx.serialize(is_hex=True).decode('ascii')
         payload = self.generate_json_rpc_payload(RpcMethod.SEND_TRANSACTION, [tx_data, 1])
-        response = self.__post(self.__url, payload)
+        response = self.__post(payload)
         if is_full:
             return response
         return response['result']
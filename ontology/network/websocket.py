@@ -3,13 +3,16 @@
 
 import json
 import socket
+import asyncio
 import binascii
 
-from time import time
 from sys import maxsize
 from typing import List
+from collections import deque
+from enum import Enum, unique
+from time import time, perf_counter
 
-from websockets import client
+from websockets import client, exceptions
 from Cryptodome.Random.random import randint, choice
 
 from ontology.account.account import Account
@@ -17,6 +20,7 @@ from ontology.smart_contract.neo_vm import NeoVm
 from ontology.core.transaction import Transaction
 from ontology.exception.error_code import ErrorCode
 from ontology.exception.exception import SDKException
+from ontology.network.load_balancer import LoadBalancer, BalanceStrategy
 from ontology.smart_contract.neo_contract.abi.abi_function import AbiFunction
 from ontology.smart_contract.neo_contract.abi.build_params import BuildParams
 from ontology.smart_contract.neo_contract.invoke_function import InvokeFunction
@@ -25,11 +29,33 @@ TEST_WS_ADDRESS = ['ws://polaris1.ont.io:20335', 'ws://polaris2.ont.io:20335', '
 MAIN_WS_ADDRESS = ['ws://dappnode1.ont.io:20335', 'ws://dappnode2.ont.io:20335']
 
 
+@unique
+class BackpressurePolicy(Enum):
+    BLOCK = 'block'
+    DROP_OLDEST = 'drop_oldest'
+    COALESCE = 'coalesce'
+
+
 class WebsocketClient(object):
-    def __init__(self, url: str = ''):
+    def __init__(self, url: str = '', is_multiplexed: bool = False, max_subscribe_queue_size: int = 0,
+                 subscribe_policy: BackpressurePolicy = BackpressurePolicy.BLOCK):
         self.__url = url
         self.__id = 0
         self.__ws_client = None
+        self.__balancer = None
+        self.__is_multiplexed = is_multiplexed
+        self.__request_id = 0
+        self.__pending = dict()
+        self.__reader_task = None
+        self.__connect_lock = None
+        self.__subscribe_buffer = deque()
+        self.__subscribe_ready = None
+        self.__subscribe_drained = None
+        self.__max_subscribe_queue_size = 0
+        self.__subscribe_policy = BackpressurePolicy.BLOCK
+        self.__subscribe_dropped = 0
+        self.__subscription = None
+        self.set_subscribe_buffer(max_subscribe_queue_size, subscribe_policy)
 
     def __generate_ws_id(self):
         if self.__id == 0:
@@ -38,42 +64,244 @@ class WebsocketClient(object):
 
     def set_address(self, url: str):
         self.__url = url
+        self.__balancer = None
 
     def get_address(self):
         return self.__url
 
-    def connect_to_test_net(self):
+    @property
+    def is_multiplexed(self) -> bool:
+        return self.__is_multiplexed
+
+    async def set_multiplexed(self, is_multiplexed: bool):
+        """
+        This interface is used to switch the multiplexed mode. In multiplexed mode, each request is sent with an
+        unique Id, and a background reader task routes the responses by Id, so that many requests can be in flight
+        on one connection. A response without a known Id is routed by its Action only when exactly one request with
+        that Action is pending. Subscription notifications are kept in a separate buffer, see set_subscribe_buffer().
+        """
+        if is_multiplexed == self.__is_multiplexed:
+            return
+        await self.close_connect()
+        self.__is_multiplexed = is_multiplexed
+
+    def set_subscribe_buffer(self, max_size: int, policy: BackpressurePolicy = BackpressurePolicy.BLOCK):
+        """
+        This interface is used to bound the buffer of subscription notifications in multiplexed mode, 0 means no limit.
+        When the buffer has max_size notifications, the reader applies the policy:
+            BLOCK: stop reading from websocket until the buffer is drained, but only while no request is pending,
+                so that the responses are never held behind the notifications.
+            DROP_OLDEST: discard the oldest notification in buffer.
+        COALESCE is not supported, since a raw notification has no coalesce key, see ContractEventStream.
+        """
+        if max_size < 0:
+            raise SDKException(ErrorCode.param_err('the size of subscribe buffer should not be less than 0.'))
+        if not isinstance(policy, BackpressurePolicy):
+            raise SDKException(ErrorCode.param_err('a BackpressurePolicy object is required.'))
+        if policy == BackpressurePolicy.COALESCE:
+            raise SDKException(ErrorCode.param_err('the subscribe buffer only supports BLOCK and DROP_OLDEST.'))
+        self.__max_subscribe_queue_size = max_size
+        self.__subscribe_policy = policy
+        if self.__subscribe_drained is not None:
+            self.__subscribe_drained.set()
+
+    def get_subscribe_statistics(self) -> dict:
+        return dict(pending=len(self.__subscribe_buffer), dropped=self.__subscribe_dropped,
+                    max_size=self.__max_subscribe_queue_size, policy=self.__subscribe_policy.value)
+
+    def set_load_balancer(self, balancer: LoadBalancer):
+        """
+        This interface is used to connect to the endpoints of load balancer, and fail over to another endpoint
+        when the connection is broken.
+        """
+        if not isinstance(balancer, LoadBalancer):
+            raise SDKException(ErrorCode.param_err('a LoadBalancer object is required.'))
+        self.__url = balancer.urls[0]
+        self.__balancer = balancer
+
+    def get_load_balancer(self) -> LoadBalancer or None:
+        return self.__balancer
+
+    def set_endpoints(self, urls: List[str], strategy: BalanceStrategy = BalanceStrategy.EWMA, **kwargs):
+        self.set_load_balancer(LoadBalancer(urls, strategy, **kwargs))
+
+    def connect_to_test_net(self, is_balanced: bool = False):
+        if is_balanced:
+            self.set_endpoints(TEST_WS_ADDRESS)
+            return
         restful_address = choice(TEST_WS_ADDRESS)
         self.set_address(restful_address)
 
-    def connect_to_main_net(self):
+    def connect_to_main_net(self, is_balanced: bool = False):
+        if is_balanced:
+            self.set_endpoints(MAIN_WS_ADDRESS)
+            return
         restful_address = choice(MAIN_WS_ADDRESS)
         self.set_address(restful_address)
 
-    async def connect(self):
+    async def connect(self, excluded: List[str] = None):
+        if self.__balancer is None:
+            self.__ws_client = await self.__connect(self.__url)
+        else:
+            self.__ws_client = await self.__balancer.request_async(self.__connect, excluded=excluded)
+        if self.__is_multiplexed:
+            self.__reader_task = asyncio.ensure_future(self.__read_loop(self.__ws_client))
+        if self.__subscription is not None:
+            await self.__send_recv(dict(self.__subscription), False)
+
+    async def reconnect(self):
+        await self.close_connect()
+        await self.__ensure_connected()
+
+    @property
+    def is_connected(self) -> bool:
+        return self.__ws_client is not None and not self.__ws_client.closed
+
+    async def __connect(self, url: str):
         try:
-            self.__ws_client = await client.connect(self.__url)
+            ws_client = await client.connect(url)
         except ConnectionAbortedError as e:
             raise SDKException(ErrorCode.other_error(e.args[1])) from None
         except socket.gaierror as e:
             raise SDKException(ErrorCode.other_error(e.args[1])) from None
+        except OSError:
+            if self.__balancer is None:
+                raise
+            raise SDKException(ErrorCode.other_error(''.join(['ConnectionError: ', url]))) from None
+        self.__url = url
+        return ws_client
 
     async def close_connect(self):
         if isinstance(self.__ws_client, client.WebSocketClientProtocol) and not self.__ws_client.closed:
             await self.__ws_client.close()
+        if self.__reader_task is not None:
+            self.__reader_task.cancel()
+            self.__reader_task = None
+        self.__fail_pending(SDKException(ErrorCode.other_error('the connection has been closed.')))
+
+    async def __ensure_connected(self, excluded: List[str] = None):
+        if self.__ws_client is not None and not self.__ws_client.closed:
+            return
+        if self.__connect_lock is None:
+            self.__connect_lock = asyncio.Lock()
+        async with self.__connect_lock:
+            if self.__ws_client is None or self.__ws_client.closed:
+                await self.connect(excluded)
+
+    def __next_request_id(self) -> int:
+        self.__request_id += 1
+        return self.__request_id
+
+    def __get_subscribe_ready(self) -> asyncio.Event:
+        if self.__subscribe_ready is None:
+            self.__subscribe_ready = asyncio.Event()
+        return self.__subscribe_ready
+
+    def __get_subscribe_drained(self) -> asyncio.Event:
+        if self.__subscribe_drained is None:
+            self.__subscribe_drained = asyncio.Event()
+        return self.__subscribe_drained
+
+    def __is_subscribe_buffer_full(self) -> bool:
+        return 0 < self.__max_subscribe_queue_size <= len(self.__subscribe_buffer)
+
+    def __buffer_notify(self, response: dict):
+        if self.__is_subscribe_buffer_full() and self.__subscribe_policy != BackpressurePolicy.BLOCK:
+            self.__subscribe_buffer.popleft()
+            self.__subscribe_dropped += 1
+        self.__subscribe_buffer.append(response)
+        self.__get_subscribe_ready().set()
+
+    async def __wait_subscribe_drained(self):
+        drained = self.__get_subscribe_drained()
+        while self.__subscribe_policy == BackpressurePolicy.BLOCK and self.__is_subscribe_buffer_full() \
+                and len(self.__pending) == 0:
+            drained.clear()
+            await drained.wait()
+
+    def __fail_pending(self, error: Exception):
+        for _, future in self.__pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self.__pending.clear()
+
+    def __match_pending(self, response: dict):
+        request_id = response.get('Id')
+        if isinstance(request_id, (int, float)) and int(request_id) in self.__pending:
+            return self.__pending.pop(int(request_id))[1]
+        if response.get('Action') == 'Notify':
+            return None
+        matched_id_list = [pending_id for pending_id, (action, _) in self.__pending.items()
+                           if action == response.get('Action')]
+        if len(matched_id_list) != 1:
+            return None
+        return self.__pending.pop(matched_id_list[0])[1]
+
+    async def __read_loop(self, ws_client):
+        try:
+            async for message in ws_client:
+                response = json.loads(message)
+                future = self.__match_pending(response)
+                if future is None:
+                    self.__buffer_notify(response)
+                elif not future.done():
+                    future.set_result(response)
+                await self.__wait_subscribe_drained()
+            self.__fail_pending(ConnectionResetError('the connection has been closed.'))
+        except exceptions.ConnectionClosed as e:
+            self.__fail_pending(e)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.__fail_pending(e)
+            raise
+
+    async def __exchange(self, msg: dict) -> dict:
+        if not self.__is_multiplexed:
+            await self.__ws_client.send(json.dumps(msg))
+            return json.loads(await self.__ws_client.recv())
+        msg['Id'] = self.__next_request_id()
+        future = asyncio.get_event_loop().create_future()
+        self.__pending[msg['Id']] = (msg.get('Action'), future)
+        self.__get_subscribe_drained().set()
+        try:
+            await self.__ws_client.send(json.dumps(msg))
+            return await future
+        finally:
+            self.__pending.pop(msg['Id'], None)
 
     async def __send_recv(self, msg: dict, is_full: bool):
-        if self.__ws_client is None or self.__ws_client.closed:
-            await self.connect()
-        await self.__ws_client.send(json.dumps(msg))
-        response = await self.__ws_client.recv()
-        response = json.loads(response)
+        if self.__balancer is None:
+            await self.__ensure_connected()
+            response = await self.__exchange(msg)
+        else:
+            response = await self.__send_recv_with_failover(msg)
         if is_full:
             return response
         if response['Error'] != 0:
             raise SDKException(ErrorCode.other_error(response.get('Result', '')))
         return response.get('Result', dict())
 
+    async def __send_recv_with_failover(self, msg: dict) -> dict:
+        is_idempotent = msg.get('Action') != 'sendrawtransaction' or msg.get('PreExec') == '1'
+        failed = list()
+        for _ in range(self.__balancer.max_retries + 1 if is_idempotent else 1):
+            await self.__ensure_connected(failed)
+            ws_client = self.__ws_client
+            start = perf_counter()
+            try:
+                response = await self.__exchange(msg)
+            except (exceptions.ConnectionClosed, OSError):
+                self.__balancer.record_failure(self.__url, perf_counter() - start)
+                failed.append(self.__url)
+                if self.__ws_client is ws_client:
+                    await self.close_connect()
+                    self.__ws_client = None
+                continue
+            self.__balancer.record_success(self.__url, perf_counter() - start)
+            return response
+        raise SDKException(ErrorCode.other_error(''.join(['ConnectionError: ', self.__url])))
+
     async def send_heartbeat(self, is_full: bool = False):
         if self.__id == 0:
             self.__id = self.__generate_ws_id()
@@ -175,11 +403,21 @@ class WebsocketClient(object):
         msg = dict(Action='subscribe', Version='1.0.0', Id=self.__id, ConstractsFilter=contract_address_list,
                    SubscribeEvent=is_event, SubscribeJsonBlock=is_json_block, SubscribeRawBlock=is_raw_block,
                    SubscribeBlockTxHashs=is_tx_hash)
-        return await self.__send_recv(msg, is_full)
+        response = await self.__send_recv(dict(msg), is_full)
+        self.__subscription = msg
+        return response
 
     async def recv_subscribe_info(self, is_full: bool = False):
-        response = await self.__ws_client.recv()
-        response = json.loads(response)
+        if self.__is_multiplexed:
+            ready = self.__get_subscribe_ready()
+            while len(self.__subscribe_buffer) == 0:
+                ready.clear()
+                await ready.wait()
+            response = self.__subscribe_buffer.popleft()
+            self.__get_subscribe_drained().set()
+        else:
+            response = await self.__ws_client.recv()
+            response = json.loads(response)
         if is_full:
             return response
         if response['Error'] != 0:
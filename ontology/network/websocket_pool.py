@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+from typing import List
+from random import random
+
+from websockets import exceptions
+
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+from ontology.network.websocket import WebsocketClient, BackpressurePolicy
+from ontology.network.load_balancer import LoadBalancer
+
+
+class WebsocketPool(object):
+    """
+    A managed pool of multiplexed websocket connections.
+    Each connection is kept alive by periodic heartbeats, reconnected with exponential backoff when broken,
+    and re-subscribes the contracts previously passed to subscribe() after reconnecting.
+
+    :param url: a websocket address, or a list of websocket address to balance the connections over.
+    :param size: the number of connections.
+    :param heartbeat_interval: seconds between two heartbeats of a connection.
+    :param heartbeat_timeout: seconds to wait for the response of heartbeat.
+    :param reconnect_base_delay: the delay in seconds before the first reconnection.
+    :param reconnect_max_delay: the maximum delay in seconds between two reconnections.
+    :param max_subscribe_queue_size: the maximum number of subscription notifications buffered by the connection.
+    :param subscribe_policy: the backpressure policy of the subscription buffer, BLOCK or DROP_OLDEST.
+    """
+
+    def __init__(self, url: str or List[str], size: int = 4, heartbeat_interval: float = 30,
+                 heartbeat_timeout: float = 10, reconnect_base_delay: float = 1, reconnect_max_delay: float = 60,
+                 max_subscribe_queue_size: int = 1024, subscribe_policy: BackpressurePolicy = BackpressurePolicy.BLOCK):
+        if size <= 0:
+            raise SDKException(ErrorCode.param_err('the size of websocket pool should be greater than 0.'))
+        balancer = None
+        if isinstance(url, list):
+            balancer = LoadBalancer(url)
+        self.__clients = list()
+        for _ in range(size):
+            ws_client = WebsocketClient(is_multiplexed=True, max_subscribe_queue_size=max_subscribe_queue_size,
+                                        subscribe_policy=subscribe_policy)
+            if balancer is None:
+                ws_client.set_address(url)
+            else:
+                ws_client.set_load_balancer(balancer)
+            self.__clients.append(ws_client)
+        self.__heartbeat_interval = heartbeat_interval
+        self.__heartbeat_timeout = heartbeat_timeout
+        self.__reconnect_base_delay = reconnect_base_delay
+        self.__reconnect_max_delay = reconnect_max_delay
+        self.__cursor = 0
+        self.__reconnect_count = 0
+        self.__supervisor_tasks = list()
+
+    @property
+    def size(self) -> int:
+        return len(self.__clients)
+
+    @property
+    def reconnect_count(self) -> int:
+        return self.__reconnect_count
+
+    async def start(self):
+        """
+        This interface is used to connect every websocket and start the heartbeat of them.
+        """
+        if len(self.__supervisor_tasks) != 0:
+            return
+        await asyncio.gather(*[ws_client.connect() for ws_client in self.__clients])
+        self.__supervisor_tasks = [asyncio.ensure_future(self.__supervise(ws_client)) for ws_client in self.__clients]
+
+    async def close(self):
+        for task in self.__supervisor_tasks:
+            task.cancel()
+        self.__supervisor_tasks = list()
+        await asyncio.gather(*[ws_client.close_connect() for ws_client in self.__clients])
+
+    def get_client(self) -> WebsocketClient:
+        """
+        This interface is used to get a websocket client of pool by round-robin.
+        """
+        ws_client = self.__clients[self.__cursor % len(self.__clients)]
+        self.__cursor += 1
+        return ws_client
+
+    async def subscribe(self, contract_address_list: List[str] or str, is_event: bool = False,
+                        is_json_block: bool = False, is_raw_block: bool = False, is_tx_hash: bool = False,
+                        is_full: bool = False) -> dict:
+        """
+        This interface is used to subscribe on the first connection of pool, which is re-subscribed after reconnecting.
+        """
+        return await self.__clients[0].subscribe(contract_address_list, is_event, is_json_block, is_raw_block,
+                                                 is_tx_hash, is_full)
+
+    async def recv_subscribe_info(self, is_full: bool = False):
+        return await self.__clients[0].recv_subscribe_info(is_full)
+
+    def set_subscribe_buffer(self, max_size: int, policy: BackpressurePolicy = BackpressurePolicy.BLOCK):
+        """
+        This interface is used to bound the subscription buffer of the first connection, which receives the
+        notifications of pool.
+        """
+        self.__clients[0].set_subscribe_buffer(max_size, policy)
+
+    async def __is_alive(self, ws_client: WebsocketClient) -> bool:
+        if not ws_client.is_connected:
+            return False
+        try:
+            await asyncio.wait_for(ws_client.send_heartbeat(), self.__heartbeat_timeout)
+        except (SDKException, exceptions.ConnectionClosed, OSError, asyncio.TimeoutError):
+            return False
+        return True
+
+    async def __reconnect(self, ws_client: WebsocketClient):
+        attempt = 0
+        while True:
+            try:
+                await ws_client.reconnect()
+                self.__reconnect_count += 1
+                return
+            except (SDKException, exceptions.InvalidHandshake, OSError, asyncio.TimeoutError):
+                delay = min(self.__reconnect_base_delay * 2 ** attempt, self.__reconnect_max_delay)
+                await asyncio.sleep(delay * (0.5 + random() / 2))
+                attempt += 1
+
+    async def __supervise(self, ws_client: WebsocketClient):
+        check_interval = min(1.0, self.__heartbeat_interval)
+        elapsed = 0.0
+        while True:
+            await asyncio.sleep(check_interval)
+            elapsed += check_interval
+            if ws_client.is_connected and elapsed < self.__heartbeat_interval:
+                continue
+            elapsed = 0.0
+            if not await self.__is_alive(ws_client):
+                await self.__reconnect(ws_client)
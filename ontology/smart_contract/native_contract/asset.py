@@ -33,6 +33,12 @@ class Asset(object):
         else:
             raise SDKException(ErrorCode.other_error('asset is not equal to ONT or ONG.'))
 
+    def __query(self, key: tuple, query, is_permanent: bool = False):
+        cache = self.__sdk.rpc.get_query_cache()
+        if cache is None:
+            return query()
+        return cache.get_or_query((self.__sdk.rpc.get_address(),) + key, query, is_permanent)
+
     def query_balance(self, asset: str, b58_address: str) -> int:
         """
         This interface is used to query the account's ONT or ONG balance.
@@ -43,6 +49,10 @@ class Asset(object):
         """
         raw_address = Address.b58decode(b58_address).to_bytes()
         contract_address = self.get_asset_address(asset)
+        return self.__query(('balanceOf', contract_address, b58_address),
+                            lambda: self.__query_balance(contract_address, raw_address))
+
+    def __query_balance(self, contract_address: bytes, raw_address: bytes) -> int:
         invoke_code = build_native_invoke_code(contract_address, b'\x00', "balanceOf", raw_address)
         unix_time_now = int(time())
         version = 0
@@ -106,6 +116,9 @@ class Asset(object):
         :return: asset's name in the form of string.
         """
         contract_address = self.get_asset_address(asset)
+        return self.__query(('name', contract_address), lambda: self.__query_name(contract_address), True)
+
+    def __query_name(self, contract_address: bytes) -> str:
         method = 'name'
         invoke_code = build_native_invoke_code(contract_address, b'\x00', method, bytearray())
         unix_time_now = int(time())
@@ -129,6 +142,9 @@ class Asset(object):
         :return: asset's symbol in the form of string.
         """
         contract_address = self.get_asset_address(asset)
+        return self.__query(('symbol', contract_address), lambda: self.__query_symbol(contract_address), True)
+
+    def __query_symbol(self, contract_address: bytes) -> str:
         method = 'symbol'
         invoke_code = build_native_invoke_code(contract_address, b'\x00', method, bytearray())
         unix_time_now = int(time())
@@ -151,6 +167,9 @@ class Asset(object):
         :return: asset's decimals in the form of int
         """
         contract_address = self.get_asset_address(asset)
+        return self.__query(('decimals', contract_address), lambda: self.__query_decimals(contract_address), True)
+
+    def __query_decimals(self, contract_address: bytes) -> int:
         invoke_code = build_native_invoke_code(contract_address, b'\x00', 'decimals', bytearray())
         tx = Transaction(0, 0xd1, int(time()), 0, 0, None, invoke_code, bytearray(), list())
         response = self.__sdk.rpc.send_raw_transaction_pre_exec(tx)
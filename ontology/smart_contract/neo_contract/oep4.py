@@ -29,6 +29,13 @@ class Oep4(object):
         self.__hex_contract_address = hex_contract_address
 
     def __get_token_setting(self, func_name: str) -> str:
+        cache = self.__sdk.rpc.get_query_cache()
+        if cache is None:
+            return self.__query_token_setting(func_name)
+        return cache.get_or_query((self.__sdk.rpc.get_address(), func_name, self.__hex_contract_address),
+                                  lambda: self.__query_token_setting(func_name), True)
+
+    def __query_token_setting(self, func_name: str) -> str:
         func = InvokeFunction(func_name)
         res = self.__sdk.rpc.send_neo_vm_transaction(self.__hex_contract_address, None, None, 0, 0, func, True)
         return res.get('Result', '')
@@ -176,16 +183,20 @@ class Oep4(object):
         :return: the hexadecimal transaction hash value.
         """
         func = InvokeFunction('transferMulti')
-        for index, item in enumerate(transfer_list):
+        b58_address_list = list()
+        for item in transfer_list:
             Oep4.__b58_address_check(item[0])
             Oep4.__b58_address_check(item[1])
             if not isinstance(item[2], int):
                 raise SDKException(ErrorCode.param_err('the data type of value should be int.'))
             if item[2] < 0:
                 raise SDKException(ErrorCode.param_err('the value should be equal or great than 0.'))
-            from_address_array = Address.b58decode(item[0]).to_bytes()
-            to_address_array = Address.b58decode(item[1]).to_bytes()
-            transfer_list[index] = [from_address_array, to_address_array, item[2]]
+            b58_address_list.extend(item[0:2])
+        address_list, errors = Address.b58decode_many(b58_address_list)
+        if len(errors) != 0:
+            raise errors[min(errors)]
+        for index, item in enumerate(transfer_list):
+            transfer_list[index] = [address_list[2 * index].to_bytes(), address_list[2 * index + 1].to_bytes(), item[2]]
         for item in transfer_list:
             func.add_params_value(item)
         params = func.create_invoke_code()
@@ -200,8 +211,7 @@ class Oep4(object):
         payer_address = payer_acct.get_address().to_bytes()
         tx = Transaction(0, 0xd1, unix_time_now, gas_price, gas_limit, payer_address, params,
                          bytearray(), [])
-        for signer in signers:
-            tx.add_sign_transaction(signer)
+        tx.sign_batch(signers)
         tx_hash = self.__sdk.get_network().send_raw_transaction(tx)
         return tx_hash
 
@@ -9,7 +9,6 @@ from ontology.io.memory_stream import StreamManager
 from ontology.exception.error_code import ErrorCode
 from ontology.exception.exception import SDKException
 from ontology.smart_contract.neo_contract.abi.struct_type import Struct
-from ontology.smart_contract.neo_contract.abi.build_params import BuildParams
 
 
 def get_random_bytes(length: int) -> bytes:
@@ -126,6 +125,7 @@ def deserialize_hex(item_serialize: str):
 
 
 def deserialize_stack_item(reader: BinaryReader) -> dict:
+    from ontology.smart_contract.neo_contract.abi.build_params import BuildParams
     t = reader.read_byte()
     if t == BuildParams.Type.bytearray_type.value:
         b = reader.read_var_bytes()
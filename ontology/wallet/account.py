@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 from ontology.exception.error_code import ErrorCode
+from ontology.wallet.indexed_list import IndexedList
 from ontology.exception.exception import SDKException
 
 
@@ -47,7 +48,8 @@ class AccountData(object):
     def b58_address(self, b58_address: str):
         if not isinstance(b58_address, str):
             raise SDKException(ErrorCode.other_error('Invalid base58 encode address.'))
-        self.__b58_address = b58_address
+        old_b58_address, self.__b58_address = self.__b58_address, b58_address
+        IndexedList.notify_key_changed(self, 'b58_address', old_b58_address)
 
     @property
     def algorithm(self):
@@ -56,6 +58,7 @@ class AccountData(object):
     @algorithm.setter
     def algorithm(self, alg):
         self.__algorithm = alg
+        IndexedList.notify_changed(self)
 
     @property
     def enc_alg(self):
@@ -66,6 +69,7 @@ class AccountData(object):
         if not isinstance(enc_alg, str):
             raise SDKException(ErrorCode.other_error('Invalid encryption algorithm.'))
         self.__enc_alg = enc_alg
+        IndexedList.notify_changed(self)
 
     @property
     def is_default(self):
@@ -76,6 +80,7 @@ class AccountData(object):
         if not isinstance(is_default, bool):
             raise SDKException(ErrorCode.other_error('Invalid default account state.'))
         self.__is_default = is_default
+        IndexedList.notify_changed(self)
 
     @property
     def key(self):
@@ -86,6 +91,7 @@ class AccountData(object):
         if not isinstance(key, str):
             raise SDKException(ErrorCode.other_error('Invalid key type.'))
         self.__key = key
+        IndexedList.notify_changed(self)
 
     @property
     def label(self):
@@ -96,6 +102,7 @@ class AccountData(object):
         if not isinstance(label, str):
             raise SDKException(ErrorCode.other_error('Invalid label.'))
         self.__label = label
+        IndexedList.notify_changed(self)
 
     @property
     def lock(self):
@@ -106,6 +113,7 @@ class AccountData(object):
         if not isinstance(lock, bool):
             raise SDKException(ErrorCode.other_error('Invalid lock state.'))
         self.__lock = lock
+        IndexedList.notify_changed(self)
 
     @property
     def parameters(self):
@@ -116,6 +124,7 @@ class AccountData(object):
         if not isinstance(param, dict):
             raise SDKException(ErrorCode.other_error('Invalid parameters type.'))
         self.__parameters = param
+        IndexedList.notify_changed(self)
 
     @property
     def salt(self):
@@ -126,6 +135,7 @@ class AccountData(object):
         if not isinstance(salt, str):
             raise SDKException(ErrorCode.other_error('Invalid salt.'))
         self.__salt = salt
+        IndexedList.notify_changed(self)
 
     @property
     def public_key(self):
@@ -136,6 +146,7 @@ class AccountData(object):
         if not isinstance(pub_key, str):
             raise SDKException(ErrorCode.other_error('Invalid public key.'))
         self.__public_key = pub_key
+        IndexedList.notify_changed(self)
 
     @property
     def signature_scheme(self):
@@ -146,3 +157,4 @@ class AccountData(object):
         if not isinstance(sig_scheme, str):
             raise SDKException(ErrorCode.other_error('Invalid signature scheme.'))
         self.__signature_scheme = sig_scheme
+        IndexedList.notify_changed(self)
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import copy
+import json
+import mmap
+import struct
+import base64
+import binascii
+import hashlib
+
+from typing import Iterator
+
+from ontology.crypto.scrypt import Scrypt
+from ontology.common.address import Address
+from ontology.wallet.wallet import WalletData
+from ontology.account.account import Account
+from ontology.wallet.identity import Identity
+from ontology.wallet.account import AccountData
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+from ontology.crypto.signature_scheme import SignatureScheme
+from ontology.wallet.wallet_journal import WalletJournal
+
+
+class BinaryWallet(object):
+    """
+    A read-only wallet in the compact binary format, which is memory-mapped and accessed at random.
+
+    The file starts with an index header, which is followed by the wallet header in JSON, the account records,
+    the identity records, the key tables of accounts and identities, and a blob area. An account record has a fixed
+    width, in which the script hash of address, the encrypted key, the salt and the compressed public key are packed
+    in bytes, and the label and the fields which cannot be packed are stored in the blob area in JSON, along with
+    the names of absent fields if any, so that an absent field is distinguished from a null one. An identity
+    record refers to the identity in JSON in the blob area. A key table is sorted by the digests of keys, so that an
+    account or identity is found by binary search.
+
+    The conversion between the binary format and the standard JSON format is lossless.
+
+    :param wallet_path: the path of binary wallet file.
+    """
+    MAGIC = b'ONTWBIN\x01'
+    __HEADER = struct.Struct('<8sIIIQQQQQ')
+    __ACCOUNT = struct.Struct('<B20s48s16s33sQI')
+    __IDENTITY = struct.Struct('<QI')
+    __KEY = struct.Struct('<16sI')
+    __IS_DEFAULT, __LOCK = 0x01, 0x02
+    __PACKED_ADDRESS, __PACKED_KEY, __PACKED_SALT, __PACKED_PUBLIC_KEY = 0x04, 0x08, 0x10, 0x20
+    __PACKED_FIELDS = ('address', 'key', 'salt', 'publicKey', 'isDefault', 'lock')
+    __DEFAULT_FIELDS = (('algorithm', 'ECDSA'), ('enc-alg', 'aes-256-gcm'), ('parameters', dict(curve='P-256')),
+                        ('signatureScheme', 'SHA256withECDSA'))
+
+    def __init__(self, wallet_path: str):
+        if not os.path.isfile(wallet_path):
+            raise SDKException(ErrorCode.param_err('the wallet file does not exist.'))
+        with open(wallet_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < BinaryWallet.__HEADER.size:
+                raise SDKException(ErrorCode.other_error('invalid binary wallet file.'))
+            self.__map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = BinaryWallet.__HEADER.unpack_from(self.__map)
+        if header[0] != BinaryWallet.MAGIC:
+            self.close()
+            raise SDKException(ErrorCode.other_error('invalid binary wallet file.'))
+        header_len, self.__acct_count, self.__identity_count = header[1:4]
+        self.__acct_offset, self.__identity_offset, self.__acct_key_offset, self.__identity_key_offset, \
+            self.__blob_offset = header[4:]
+        header_end = BinaryWallet.__HEADER.size + header_len
+        self.__header = json.loads(self.__map[BinaryWallet.__HEADER.size:header_end].decode('utf-8'))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self.__map.close()
+
+    @staticmethod
+    def is_binary_wallet(wallet_path: str) -> bool:
+        with open(wallet_path, 'rb') as f:
+            return f.read(len(BinaryWallet.MAGIC)) == BinaryWallet.MAGIC
+
+    @staticmethod
+    def __get_digest(key: str) -> bytes:
+        return hashlib.sha256(key.encode('utf-8')).digest()[:16]
+
+    @staticmethod
+    def __unpack_b64(value, length: int) -> bytes or None:
+        if not isinstance(value, str):
+            return None
+        try:
+            data = base64.b64decode(value, validate=True)
+        except binascii.Error:
+            return None
+        if len(data) != length or base64.b64encode(data).decode('ascii') != value:
+            return None
+        return data
+
+    @staticmethod
+    def __unpack_hex(value, length: int) -> bytes or None:
+        if not isinstance(value, str) or len(value) != length * 2:
+            return None
+        try:
+            data = bytes.fromhex(value)
+        except ValueError:
+            return None
+        return data if data.hex() == value else None
+
+    @staticmethod
+    def __pack_account(dict_account: dict, address: Address or None, blob: list, blob_size: int) -> tuple:
+        flags = 0
+        extras = {key: value for key, value in dict_account.items() if key not in BinaryWallet.__PACKED_FIELDS}
+        absent_fields = list()
+        for key, value in BinaryWallet.__DEFAULT_FIELDS:
+            if key not in extras:
+                absent_fields.append(key)
+            elif extras[key] == value:
+                del extras[key]
+        script_hash = b''
+        if address is not None:
+            flags |= BinaryWallet.__PACKED_ADDRESS
+            script_hash = address.to_bytes()
+        else:
+            extras['address'] = dict_account['address']
+        key = BinaryWallet.__unpack_b64(dict_account.get('key'), 48)
+        salt = BinaryWallet.__unpack_b64(dict_account.get('salt'), 16)
+        public_key = BinaryWallet.__unpack_hex(dict_account.get('publicKey'), 33)
+        for field, flag, value in (('key', BinaryWallet.__PACKED_KEY, key), ('salt', BinaryWallet.__PACKED_SALT, salt),
+                                   ('publicKey', BinaryWallet.__PACKED_PUBLIC_KEY, public_key)):
+            if value is not None:
+                flags |= flag
+            elif field in dict_account:
+                extras[field] = dict_account[field]
+        for field, flag in (('isDefault', BinaryWallet.__IS_DEFAULT), ('lock', BinaryWallet.__LOCK)):
+            if field not in dict_account:
+                absent_fields.append(field)
+                continue
+            value = dict_account[field]
+            if value is True:
+                flags |= flag
+            elif value is not False:
+                extras[field] = value
+        extras = json.dumps(extras if len(absent_fields) == 0 else [extras, absent_fields]).encode('utf-8')
+        blob.append(extras)
+        record = BinaryWallet.__ACCOUNT.pack(flags, script_hash, key or b'', salt or b'', public_key or b'', blob_size,
+                                             len(extras))
+        return record, blob_size + len(extras)
+
+    @staticmethod
+    def dump(wallet: WalletData or dict, wallet_path: str):
+        """
+        This interface is used to write a wallet into a binary wallet file.
+
+        :param wallet: a WalletData object, or a wallet dict in the standard JSON format.
+        :param wallet_path: the path of binary wallet file.
+        """
+        wallet_dict = dict(wallet)
+        header = {key: value for key, value in wallet_dict.items() if key not in ('identities', 'accounts')}
+        header_bytes = json.dumps(header).encode('utf-8')
+        accounts = wallet_dict.get('accounts', list())
+        identities = wallet_dict.get('identities', list())
+        try:
+            # an address which is decoded successfully is in the canonical form, and is packed losslessly.
+            addresses, _ = Address.b58decode_many([dict_account['address'] for dict_account in accounts])
+            identity_keys = [dict_identity['ontid'] for dict_identity in identities]
+        except (KeyError, TypeError):
+            raise SDKException(ErrorCode.other_error('invalid wallet file.'))
+        blob, blob_size, acct_records, identity_records = list(), 0, list(), list()
+        for dict_account, address in zip(accounts, addresses):
+            record, blob_size = BinaryWallet.__pack_account(dict_account, address, blob, blob_size)
+            acct_records.append(record)
+        for dict_identity in identities:
+            content = json.dumps(dict_identity).encode('utf-8')
+            identity_records.append(BinaryWallet.__IDENTITY.pack(blob_size, len(content)))
+            blob.append(content)
+            blob_size += len(content)
+        key_tables = list()
+        for keys in ([dict_account['address'] for dict_account in accounts], identity_keys):
+            if not all(isinstance(key, str) for key in keys):
+                raise SDKException(ErrorCode.other_error('invalid wallet file.'))
+            digests = sorted((BinaryWallet.__get_digest(key), position) for position, key in enumerate(keys))
+            key_tables.append(b''.join(BinaryWallet.__KEY.pack(*digest) for digest in digests))
+        acct_offset = BinaryWallet.__HEADER.size + len(header_bytes)
+        identity_offset = acct_offset + BinaryWallet.__ACCOUNT.size * len(acct_records)
+        acct_key_offset = identity_offset + BinaryWallet.__IDENTITY.size * len(identity_records)
+        identity_key_offset = acct_key_offset + len(key_tables[0])
+        blob_offset = identity_key_offset + len(key_tables[1])
+        content = [BinaryWallet.__HEADER.pack(BinaryWallet.MAGIC, len(header_bytes), len(acct_records),
+                                              len(identity_records), acct_offset, identity_offset, acct_key_offset,
+                                              identity_key_offset, blob_offset), header_bytes]
+        content.extend(acct_records)
+        content.extend(identity_records)
+        content.extend(key_tables)
+        content.extend(blob)
+        WalletJournal.write_atomically(wallet_path, b''.join(content))
+
+    @staticmethod
+    def import_json(json_path: str, wallet_path: str):
+        """
+        This interface is used to convert a wallet file in the standard JSON format into a binary wallet file.
+
+        :param json_path: the path of wallet file in the standard JSON format.
+        :param wallet_path: the path of binary wallet file.
+        """
+        BinaryWallet.dump(WalletJournal.read_wallet_dict(json_path), wallet_path)
+
+    def export_json(self, json_path: str):
+        """
+        This interface is used to convert the binary wallet into a wallet file in the standard JSON format.
+
+        :param json_path: the path of wallet file in the standard JSON format.
+        """
+        WalletJournal.write_atomically(json_path, json.dumps(self.to_dict(), indent=4).encode('utf-8'))
+
+    def __read_blob(self, offset: int, length: int):
+        offset += self.__blob_offset
+        return json.loads(self.__map[offset:offset + length].decode('utf-8'))
+
+    def __read_account(self, position: int) -> dict:
+        flags, script_hash, key, salt, public_key, blob_offset, blob_len = BinaryWallet.__ACCOUNT.unpack_from(
+            self.__map, self.__acct_offset + position * BinaryWallet.__ACCOUNT.size)
+        dict_account = dict()
+        if flags & BinaryWallet.__PACKED_ADDRESS:
+            dict_account['address'] = Address(script_hash).b58encode()
+        for key_name, value in BinaryWallet.__DEFAULT_FIELDS:
+            dict_account[key_name] = copy.deepcopy(value)
+        dict_account['isDefault'] = flags & BinaryWallet.__IS_DEFAULT != 0
+        if flags & BinaryWallet.__PACKED_KEY:
+            dict_account['key'] = base64.b64encode(key).decode('ascii')
+        dict_account['lock'] = flags & BinaryWallet.__LOCK != 0
+        if flags & BinaryWallet.__PACKED_SALT:
+            dict_account['salt'] = base64.b64encode(salt).decode('ascii')
+        if flags & BinaryWallet.__PACKED_PUBLIC_KEY:
+            dict_account['publicKey'] = public_key.hex()
+        extras, absent_fields = self.__read_blob(blob_offset, blob_len), list()
+        if isinstance(extras, list):
+            extras, absent_fields = extras
+        for key_name in absent_fields:
+            dict_account.pop(key_name, None)
+        dict_account.update(extras)
+        return dict_account
+
+    def __read_identity(self, position: int) -> dict:
+        offset, length = BinaryWallet.__IDENTITY.unpack_from(
+            self.__map, self.__identity_offset + position * BinaryWallet.__IDENTITY.size)
+        return self.__read_blob(offset, length)
+
+    def __find(self, key: str, key_name: str, key_offset: int, count: int, read_item) -> dict or None:
+        digest = BinaryWallet.__get_digest(key)
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            if BinaryWallet.__KEY.unpack_from(self.__map, key_offset + middle * BinaryWallet.__KEY.size)[0] < digest:
+                low = middle + 1
+            else:
+                high = middle
+        while low < count:
+            key_digest, position = BinaryWallet.__KEY.unpack_from(self.__map,
+                                                                  key_offset + low * BinaryWallet.__KEY.size)
+            if key_digest != digest:
+                break
+            item = read_item(position)
+            if item.get(key_name) == key:
+                return item
+            low += 1
+        return None
+
+    @property
+    def name(self) -> str:
+        return self.__header.get('name', '')
+
+    @property
+    def version(self) -> str:
+        return self.__header.get('version', '')
+
+    @property
+    def create_time(self) -> str:
+        return self.__header.get('createTime', '')
+
+    @property
+    def default_ont_id(self) -> str:
+        return self.__header.get('defaultOntid', '')
+
+    @property
+    def default_account_address(self) -> str:
+        return self.__header.get('defaultAccountAddress', '')
+
+    @property
+    def scrypt(self) -> Scrypt:
+        scrypt_dict = self.__header.get('scrypt', dict())
+        return Scrypt(scrypt_dict.get('n', 16384), scrypt_dict.get('r', 8), scrypt_dict.get('p', 8),
+                      scrypt_dict.get('dk_len', 64))
+
+    @property
+    def account_count(self) -> int:
+        return self.__acct_count
+
+    @property
+    def identity_count(self) -> int:
+        return self.__identity_count
+
+    def get_account_data_by_index(self, index: int) -> AccountData:
+        if not 0 <= index < self.__acct_count:
+            raise SDKException(ErrorCode.param_err('the index of account is out of range.'))
+        return WalletData.parse_account(self.__read_account(index))
+
+    def get_identity_by_index(self, index: int) -> Identity:
+        if not 0 <= index < self.__identity_count:
+            raise SDKException(ErrorCode.param_err('the index of identity is out of range.'))
+        return WalletData.parse_identity(self.__read_identity(index))
+
+    def get_account_data_by_b58_address(self, b58_address: str) -> AccountData:
+        """
+        This interface is used to get the AccountData object of an account in binary wallet.
+
+        :param b58_address: a base58 encode address.
+        :return: an AccountData object.
+        """
+        dict_account = self.__find(b58_address, 'address', self.__acct_key_offset, self.__acct_count,
+                                   self.__read_account)
+        if dict_account is None:
+            raise SDKException(ErrorCode.other_error(f'Get account {b58_address} failed.'))
+        return WalletData.parse_account(dict_account)
+
+    def get_identity_by_ont_id(self, ont_id: str) -> Identity:
+        """
+        This interface is used to get the Identity object of an identity in binary wallet.
+
+        :param ont_id: OntId.
+        :return: an Identity object.
+        """
+        dict_identity = self.__find(ont_id, 'ontid', self.__identity_key_offset, self.__identity_count,
+                                    self.__read_identity)
+        if dict_identity is None:
+            raise SDKException(ErrorCode.other_error(f'Get identity {ont_id} failed.'))
+        return WalletData.parse_identity(dict_identity)
+
+    def get_default_account_data(self) -> AccountData:
+        """
+        This interface is used to get the default account in binary wallet.
+        """
+        if self.default_account_address != '':
+            return self.get_account_data_by_b58_address(self.default_account_address)
+        for acct in self.iter_accounts():
+            if acct.is_default:
+                return acct
+        raise SDKException(ErrorCode.get_default_account_err)
+
+    def get_account_by_b58_address(self, b58_address: str, password: str,
+                                   scheme: SignatureScheme = SignatureScheme.SHA256withECDSA) -> Account:
+        """
+        This interface is used to decrypt the private key of an account in binary wallet.
+
+        :param b58_address: a base58 encode address.
+        :param password: a password which is used to decrypt the encrypted private key.
+        :param scheme: the signature scheme of account.
+        :return: an Account object.
+        """
+        acct = self.get_account_data_by_b58_address(b58_address)
+        salt = base64.b64decode(acct.salt)
+        private_key = Account.get_gcm_decoded_private_key(acct.key, password, b58_address, salt, self.scrypt.n, scheme)
+        return Account(private_key, scheme)
+
+    def iter_accounts(self) -> Iterator[AccountData]:
+        for position in range(self.__acct_count):
+            yield WalletData.parse_account(self.__read_account(position))
+
+    def iter_identities(self) -> Iterator[Identity]:
+        for position in range(self.__identity_count):
+            yield WalletData.parse_identity(self.__read_identity(position))
+
+    def to_dict(self) -> dict:
+        """
+        This interface is used to get the wallet dict in the standard JSON format.
+        """
+        wallet_dict = dict(self.__header)
+        wallet_dict['identities'] = [self.__read_identity(position) for position in range(self.__identity_count)]
+        wallet_dict['accounts'] = [self.__read_account(position) for position in range(self.__acct_count)]
+        return wallet_dict
+
+    def to_wallet_data(self) -> WalletData:
+        """
+        This interface is used to materialize the whole wallet.
+        """
+        return WalletData(self.name, self.version, self.create_time, self.default_ont_id, self.default_account_address,
+                          self.scrypt, list(self.iter_identities()), list(self.iter_accounts()))
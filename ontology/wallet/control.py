@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 from ontology.exception.error_code import ErrorCode
+from ontology.wallet.indexed_list import IndexedList
 from ontology.exception.exception import SDKException
 
 
@@ -22,6 +23,10 @@ class Control(object):
         self.__salt = salt
         self.__public_key = public_key
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        IndexedList.notify_changed(self)
+
     def __iter__(self):
         data = dict()
         data['address'] = self.__address
@@ -44,7 +49,8 @@ class Control(object):
     def kid(self, kid: str):
         if not isinstance(kid, str):
             raise SDKException(ErrorCode.require_str_params)
-        self.__kid = kid
+        old_kid, self.__kid = self.__kid, kid
+        IndexedList.notify_key_changed(self, 'kid', old_kid)
 
     @property
     def key(self):
@@ -64,7 +70,8 @@ class Control(object):
     def b58_address(self, b58_address: str):
         if not isinstance(b58_address, str):
             raise SDKException(ErrorCode.require_str_params)
-        self.__address = b58_address
+        old_b58_address, self.__address = self.__address, b58_address
+        IndexedList.notify_key_changed(self, 'b58_address', old_b58_address)
 
     @property
     def public_key(self):
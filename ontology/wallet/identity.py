@@ -6,6 +6,7 @@ from typing import List
 from ontology.common.define import DID_ONT
 from ontology.wallet.control import Control
 from ontology.exception.error_code import ErrorCode
+from ontology.wallet.indexed_list import IndexedList
 from ontology.exception.exception import SDKException
 
 
@@ -21,9 +22,13 @@ class Identity(object):
         self.__ont_id = ont_id
         self.label = label
         self.lock = lock
-        self.__controls = controls
+        self.__controls = IndexedList(controls, 'kid', 'b58_address', parent=self)
         self.is_default = is_default
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        IndexedList.notify_changed(self)
+
     def __iter__(self):
         data = dict()
         data['ontid'] = self.__ont_id
@@ -46,7 +51,8 @@ class Identity(object):
             raise SDKException(ErrorCode.require_str_params)
         if len(ont_id) != 0 and not ont_id.startswith(DID_ONT):
             raise SDKException(ErrorCode.invalid_ont_id_format(ont_id))
-        self.__ont_id = ont_id
+        old_ont_id, self.__ont_id = self.__ont_id, ont_id
+        IndexedList.notify_key_changed(self, 'ont_id', old_ont_id)
 
     @property
     def controls(self):
@@ -59,7 +65,7 @@ class Identity(object):
         for ctrl in ctrl_lst:
             if not isinstance(ctrl, Control):
                 raise SDKException(ErrorCode.require_control_params)
-        self.__controls = ctrl_lst
+        self.__controls = IndexedList(ctrl_lst, 'kid', 'b58_address', parent=self)
 
     def add_control(self, ctrl: Control):
         if not isinstance(ctrl, Control):
@@ -68,3 +74,19 @@ class Identity(object):
         index += 1
         ctrl.kid = f'keys-{index}'
         self.__controls.append(ctrl)
+
+    def get_control_by_kid(self, kid: str) -> Control or None:
+        """
+        This interface is used to get a control by its kid, e.g. keys-1.
+
+        :return: a Control object, or None if there is no such control.
+        """
+        return self.__controls.find('kid', kid)
+
+    def get_control_by_b58_address(self, b58_address: str) -> Control or None:
+        """
+        This interface is used to get a control by its base58 encode address.
+
+        :return: a Control object, or None if there is no such control.
+        """
+        return self.__controls.find('b58_address', b58_address)
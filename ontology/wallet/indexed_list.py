@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import weakref
+
+from typing import Iterable
+
+
+class _OwnerRefs(list):
+    """
+    The weak references to the lists holding an item, which are neither copied nor pickled with the item.
+    """
+
+    def __reduce_ex__(self, protocol):
+        return self.__class__, ()
+
+
+class IndexedList(list):
+    """
+    A list of wallet items, e.g. accounts, identities and controls, with a hash index on each key attribute,
+    so that an item can be found by its key in constant time.
+
+    The indexes are maintained when items are added or removed. Changing the key of an item which has been added,
+    e.g. setting the b58_address of an AccountData, should call IndexedList.notify_key_changed(), which re-keys the
+    item in the lists holding it. If several items have the same key, the first one is found, which is the same as
+    a linear scan.
+
+    The list also tracks the items added, changed or removed since reset_changes(), so that a wallet journal only
+    serializes the changed items. Changing any attribute of an item which has been added should call
+    IndexedList.notify_changed(), which is done by the setters of wallet items. Moving items, e.g. insert or sort,
+    is tracked as a reorder. If a parent is given, e.g. the identity which holds a list of controls, a change in the
+    list is also a change of the parent.
+
+    :param items: the initial items.
+    :param key_attrs: the names of the key attributes to index, the first one is the key of tracked changes.
+    :param parent: the item which holds this list.
+    """
+
+    def __init__(self, items: Iterable = (), *key_attrs: str, parent=None):
+        super().__init__(items)
+        self.__key_attrs = key_attrs
+        self.__parent = parent
+        self.reset_changes()
+        self.__is_reordered = True
+        self.__rebuild()
+
+    def __reduce_ex__(self, protocol):
+        return self.__class__, (list(self),) + self.__key_attrs, dict(_IndexedList__parent=self.__parent)
+
+    @staticmethod
+    def notify_changed(item):
+        """
+        This interface is used to track a change of an item in the lists holding it.
+
+        :param item: the changed item.
+        """
+        for owner_ref in item.__dict__.get('_IndexedList__owners', ()):
+            owner = owner_ref()
+            if owner is not None:
+                owner.__track_changed(item)
+
+    def get_changes(self) -> tuple or None:
+        """
+        This interface is used to get the changes since reset_changes().
+
+        :return: a tuple of the added items, the changed items and the keys of removed items in order,
+            or None if the list has been reordered.
+        """
+        if self.__is_reordered:
+            return None
+        return list(self.__added.values()), list(self.__changed.values()), list(self.__removed_keys)
+
+    def reset_changes(self):
+        """
+        This interface is used to clear the tracked changes, e.g. after the list has been saved.
+        """
+        self.__added = dict()
+        self.__changed = dict()
+        self.__removed_keys = list()
+        self.__is_reordered = False
+
+    def __notify_parent(self):
+        if self.__parent is not None:
+            IndexedList.notify_changed(self.__parent)
+
+    def __track_reordered(self):
+        self.__is_reordered = True
+        self.__notify_parent()
+
+    def __track_added(self, items: list):
+        for item in items:
+            self.__changed.pop(id(item), None)
+            self.__added.pop(id(item), None)
+            self.__added[id(item)] = item
+        self.__notify_parent()
+
+    def __track_removed(self, item):
+        if len(self.__key_attrs) == 0 or self.__is_duplicated or self.__is_dirty:
+            self.__track_reordered()
+            return
+        if self.__added.pop(id(item), None) is None:
+            self.__changed.pop(id(item), None)
+            self.__removed_keys.append(getattr(item, self.__key_attrs[0]))
+        owner_refs = getattr(item, '_IndexedList__owners', list())
+        owner_refs[:] = [owner_ref for owner_ref in owner_refs if owner_ref() not in (None, self)]
+        self.__notify_parent()
+
+    def __track_changed(self, item):
+        if self.__is_reordered or id(item) in self.__added or id(item) in self.__changed:
+            self.__notify_parent()
+            return
+        if self.__is_dirty or self.__is_duplicated:
+            self.__is_reordered = True
+        elif self.__indexes[self.__key_attrs[0]].get(getattr(item, self.__key_attrs[0])) is item:
+            self.__changed[id(item)] = item
+        else:
+            return
+        self.__notify_parent()
+
+    @staticmethod
+    def notify_key_changed(item, key_attr: str, old_key):
+        """
+        This interface is used to re-key an item in the lists holding it after its key attribute has been changed.
+
+        :param item: the changed item.
+        :param key_attr: the name of the changed key attribute.
+        :param old_key: the value of key before changing.
+        """
+        for owner_ref in getattr(item, '_IndexedList__owners', ()):
+            owner = owner_ref()
+            if owner is not None:
+                owner.__rekey(item, key_attr, old_key)
+
+    def __rebuild(self):
+        self.__indexes = {key_attr: dict() for key_attr in self.__key_attrs}
+        self.__is_duplicated = False
+        self.__is_dirty = False
+        self.__index_items(self)
+
+    def __own(self, item):
+        try:
+            owner_refs = item.__owners
+        except AttributeError:
+            owner_refs = item.__owners = _OwnerRefs()
+        owner_refs[:] = [owner_ref for owner_ref in owner_refs if owner_ref() is not None]
+        if not any(owner_ref() is self for owner_ref in owner_refs):
+            owner_refs.append(weakref.ref(self))
+
+    def __index_items(self, items: Iterable):
+        if len(self.__indexes) == 0:
+            return
+        for item in items:
+            self.__own(item)
+            for key_attr, index in self.__indexes.items():
+                if index.setdefault(getattr(item, key_attr), item) is not item:
+                    self.__is_duplicated = True
+
+    def __rekey(self, item, key_attr: str, old_key):
+        index = self.__indexes.get(key_attr)
+        if index is None:
+            return
+        if self.__is_dirty:
+            self.__track_reordered()
+            return
+        if self.__is_duplicated:
+            self.__is_dirty = True
+            self.__track_reordered()
+            return
+        if index.get(old_key) is not item:
+            return
+        if key_attr == self.__key_attrs[0]:
+            self.__track_reordered()
+        del index[old_key]
+        if index.setdefault(getattr(item, key_attr), item) is not item:
+            self.__is_dirty = True
+
+    def __unindex_item(self, item):
+        if self.__is_duplicated:
+            self.__is_dirty = True
+            return
+        for key_attr, index in self.__indexes.items():
+            key = getattr(item, key_attr)
+            if index.get(key) is item:
+                del index[key]
+            else:
+                self.__is_dirty = True
+
+    def find(self, key_attr: str, key):
+        """
+        This interface is used to find the first item whose key attribute equals to key.
+
+        :param key_attr: the name of an indexed key attribute.
+        :param key: the value of key.
+        :return: the item, or None if there is no such item.
+        """
+        if self.__is_dirty:
+            self.__rebuild()
+        item = self.__indexes[key_attr].get(key)
+        if item is not None and getattr(item, key_attr) != key:
+            self.__rebuild()
+            item = self.__indexes[key_attr].get(key)
+        return item
+
+    def append(self, item):
+        super().append(item)
+        self.__index_items((item,))
+        self.__track_added([item])
+
+    def extend(self, items: Iterable):
+        items = list(items)
+        super().extend(items)
+        self.__index_items(items)
+        self.__track_added(items)
+
+    def __iadd__(self, items: Iterable):
+        self.extend(items)
+        return self
+
+    def remove(self, item):
+        super().remove(item)
+        self.__unindex_item(item)
+        self.__track_removed(item)
+
+    def pop(self, index: int = -1):
+        item = super().pop(index)
+        self.__unindex_item(item)
+        self.__track_removed(item)
+        return item
+
+    def clear(self):
+        super().clear()
+        self.__rebuild()
+        self.__track_reordered()
+
+    def insert(self, index: int, item):
+        super().insert(index, item)
+        self.__is_dirty = True
+        self.__track_reordered()
+
+    def __setitem__(self, index, item):
+        super().__setitem__(index, item)
+        self.__is_dirty = True
+        self.__track_reordered()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self.__is_dirty = True
+        self.__track_reordered()
+
+    def __imul__(self, value: int):
+        result = super().__imul__(value)
+        self.__is_dirty = True
+        self.__track_reordered()
+        return result
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self.__is_dirty = True
+        self.__track_reordered()
+
+    def reverse(self):
+        super().reverse()
+        self.__is_dirty = True
+        self.__track_reordered()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import hmac
+import threading
+
+from hashlib import sha256
+from time import monotonic
+from collections import OrderedDict
+
+from ontology.account.account import Account
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+
+
+class UnlockedAccountCache(object):
+    """
+    A session cache of the unlocked wallet accounts, which avoids running scrypt to decrypt the same private key
+    again and again.
+
+    An unlocked account is locked again when it is older than ttl seconds, when it has not been used for idle_timeout
+    seconds, or when it is evicted as the least recently used one. The password is never kept, a cached account is
+    only returned for the password which has unlocked it.
+
+    The same Account object is returned until it is locked, so no copy of the private key is made per access. Locking
+    only drops the reference held by the cache: an Account keeps its private key in immutable bytes and in the key
+    object of crypto library, neither of which can be overwritten, so the key stays in memory until the Account is
+    garbage collected. Callers should not keep the returned Account longer than they need it.
+
+    :param ttl: the maximum time in seconds for an account to keep unlocked.
+    :param idle_timeout: the maximum time in seconds for an account to keep unlocked without being used.
+    :param max_size: the maximum number of unlocked accounts.
+    """
+
+    def __init__(self, ttl: float = 300, idle_timeout: float = 60, max_size: int = 256):
+        if ttl <= 0 or idle_timeout <= 0:
+            raise SDKException(ErrorCode.param_err('the ttl and idle timeout should be greater than 0.'))
+        if max_size <= 0:
+            raise SDKException(ErrorCode.param_err('the max size of unlock cache should be greater than 0.'))
+        self.__ttl = ttl
+        self.__idle_timeout = idle_timeout
+        self.__max_size = max_size
+        self.__secret = os.urandom(32)
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __contains__(self, b58_address: str):
+        with self.__lock:
+            self.__evict_expired(monotonic())
+            return b58_address in self.__entries
+
+    def __get_verifier(self, encrypted_key: str, password: str) -> bytes:
+        msg = b''.join([encrypted_key.encode('utf-8'), b'\x00', password.encode('utf-8')])
+        return hmac.new(self.__secret, msg, sha256).digest()
+
+    def __evict(self, b58_address: str):
+        self.__entries.pop(b58_address, None)
+
+    def __evict_expired(self, now: float):
+        expired = [b58_address for b58_address, entry in self.__entries.items() if
+                   now - entry[2] >= self.__ttl or now - entry[3] >= self.__idle_timeout]
+        for b58_address in expired:
+            self.__evict(b58_address)
+
+    def get(self, b58_address: str, encrypted_key: str, password: str) -> Account or None:
+        """
+        This interface is used to get an unlocked account.
+
+        :param b58_address: the base58 encode address of account.
+        :param encrypted_key: the encrypted private key of account in wallet.
+        :param password: the password which is used to decrypt the encrypted private key.
+        :return: an Account object, or None if the account is not unlocked by the same encrypted key and password.
+        """
+        verifier = self.__get_verifier(encrypted_key, password)
+        with self.__lock:
+            now = monotonic()
+            self.__evict_expired(now)
+            entry = self.__entries.get(b58_address)
+            if entry is None or not hmac.compare_digest(entry[1], verifier):
+                self.__misses += 1
+                return None
+            entry[3] = now
+            self.__entries.move_to_end(b58_address)
+            self.__hits += 1
+            return entry[0]
+
+    def put(self, b58_address: str, encrypted_key: str, password: str, account: Account):
+        """
+        This interface is used to keep an account unlocked.
+
+        :param b58_address: the base58 encode address of account.
+        :param encrypted_key: the encrypted private key of account in wallet.
+        :param password: the password which has been used to decrypt the encrypted private key.
+        :param account: the decrypted Account object.
+        """
+        verifier = self.__get_verifier(encrypted_key, password)
+        with self.__lock:
+            now = monotonic()
+            self.__evict(b58_address)
+            self.__entries[b58_address] = [account, verifier, now, now]
+            while len(self.__entries) > self.__max_size:
+                self.__evict(next(iter(self.__entries)))
+
+    def lock(self, b58_address: str = ''):
+        """
+        This interface is used to lock an account, or all accounts if b58_address is empty.
+        """
+        with self.__lock:
+            if len(b58_address) != 0:
+                self.__evict(b58_address)
+                return
+            self.__entries.clear()
+
+    def evict_expired(self):
+        """
+        This interface is used to lock the expired accounts immediately, instead of on the next access.
+        """
+        with self.__lock:
+            self.__evict_expired(monotonic())
+
+    def get_statistics(self) -> dict:
+        with self.__lock:
+            return dict(hits=self.__hits, misses=self.__misses, size=len(self.__entries))
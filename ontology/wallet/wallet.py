@@ -9,6 +9,7 @@ from ontology.wallet.control import Control
 from ontology.wallet.identity import Identity
 from ontology.wallet.account import AccountData
 from ontology.exception.error_code import ErrorCode
+from ontology.wallet.indexed_list import IndexedList
 from ontology.exception.exception import SDKException
 
 
@@ -32,47 +33,65 @@ class WalletData(object):
         self.accounts = list()
         for dict_identity in identities:
             if isinstance(dict_identity, dict):
-                list_controls = list()
-                is_default = dict_identity.get('isDefault', False)
-                for ctrl_data in dict_identity['controls']:
-                    hash_value = ctrl_data.get('hash', 'sha256')
-                    public_key = ctrl_data.get('publicKey', '')
-                    try:
-                        ctrl = Control(kid=ctrl_data['id'], address=ctrl_data['address'], enc_alg=ctrl_data['enc-alg'],
-                                       key=ctrl_data['key'], algorithm=ctrl_data['algorithm'], salt=ctrl_data['salt'],
-                                       param=ctrl_data['parameters'], hash_value=hash_value, public_key=public_key)
-                    except KeyError:
-                        raise SDKException(ErrorCode.other_error('invalid parameters.'))
-                    list_controls.append(ctrl)
-                try:
-                    identity = Identity(ont_id=dict_identity['ontid'], label=dict_identity['label'],
-                                        lock=dict_identity['lock'], controls=list_controls, is_default=is_default)
-                except KeyError:
-                    raise SDKException(ErrorCode.other_error('invalid parameters.'))
-                self.identities.append(identity)
+                self.identities.append(WalletData.parse_identity(dict_identity))
             else:
                 self.identities = identities
                 break
         for dict_account in accounts:
             if isinstance(dict_account, dict):
-                try:
-                    public_key = dict_account['publicKey']
-                except KeyError:
-                    public_key = ''
-                try:
-                    acct = AccountData(b58_address=dict_account['address'], enc_alg=dict_account['enc-alg'],
-                                       key=dict_account['key'], algorithm=dict_account['algorithm'],
-                                       salt=dict_account['salt'], param=dict_account['parameters'],
-                                       label=dict_account['label'], public_key=public_key,
-                                       sig_scheme=dict_account['signatureScheme'],
-                                       is_default=dict_account['isDefault'], lock=dict_account['lock'])
-                except KeyError:
-                    raise SDKException(ErrorCode.param_error)
-                self.accounts.append(acct)
+                self.accounts.append(WalletData.parse_account(dict_account))
             else:
                 self.accounts = accounts
                 break
 
+    @staticmethod
+    def parse_identity(dict_identity: dict) -> Identity:
+        """
+        This interface is used to create an Identity object from an identity in wallet file.
+        """
+        list_controls = list()
+        is_default = dict_identity.get('isDefault', False)
+        for ctrl_data in dict_identity['controls']:
+            hash_value = ctrl_data.get('hash', 'sha256')
+            public_key = ctrl_data.get('publicKey', '')
+            try:
+                ctrl = Control(kid=ctrl_data['id'], address=ctrl_data['address'], enc_alg=ctrl_data['enc-alg'],
+                               key=ctrl_data['key'], algorithm=ctrl_data['algorithm'], salt=ctrl_data['salt'],
+                               param=ctrl_data['parameters'], hash_value=hash_value, public_key=public_key)
+            except KeyError:
+                raise SDKException(ErrorCode.other_error('invalid parameters.'))
+            list_controls.append(ctrl)
+        try:
+            return Identity(ont_id=dict_identity['ontid'], label=dict_identity['label'], lock=dict_identity['lock'],
+                            controls=list_controls, is_default=is_default)
+        except KeyError:
+            raise SDKException(ErrorCode.other_error('invalid parameters.'))
+
+    @staticmethod
+    def parse_account(dict_account: dict) -> AccountData:
+        """
+        This interface is used to create an AccountData object from an account in wallet file.
+        """
+        try:
+            public_key = dict_account['publicKey']
+        except KeyError:
+            public_key = ''
+        try:
+            return AccountData(b58_address=dict_account['address'], enc_alg=dict_account['enc-alg'],
+                               key=dict_account['key'], algorithm=dict_account['algorithm'], salt=dict_account['salt'],
+                               param=dict_account['parameters'], label=dict_account['label'], public_key=public_key,
+                               sig_scheme=dict_account['signatureScheme'], is_default=dict_account['isDefault'],
+                               lock=dict_account['lock'])
+        except KeyError:
+            raise SDKException(ErrorCode.param_error)
+
+    def __setattr__(self, name, value):
+        if name == 'accounts' and not isinstance(value, IndexedList):
+            value = IndexedList(value, 'b58_address')
+        elif name == 'identities' and not isinstance(value, IndexedList):
+            value = IndexedList(value, 'ont_id')
+        super().__setattr__(name, value)
+
     def __iter__(self):
         data = dict()
         data['name'] = self.name
@@ -125,8 +144,7 @@ class WalletData(object):
         """
         if index >= len(self.accounts):
             raise SDKException(ErrorCode.param_error)
-        for acct in self.accounts:
-            acct.is_default = False
+        self.__clear_default_account()
         self.accounts[index].is_default = True
         self.default_account_address = self.accounts[index].b58_address
 
@@ -136,20 +154,18 @@ class WalletData(object):
 
         :param b58_address: a base58 encode address.
         """
-        flag = True
-        index = -1
-        for acct in self.accounts:
-            index += 1
-            if acct.b58_address == b58_address:
-                flag = False
-                break
-        if flag:
+        account = self.accounts.find('b58_address', b58_address)
+        if account is None:
             raise SDKException(ErrorCode.get_account_by_address_err)
-        for i in range(len(self.accounts)):
-            self.accounts[i].is_default = False
-        self.accounts[index].is_default = True
+        self.__clear_default_account()
+        account.is_default = True
         self.default_account_address = b58_address
 
+    def __clear_default_account(self):
+        for acct in self.accounts:
+            if acct.is_default:
+                acct.is_default = False
+
     def get_default_account_address(self) -> str:
         """
         This interface is used to get the default account's base58 encode address in WalletManager.
@@ -164,10 +180,10 @@ class WalletData(object):
         return self.accounts[index]
 
     def get_account_by_b58_address(self, b58_address: str) -> AccountData:
-        for acct in self.accounts:
-            if acct.b58_address == b58_address:
-                return acct
-        raise SDKException(ErrorCode.other_error('Get account failed.'))
+        acct = self.accounts.find('b58_address', b58_address)
+        if acct is None:
+            raise SDKException(ErrorCode.other_error('Get account failed.'))
+        return acct
 
     def set_identities(self, identities: list):
         if not isinstance(identities, list):
@@ -181,15 +197,14 @@ class WalletData(object):
         self.identities = list()
 
     def add_identity(self, identity: Identity):
-        for item in self.identities:
-            if item.ont_id == identity.ont_id:
-                raise SDKException(ErrorCode.other_error('add identity failed, OntId conflict.'))
+        if self.identities.find('ont_id', identity.ont_id) is not None:
+            raise SDKException(ErrorCode.other_error('add identity failed, OntId conflict.'))
         self.identities.append(identity)
 
     def __create_identity(self, ont_id: str):
-        for item in self.identities:
-            if item.ont_id == ont_id:
-                return item
+        identity = self.identities.find('ont_id', ont_id)
+        if identity is not None:
+            return identity
         identity = Identity(ont_id=ont_id)
         self.identities.append(identity)
         return identity
@@ -215,17 +230,29 @@ class WalletData(object):
         return identity
 
     def remove_identity(self, ont_id):
-        for identity in self.identities:
-            if identity.ont_id == ont_id:
-                self.identities.remove(identity)
-                return
-        raise SDKException(ErrorCode.param_error)
+        identity = self.identities.find('ont_id', ont_id)
+        if identity is None:
+            raise SDKException(ErrorCode.param_error)
+        self.identities.remove(identity)
 
     def get_identity_by_ont_id(self, ont_id: str) -> Identity:
-        for identity in self.identities:
-            if identity.ont_id == ont_id:
-                return identity
-        raise SDKException(ErrorCode.other_error('Get identity failed.'))
+        identity = self.identities.find('ont_id', ont_id)
+        if identity is None:
+            raise SDKException(ErrorCode.other_error('Get identity failed.'))
+        return identity
+
+    def get_control_by_kid(self, kid: str) -> Control:
+        """
+        This interface is used to get a control by its full kid, e.g. did:ont:AazEvfQPcQ2GEFFPLF1ZLwQ7K5jDn81hve#keys-1.
+
+        :param kid: an OntId and the kid of control joined by '#'.
+        :return: a Control object.
+        """
+        ont_id, _, ctrl_kid = kid.partition('#')
+        ctrl = self.get_identity_by_ont_id(ont_id).get_control_by_kid(ctrl_kid)
+        if ctrl is None:
+            raise SDKException(ErrorCode.other_error('Get control failed.'))
+        return ctrl
 
     def set_default_identity_by_index(self, index: int):
         """
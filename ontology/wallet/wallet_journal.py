@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import stat
+import codecs
+import tempfile
+
+from typing import Iterator
+from collections import OrderedDict
+
+from ontology.wallet.wallet import WalletData
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+
+
+class WalletJournal(object):
+    """
+    An append-only journal of the changes of a wallet file, which avoids rewriting the whole wallet on every save.
+
+    The wallet file is kept in the standard JSON format. Each save appends one line into the journal file next to it,
+    which only contains the accounts and identities changed since the last save, and is flushed to disk by fsync once.
+    When the number of journal records reaches compact_threshold, or when the changes cannot be journaled, e.g. the
+    accounts have been reordered, the journal is compacted into the wallet file, which is written into a temporary file
+    and then renamed, so that the wallet file is always complete.
+
+    After the first save of a WalletData object, its accounts and identities are not serialized again, only the items
+    tracked as added, changed or removed by IndexedList are journaled. The attributes of items should be set rather
+    than modified in place, e.g. replacing the parameters dict of an account, for the change to be tracked. A torn
+    record at the end of the journal, which is left by a crash during saving, is truncated on loading.
+
+    :param compact_threshold: the number of journal records which triggers a compaction.
+    """
+
+    def __init__(self, compact_threshold: int = 1000):
+        if compact_threshold <= 0:
+            raise SDKException(ErrorCode.param_err('the compact threshold should be greater than 0.'))
+        self.__compact_threshold = compact_threshold
+        self.__header = dict()
+        self.__accounts = OrderedDict()
+        self.__identities = OrderedDict()
+        self.__is_duplicated = False
+        self.__record_count = 0
+        self.__tracked = None
+
+    @property
+    def record_count(self) -> int:
+        return self.__record_count
+
+    @staticmethod
+    def get_journal_path(wallet_path: str) -> str:
+        return wallet_path + '.journal'
+
+    @staticmethod
+    def read_wallet_dict(wallet_path: str) -> dict:
+        with open(wallet_path, 'rb') as f:
+            content = f.read()
+        if content.startswith(codecs.BOM_UTF8):
+            content = content[len(codecs.BOM_UTF8):]
+        return json.loads(content.decode('utf-8'))
+
+    @staticmethod
+    def read_records(wallet_path: str) -> Iterator[dict]:
+        """
+        This interface is used to read the journal records of a wallet file, a torn last record is ignored.
+        """
+        for record, _ in WalletJournal.__scan_records(wallet_path):
+            yield record
+
+    @staticmethod
+    def __scan_records(wallet_path: str) -> Iterator[tuple]:
+        journal_path = WalletJournal.get_journal_path(wallet_path)
+        if not os.path.isfile(journal_path):
+            return
+        with open(journal_path, 'rb') as f:
+            end = 0
+            for line in f:
+                if not line.endswith(b'\n'):
+                    return
+                try:
+                    record = json.loads(line.decode('utf-8'))
+                except ValueError:
+                    return
+                end += len(line)
+                yield record, end
+
+    @staticmethod
+    def __truncate_records(wallet_path: str, size: int):
+        journal_path = WalletJournal.get_journal_path(wallet_path)
+        if not os.path.isfile(journal_path) or os.path.getsize(journal_path) <= size:
+            return
+        with open(journal_path, 'r+b') as f:
+            f.truncate(size)
+            f.flush()
+            os.fsync(f.fileno())
+
+    @staticmethod
+    def write_atomically(file_path: str, content: bytes):
+        """
+        This interface is used to replace a file by writing the content into a temporary file and then renaming it.
+        """
+        dir_path = os.path.dirname(os.path.abspath(file_path))
+        fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(file_path) + '.', suffix='.tmp', dir=dir_path)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            if os.path.exists(file_path):
+                os.chmod(temp_path, stat.S_IMODE(os.stat(file_path).st_mode))
+            os.replace(temp_path, file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        WalletJournal.__sync_dir(dir_path)
+
+    @staticmethod
+    def __sync_dir(dir_path: str):
+        try:
+            fd = os.open(dir_path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def __get_header(wallet: WalletData) -> dict:
+        return dict(name=wallet.name, version=wallet.version, createTime=wallet.create_time,
+                    defaultOntid=wallet.default_ont_id, defaultAccountAddress=wallet.default_account_address,
+                    scrypt=dict(wallet.scrypt))
+
+    def __set_snapshot(self, wallet_dict: dict):
+        self.__header = {key: value for key, value in wallet_dict.items() if key not in ('identities', 'accounts')}
+        identities = wallet_dict.get('identities', list())
+        accounts = wallet_dict['accounts']
+        self.__identities = OrderedDict((identity['ontid'], identity) for identity in identities)
+        self.__accounts = OrderedDict((acct['address'], acct) for acct in accounts)
+        self.__is_duplicated = len(self.__identities) != len(identities) or len(self.__accounts) != len(accounts)
+
+    def get_snapshot(self) -> dict:
+        """
+        This interface is used to get the wallet dict which has been saved, the items in it should not be modified.
+        """
+        snapshot = dict(self.__header)
+        snapshot['identities'] = list(self.__identities.values())
+        snapshot['accounts'] = list(self.__accounts.values())
+        return snapshot
+
+    def __apply(self, record: dict):
+        if 'header' in record:
+            self.__header = record['header']
+        for snapshot, changes in ((self.__identities, record.get('identities', dict())),
+                                  (self.__accounts, record.get('accounts', dict()))):
+            for key, value in changes.items():
+                if value is None:
+                    snapshot.pop(key, None)
+                else:
+                    snapshot[key] = value
+
+    def load(self, wallet_path: str) -> dict:
+        """
+        This interface is used to load the wallet file and replay its journal.
+
+        :param wallet_path: the path of wallet file.
+        :return: the wallet dict, which is a copy of the snapshot.
+        """
+        wallet_dict = WalletJournal.read_wallet_dict(wallet_path)
+        self.__set_snapshot(wallet_dict)
+        self.__record_count = 0
+        self.__tracked = None
+        if self.__is_duplicated:
+            return wallet_dict
+        valid_size = 0
+        for record, valid_size in WalletJournal.__scan_records(wallet_path):
+            self.__apply(record)
+            self.__record_count += 1
+        WalletJournal.__truncate_records(wallet_path, valid_size)
+        return json.loads(json.dumps(self.get_snapshot()))
+
+    @staticmethod
+    def __diff(snapshot: OrderedDict, items: list) -> dict or None:
+        keys = [key for key, _ in items]
+        if len(set(keys)) != len(keys):
+            return None
+        existing_keys = [key for key in keys if key in snapshot]
+        if keys[0:len(existing_keys)] != existing_keys:
+            return None
+        current = dict(items)
+        if existing_keys != [key for key in snapshot if key in current]:
+            return None
+        changes = OrderedDict((key, value) for key, value in items if snapshot.get(key) != value)
+        for key in snapshot:
+            if key not in current:
+                changes[key] = None
+        return changes
+
+    @staticmethod
+    def __collect(snapshot: OrderedDict, tracked_changes: tuple or None, key_attr: str) -> dict or None:
+        if tracked_changes is None:
+            return None
+        added, changed, removed_keys = tracked_changes
+        changes = OrderedDict()
+        for key in removed_keys:
+            if key not in snapshot or key in changes:
+                return None
+            changes[key] = None
+        for item in changed:
+            key = getattr(item, key_attr)
+            if key not in snapshot or key in changes:
+                return None
+            value = dict(item)
+            if value != snapshot[key]:
+                changes[key] = value
+        for item in added:
+            key = getattr(item, key_attr)
+            if key in snapshot or key in changes:
+                return None
+            changes[key] = dict(item)
+        return changes
+
+    def __get_changes(self, snapshot: OrderedDict, items: list, key_attr: str, tracked_index: int) -> dict or None:
+        changes = None
+        if self.__tracked is not None and self.__tracked[tracked_index] is items:
+            changes = WalletJournal.__collect(snapshot, items.get_changes(), key_attr)
+        if changes is None:
+            changes = WalletJournal.__diff(snapshot, [(getattr(item, key_attr), dict(item)) for item in items])
+        return changes
+
+    def __track(self, wallet: WalletData):
+        wallet.identities.reset_changes()
+        wallet.accounts.reset_changes()
+        self.__tracked = (wallet.identities, wallet.accounts)
+
+    def save(self, wallet_path: str, wallet: WalletData):
+        """
+        This interface is used to save the changes of wallet since the last save.
+
+        :param wallet_path: the path of wallet file.
+        :param wallet: the WalletData object to save.
+        """
+        identity_changes = self.__get_changes(self.__identities, wallet.identities, 'ont_id', 0)
+        acct_changes = self.__get_changes(self.__accounts, wallet.accounts, 'b58_address', 1)
+        if self.__is_duplicated or identity_changes is None or acct_changes is None or \
+                self.__record_count + 1 >= self.__compact_threshold or not os.path.isfile(wallet_path):
+            self.compact(wallet_path, wallet)
+            return
+        record = dict()
+        header = WalletJournal.__get_header(wallet)
+        if header != self.__header:
+            record['header'] = header
+        if len(identity_changes) != 0:
+            record['identities'] = identity_changes
+        if len(acct_changes) != 0:
+            record['accounts'] = acct_changes
+        if len(record) == 0:
+            self.__track(wallet)
+            return
+        line = json.dumps(record)
+        with open(WalletJournal.get_journal_path(wallet_path), 'ab') as f:
+            f.write(line.encode('utf-8') + b'\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self.__apply(json.loads(line))
+        self.__record_count += 1
+        self.__track(wallet)
+
+    def compact(self, wallet_path: str, wallet: WalletData = None):
+        """
+        This interface is used to write the whole wallet into the wallet file, and remove the journal.
+
+        :param wallet_path: the path of wallet file.
+        :param wallet: the WalletData object to write, the saved snapshot is written by default.
+        """
+        journal_path = WalletJournal.get_journal_path(wallet_path)
+        if wallet is None:
+            if not os.path.exists(journal_path):
+                return
+            wallet_dict = self.get_snapshot()
+        else:
+            wallet_dict = dict(wallet)
+        content = json.dumps(wallet_dict, indent=4)
+        WalletJournal.write_atomically(wallet_path, content.encode('utf-8'))
+        if os.path.exists(journal_path):
+            os.remove(journal_path)
+        self.__set_snapshot(json.loads(content))
+        self.__record_count = 0
+        if wallet is not None:
+            self.__track(wallet)
@@ -5,10 +5,11 @@ import copy
 import json
 import uuid
 import base64
-import codecs
 
-from os import remove, path
+from os import remove, path, cpu_count
+from typing import List
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 
 from ontology.common.define import DID_ONT
 from ontology.crypto.scrypt import Scrypt
@@ -21,18 +22,46 @@ from ontology.wallet.account import AccountData
 from ontology.utils.utils import get_random_hex_str
 from ontology.exception.error_code import ErrorCode
 from ontology.wallet.account_info import AccountInfo
+from ontology.wallet.wallet_reader import WalletReader
+from ontology.wallet.binary_wallet import BinaryWallet
+from ontology.wallet.wallet_journal import WalletJournal
+from ontology.wallet.unlock_cache import UnlockedAccountCache
 from ontology.exception.exception import SDKException
 from ontology.crypto.signature_scheme import SignatureScheme
 
 
+def _create_encrypted_key(args: tuple) -> tuple:
+    pwd, scheme = args
+    private_key = get_random_hex_str(64)
+    salt = get_random_hex_str(16)
+    account = Account(private_key, scheme)
+    return account.get_address_base58(), account.export_gcm_encrypted_private_key(pwd, salt), salt, \
+        account.get_public_key_hex()
+
+
+def _import_encrypted_key(args: tuple) -> tuple:
+    encrypted_pri_key, pwd, b58_address, salt, n, scheme = args
+    try:
+        private_key = Account.get_gcm_decoded_private_key(encrypted_pri_key, pwd, b58_address, salt, n, scheme)
+    except SDKException as e:
+        return None, e.args
+    account = Account(private_key, scheme)
+    if n != Scrypt().n:
+        encrypted_pri_key = account.export_gcm_encrypted_private_key(pwd, salt)
+    return (account.get_address_base58(), encrypted_pri_key, salt, account.get_public_key_hex()), None
+
+
 class WalletManager(object):
     def __init__(self, scheme: SignatureScheme = SignatureScheme.SHA256withECDSA):
         if not isinstance(scheme, SignatureScheme):
             raise SDKException(ErrorCode.other_error('Invalid signature scheme.'))
         self.scheme = scheme
-        self.wallet_file = WalletData()
+        self.__wallet_file = WalletData()
+        self.__wallet_file_snapshot = None
         self.wallet_in_mem = WalletData()
         self.__wallet_path = ''
+        self.__unlock_cache = None
+        self.__journal = None
 
     @staticmethod
     def __check_ont_id(ont_id: str):
@@ -50,10 +79,45 @@ class WalletManager(object):
             self.create_wallet_file()
         if not path.isfile(self.__wallet_path):
             raise SDKException(ErrorCode.invalid_wallet_path(self.__wallet_path))
+        if self.__journal is not None:
+            self.wallet_in_mem = self.load_file()
+            self.__wallet_file = None
+            self.__wallet_file_snapshot = self.__journal.get_snapshot()
+            return self.wallet_in_mem
         self.wallet_file = self.load_file()
         self.wallet_in_mem = copy.deepcopy(self.wallet_file)
         return self.wallet_file
 
+    @property
+    def wallet_file(self) -> WalletData:
+        if self.__wallet_file is None:
+            self.__wallet_file = self.__wallet_from_snapshot(self.__wallet_file_snapshot)
+        return self.__wallet_file
+
+    @wallet_file.setter
+    def wallet_file(self, wallet: WalletData):
+        self.__wallet_file = wallet
+        self.__wallet_file_snapshot = None
+
+    def set_wallet_journal(self, journal: WalletJournal or None):
+        """
+        This interface is used to save the wallet by appending the changes into a journal,
+        None means rewriting the whole wallet file on every save.
+
+        In journal mode, open_wallet() and write_wallet() return wallet_in_mem,
+        and wallet_file is only created from the saved snapshot when it is used.
+        """
+        if journal is not None and not isinstance(journal, WalletJournal):
+            raise SDKException(ErrorCode.param_err('a WalletJournal object is required.'))
+        if self.__journal is not None and self.__journal is not journal and path.isfile(self.__wallet_path):
+            self.__journal.compact(self.__wallet_path)
+        if journal is not None and path.isfile(self.__wallet_path):
+            journal.load(self.__wallet_path)
+        self.__journal = journal
+
+    def get_wallet_journal(self) -> WalletJournal or None:
+        return self.__journal
+
     @property
     def wallet_path(self):
         return self.__wallet_path
@@ -67,6 +131,10 @@ class WalletManager(object):
     def del_wallet_file(self):
         if path.isfile(self.__wallet_path):
             remove(self.__wallet_path)
+            for file_path in (WalletJournal.get_journal_path(self.__wallet_path),
+                              WalletReader.get_index_path(self.__wallet_path)):
+                if path.isfile(file_path):
+                    remove(file_path)
             return True
         return False
 
@@ -81,31 +149,62 @@ class WalletManager(object):
         else:
             raise SDKException(ErrorCode.other_error('Wallet file has existed.'))
 
+    def open_wallet_reader(self, wallet_path: str = '') -> WalletReader or BinaryWallet:
+        """
+        This interface is used to open a read-only view of wallet file, which only materializes the accounts and
+        identities that are accessed, so that a large wallet file can be used without loading it into memory.
+
+        :param wallet_path: the path of wallet file, the wallet path of WalletManager by default.
+        :return: a BinaryWallet object for a binary wallet file, otherwise a WalletReader object,
+            which should be closed after use.
+        """
+        if not isinstance(wallet_path, str):
+            raise SDKException(ErrorCode.require_str_params)
+        if wallet_path == '':
+            wallet_path = self.__wallet_path
+        if not path.isfile(wallet_path):
+            raise SDKException(ErrorCode.invalid_wallet_path(wallet_path))
+        if BinaryWallet.is_binary_wallet(wallet_path):
+            return BinaryWallet(wallet_path)
+        return WalletReader(wallet_path)
+
     def load_file(self):
-        with open(self.__wallet_path, 'rb') as f:
-            content = f.read()
-            if content.startswith(codecs.BOM_UTF8):
-                content = content[len(codecs.BOM_UTF8):]
-            content = content.decode('utf-8')
-            wallet_dict = json.loads(content)
-            create_time = wallet_dict.get('createTime', '')
-            default_id = wallet_dict.get('defaultOntid', '')
-            default_address = wallet_dict.get('defaultAccountAddress', '')
-            identities = wallet_dict.get('identities', list())
-            try:
-                scrypt_dict = wallet_dict['scrypt']
-                scrypt_obj = Scrypt(scrypt_dict.get('n', 16384), scrypt_dict.get('r', 8), scrypt_dict.get('p', 8),
-                                    scrypt_dict.get('dk_len', 64))
-                wallet = WalletData(wallet_dict['name'], wallet_dict['version'], create_time, default_id,
-                                    default_address, scrypt_obj, identities, wallet_dict['accounts'])
-            except KeyError as e:
-                raise SDKException(ErrorCode.param_err(f'wallet file format error: {e}.'))
+        try:
+            if self.__journal is None:
+                wallet_dict = WalletJournal.read_wallet_dict(self.__wallet_path)
+            else:
+                wallet_dict = self.__journal.load(self.__wallet_path)
+        except KeyError as e:
+            raise SDKException(ErrorCode.param_err(f'wallet file format error: {e}.'))
+        return WalletManager.__wallet_from_dict(wallet_dict)
+
+    @staticmethod
+    def __wallet_from_dict(wallet_dict: dict) -> WalletData:
+        create_time = wallet_dict.get('createTime', '')
+        default_id = wallet_dict.get('defaultOntid', '')
+        default_address = wallet_dict.get('defaultAccountAddress', '')
+        identities = wallet_dict.get('identities', list())
+        try:
+            scrypt_dict = wallet_dict['scrypt']
+            scrypt_obj = Scrypt(scrypt_dict.get('n', 16384), scrypt_dict.get('r', 8), scrypt_dict.get('p', 8),
+                                scrypt_dict.get('dk_len', 64))
+            wallet = WalletData(wallet_dict['name'], wallet_dict['version'], create_time, default_id,
+                                default_address, scrypt_obj, identities, wallet_dict['accounts'])
+        except KeyError as e:
+            raise SDKException(ErrorCode.param_err(f'wallet file format error: {e}.'))
         return wallet
 
+    @staticmethod
+    def __wallet_from_snapshot(snapshot: dict) -> WalletData:
+        return WalletManager.__wallet_from_dict(json.loads(json.dumps(snapshot)))
+
     def save(self):
         try:
-            with open(self.__wallet_path, 'w') as f:
-                json.dump(dict(self.wallet_in_mem), f, indent=4)
+            if self.__journal is not None:
+                self.__journal.save(self.__wallet_path, self.wallet_in_mem)
+                return
+            content = json.dumps(dict(self.wallet_in_mem), indent=4)
+            WalletJournal.write_atomically(self.__wallet_path, content.encode('utf-8'))
         except FileNotFoundError as e:
             raise SDKException(ErrorCode.other_error(e.args[1])) from None
 
@@ -114,13 +213,67 @@ class WalletManager(object):
 
     def write_wallet(self):
         self.save()
+        if self.__journal is not None:
+            self.__wallet_file = None
+            self.__wallet_file_snapshot = self.__journal.get_snapshot()
+            return self.wallet_in_mem
         self.wallet_file = copy.deepcopy(self.wallet_in_mem)
         return self.wallet_file
 
     def reset_wallet(self):
-        self.wallet_in_mem = copy.deepcopy(self.wallet_file)
+        if self.__wallet_file is None:
+            self.wallet_in_mem = self.__wallet_from_snapshot(self.__wallet_file_snapshot)
+        else:
+            self.wallet_in_mem = copy.deepcopy(self.wallet_file)
         return self.wallet_in_mem
 
+    def set_unlock_cache(self, unlock_cache: UnlockedAccountCache or None):
+        """
+        This interface is used to keep the decrypted accounts unlocked in a session cache,
+        None means decrypting the private key on every call.
+        """
+        if unlock_cache is not None and not isinstance(unlock_cache, UnlockedAccountCache):
+            raise SDKException(ErrorCode.param_err('an UnlockedAccountCache object is required.'))
+        if self.__unlock_cache is not None and self.__unlock_cache is not unlock_cache:
+            self.__unlock_cache.lock()
+        self.__unlock_cache = unlock_cache
+
+    def get_unlock_cache(self) -> UnlockedAccountCache or None:
+        return self.__unlock_cache
+
+    def unlock_account(self, b58_address: str, password: str) -> Account:
+        """
+        This interface is used to decrypt an account and keep it unlocked in the session cache,
+        a default UnlockedAccountCache is used if no cache has been set.
+
+        :param b58_address: a base58 encode address.
+        :param password: a password which is used to decrypt the encrypted private key.
+        :return: the unlocked Account object.
+        """
+        if self.__unlock_cache is None:
+            self.__unlock_cache = UnlockedAccountCache()
+        return self.get_account_by_b58_address(b58_address, password)
+
+    def lock_account(self, b58_address: str = ''):
+        """
+        This interface is used to lock an unlocked account, or all unlocked accounts if b58_address is empty.
+        """
+        if self.__unlock_cache is not None:
+            self.__unlock_cache.lock(b58_address)
+
+    def __decode_account(self, encrypted_key: str, password: str, b58_address: str, salt: bytes) -> Account:
+        unlock_cache = self.__unlock_cache
+        if unlock_cache is not None:
+            account = unlock_cache.get(b58_address, encrypted_key, password)
+            if account is not None:
+                return account
+        n = self.wallet_in_mem.scrypt.n
+        private_key = Account.get_gcm_decoded_private_key(encrypted_key, password, b58_address, salt, n, self.scheme)
+        account = Account(private_key, self.scheme)
+        if unlock_cache is not None:
+            unlock_cache.put(b58_address, encrypted_key, password, account)
+        return account
+
     def get_signature_scheme(self):
         return self.scheme
 
@@ -142,10 +295,10 @@ class WalletManager(object):
         scrypt_n = Scrypt().n
         pri_key = Account.get_gcm_decoded_private_key(encrypted_pri_key, pwd, b58_address, salt, scrypt_n, self.scheme)
         info = self.__create_identity(label, pwd, salt, pri_key)
-        for identity in self.wallet_in_mem.identities:
-            if identity.ont_id == info.ont_id:
-                return identity
-        raise SDKException(ErrorCode.other_error('Import identity failed.'))
+        try:
+            return self.wallet_in_mem.get_identity_by_ont_id(info.ont_id)
+        except SDKException:
+            raise SDKException(ErrorCode.other_error('Import identity failed.')) from None
 
     def create_identity(self, label: str, pwd: str) -> Identity:
         """
@@ -192,7 +345,7 @@ class WalletManager(object):
     def __create_account(self, label: str, pwd: str, salt: str, private_key: str, account_flag: bool) -> Account:
         account = Account(private_key, self.scheme)
         if self.scheme == SignatureScheme.SHA256withECDSA:
-            acct_data = AccountData()
+            acct_data = AccountData(b58_address=account.get_address_base58(), is_default=False)
         else:
             raise SDKException(ErrorCode.other_error('Scheme type is error.'))
         if pwd is not None:
@@ -200,27 +353,17 @@ class WalletManager(object):
         else:
             acct_data.key = account.get_private_key_hex()
 
-        acct_data.b58_address = account.get_address_base58()
         # set label
         if label is None or label == '':
             label = uuid.uuid4().hex[0:8]
         if account_flag:
-            for memory_acct in self.wallet_in_mem.accounts:
-                if memory_acct.b58_address == account.get_address_base58():
-                    raise SDKException(ErrorCode.other_error('Wallet account exists.'))
-            if len(self.wallet_in_mem.accounts) == 0:
-                acct_data.is_default = True
-                self.wallet_in_mem.default_account_address = acct_data.b58_address
-            acct_data.label = label
-            acct_data.salt = base64.b64encode(salt.encode('latin-1')).decode('ascii')
-            acct_data.public_key = account.get_public_key_hex()
-            self.wallet_in_mem.accounts.append(acct_data)
+            if self.wallet_in_mem.accounts.find('b58_address', acct_data.b58_address) is not None:
+                raise SDKException(ErrorCode.other_error('Wallet account exists.'))
+            self.__add_account_data(acct_data, label, salt, account.get_public_key_hex())
         else:
-            for identity in self.wallet_in_mem.identities:
-                if identity.ont_id == DID_ONT + acct_data.b58_address:
-                    raise SDKException(ErrorCode.other_error('Wallet identity exists.'))
-            idt = Identity()
-            idt.ont_id = DID_ONT + acct_data.b58_address
+            if self.wallet_in_mem.identities.find('ont_id', DID_ONT + acct_data.b58_address) is not None:
+                raise SDKException(ErrorCode.other_error('Wallet identity exists.'))
+            idt = Identity(ont_id=DID_ONT + acct_data.b58_address)
             idt.label = label
             if len(self.wallet_in_mem.identities) == 0:
                 idt.is_default = True
@@ -231,6 +374,93 @@ class WalletManager(object):
             self.wallet_in_mem.identities.append(idt)
         return account
 
+    def __add_account_data(self, acct_data: AccountData, label: str, salt: str, public_key: str):
+        if len(self.wallet_in_mem.accounts) == 0:
+            acct_data.is_default = True
+            self.wallet_in_mem.default_account_address = acct_data.b58_address
+        acct_data.label = label
+        acct_data.salt = base64.b64encode(salt.encode('latin-1')).decode('ascii')
+        acct_data.public_key = public_key
+        self.wallet_in_mem.accounts.append(acct_data)
+
+    def __add_encrypted_keys(self, labels: List[str], encrypted_keys: List[tuple]) -> List[AccountData]:
+        if self.scheme != SignatureScheme.SHA256withECDSA:
+            raise SDKException(ErrorCode.other_error('Scheme type is error.'))
+        accounts = self.wallet_in_mem.accounts
+        b58_address_set = set()
+        for b58_address, _, _, _ in encrypted_keys:
+            if b58_address in b58_address_set or accounts.find('b58_address', b58_address) is not None:
+                raise SDKException(ErrorCode.other_error('Wallet account exists.'))
+            b58_address_set.add(b58_address)
+        acct_data_list = list()
+        for label, (b58_address, key, salt, public_key) in zip(labels, encrypted_keys):
+            if label is None or label == '':
+                label = uuid.uuid4().hex[0:8]
+            acct_data = AccountData(b58_address=b58_address, key=key, is_default=False)
+            self.__add_account_data(acct_data, label, salt, public_key)
+            acct_data_list.append(acct_data)
+        return acct_data_list
+
+    @staticmethod
+    def __map_in_processes(func, args_list: list, max_workers: int or None) -> list:
+        if max_workers is None:
+            max_workers = cpu_count() or 1
+        if max_workers == 1 or len(args_list) <= 1:
+            return list(map(func, args_list))
+        chunk_size = max(1, len(args_list) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers) as executor:
+            return list(executor.map(func, args_list, chunksize=chunk_size))
+
+    def create_accounts(self, count: int, pwd: str, labels: List[str] = None,
+                        max_workers: int = None) -> List[AccountData]:
+        """
+        This interface is used to create many accounts at once, the private keys are generated and encrypted
+        on a process pool, and then all accounts are added into wallet in one pass.
+
+        The wallet is not saved, call write_wallet() once after creating all accounts.
+
+        :param count: the number of accounts to create.
+        :param pwd: a password which will be used to encrypt and decrypt the private keys.
+        :param labels: a list of labels for the accounts, random labels are used by default.
+        :param max_workers: the number of worker processes, the number of CPUs by default.
+        :return: a list of AccountData objects.
+        """
+        if labels is None:
+            labels = [''] * count
+        if len(labels) != count:
+            raise SDKException(ErrorCode.param_err('the number of labels should be equal to the count.'))
+        encrypted_keys = WalletManager.__map_in_processes(_create_encrypted_key, [(pwd, self.scheme)] * count,
+                                                          max_workers)
+        return self.__add_encrypted_keys(labels, encrypted_keys)
+
+    def import_accounts(self, acct_list: List[tuple], max_workers: int = None) -> List[AccountData]:
+        """
+        This interface is used to import many accounts at once, the private keys are decrypted and checked
+        on a process pool, and then all accounts are added into wallet in one pass.
+        If any account fails to import, no account is added into wallet.
+
+        The wallet is not saved, call write_wallet() once after importing all accounts.
+
+        :param acct_list: a list of tuples in the form of (label, encrypted_pri_key, pwd, b58_address, b64_salt)
+                          or (label, encrypted_pri_key, pwd, b58_address, b64_salt, n),
+                          which are the same as the parameters of import_account().
+        :param max_workers: the number of worker processes, the number of CPUs by default.
+        :return: a list of AccountData objects.
+        """
+        labels = list()
+        args_list = list()
+        for label, encrypted_pri_key, pwd, b58_address, b64_salt, *n in acct_list:
+            salt = base64.b64decode(b64_salt.encode('ascii')).decode('latin-1')
+            n = n[0] if len(n) != 0 else Scrypt().n
+            labels.append(label)
+            args_list.append((encrypted_pri_key, pwd, b58_address, salt, n, self.scheme))
+        encrypted_keys = list()
+        for encrypted_key, error in WalletManager.__map_in_processes(_import_encrypted_key, args_list, max_workers):
+            if error is not None:
+                raise SDKException(ErrorCode.get_error(*error))
+            encrypted_keys.append(encrypted_key)
+        return self.__add_encrypted_keys(labels, encrypted_keys)
+
     def add_control(self, ont_id: str, password: str):
         WalletManager.__check_ont_id(ont_id)
         private_key = get_random_hex_str(64)
@@ -284,12 +514,10 @@ class WalletManager(object):
         salt = base64.b64decode(b64_salt.encode('ascii')).decode('latin-1')
         private_key = Account.get_gcm_decoded_private_key(encrypted_pri_key, pwd, b58_address, salt, n, self.scheme)
         acct_info = self.create_account_info(label, pwd, salt, private_key)
-        for acct in self.wallet_in_mem.accounts:
-            if not isinstance(acct, AccountData):
-                raise SDKException(ErrorCode.other_error('Invalid account data in memory.'))
-            if acct_info.address_base58 == acct.b58_address:
-                return acct
-        raise SDKException(ErrorCode.other_error('Import account failed.'))
+        acct = self.wallet_in_mem.accounts.find('b58_address', acct_info.address_base58)
+        if not isinstance(acct, AccountData):
+            raise SDKException(ErrorCode.other_error('Import account failed.'))
+        return acct
 
     def create_account_info(self, label: str, pwd: str, salt: str, private_key: str) -> AccountInfo:
         acct = self.__create_account(label, pwd, salt, private_key, True)
@@ -313,9 +541,9 @@ class WalletManager(object):
         """
         salt = get_random_hex_str(16)
         info = self.create_account_info(label, password, salt, private_key)
-        for acct in self.wallet_in_mem.accounts:
-            if info.address_base58 == acct.b58_address:
-                return acct
+        acct = self.wallet_in_mem.accounts.find('b58_address', info.address_base58)
+        if acct is not None:
+            return acct
         raise SDKException(ErrorCode.other_error(f'Create account from key {private_key} failed.'))
 
     def get_account_by_ont_id(self, ont_id: str, password: str) -> Account:
@@ -325,15 +553,13 @@ class WalletManager(object):
         :return:
         """
         WalletManager.__check_ont_id(ont_id)
-        for identity in self.wallet_in_mem.identities:
-            if identity.ont_id == ont_id:
-                addr = identity.ont_id.replace(DID_ONT, "")
-                key = identity.controls[0].key
-                salt = base64.b64decode(identity.controls[0].salt)
-                n = self.wallet_in_mem.scrypt.n
-                private_key = Account.get_gcm_decoded_private_key(key, password, addr, salt, n, self.scheme)
-                return Account(private_key, self.scheme)
-        raise SDKException(ErrorCode.other_error(f'Get account {ont_id} failed.'))
+        identity = self.wallet_in_mem.identities.find('ont_id', ont_id)
+        if identity is None:
+            raise SDKException(ErrorCode.other_error(f'Get account {ont_id} failed.'))
+        addr = identity.ont_id.replace(DID_ONT, "")
+        key = identity.controls[0].key
+        salt = base64.b64decode(identity.controls[0].salt)
+        return self.__decode_account(key, password, addr, salt)
 
     def get_identity_by_ont_id(self, ont_id: str) -> Identity:
         return self.wallet_in_mem.get_identity_by_ont_id(ont_id)
@@ -355,39 +581,31 @@ class WalletManager(object):
             raise SDKException(ErrorCode.require_str_params)
         ctrl = self.get_control_info_by_index(ont_id, index)
         salt = base64.b64decode(ctrl.salt)
-        key = ctrl.key
-        b58_address = ctrl.b58_address
-        n = self.wallet_in_mem.scrypt.n
-        private_key = Account.get_gcm_decoded_private_key(key, password, b58_address, salt, n, self.scheme)
-        return Account(private_key, self.scheme)
+        return self.__decode_account(ctrl.key, password, ctrl.b58_address, salt)
 
     def get_control_info_by_b58_address(self, ont_id: str, b58_address: str) -> Control:
         WalletManager.__check_ont_id(ont_id)
         identity = self.get_identity_by_ont_id(ont_id)
-        for ctrl in identity.controls:
-            if ctrl.b58_address == b58_address:
-                return ctrl
-        raise SDKException(ErrorCode.other_error(f'Get account {b58_address} failed.'))
+        ctrl = identity.get_control_by_b58_address(b58_address)
+        if ctrl is None:
+            raise SDKException(ErrorCode.other_error(f'Get account {b58_address} failed.'))
+        return ctrl
 
     def get_control_account_by_b58_address(self, ont_id: str, b58_address: str, password: str) -> Account:
         WalletManager.__check_ont_id(ont_id)
         ctrl = self.get_control_info_by_b58_address(ont_id, b58_address)
         salt = base64.b64decode(ctrl.salt)
-        key = ctrl.key
-        b58_address = ctrl.b58_address
-        n = self.wallet_in_mem.scrypt.n
-        private_key = Account.get_gcm_decoded_private_key(key, password, b58_address, salt, n, self.scheme)
-        return Account(private_key, self.scheme)
+        return self.__decode_account(ctrl.key, password, ctrl.b58_address, salt)
 
     def get_account_data_by_b58_address(self, b58_address: str) -> AccountData:
         if not isinstance(b58_address, str):
             raise SDKException(ErrorCode.require_str_params)
-        for acct in self.wallet_in_mem.accounts:
-            if not isinstance(acct, AccountData):
-                raise SDKException(ErrorCode.other_error('Invalid account data in memory.'))
-            if acct.b58_address == b58_address:
-                return acct
-        raise SDKException(ErrorCode.other_error(f'Get account {b58_address} failed.'))
+        acct = self.wallet_in_mem.accounts.find('b58_address', b58_address)
+        if acct is None:
+            raise SDKException(ErrorCode.other_error(f'Get account {b58_address} failed.'))
+        if not isinstance(acct, AccountData):
+            raise SDKException(ErrorCode.other_error('Invalid account data in memory.'))
+        return acct
 
     def get_account_by_b58_address(self, b58_address: str, password: str) -> Account:
         """
@@ -396,10 +614,8 @@ class WalletManager(object):
         :return:
         """
         acct = self.get_account_data_by_b58_address(b58_address)
-        n = self.wallet_in_mem.scrypt.n
         salt = base64.b64decode(acct.salt)
-        private_key = Account.get_gcm_decoded_private_key(acct.key, password, b58_address, salt, n, self.scheme)
-        return Account(private_key, self.scheme)
+        return self.__decode_account(acct.key, password, b58_address, salt)
 
     def get_default_identity(self) -> Identity:
         for identity in self.wallet_in_mem.identities:
@@ -413,6 +629,9 @@ class WalletManager(object):
 
         :return: an AccountData object that contain all the information of a default account.
         """
+        acct = self.wallet_in_mem.accounts.find('b58_address', self.wallet_in_mem.default_account_address)
+        if acct is not None and acct.is_default:
+            return acct
         for acct in self.wallet_in_mem.accounts:
             if not isinstance(acct, AccountData):
                 raise SDKException(ErrorCode.other_error('Invalid account data in memory.'))
@@ -423,6 +642,4 @@ class WalletManager(object):
     def get_default_account(self, password: str) -> Account:
         acct = self.get_default_account_data()
         salt = base64.b64decode(acct.salt)
-        n = self.wallet_in_mem.scrypt.n
-        private_key = Account.get_gcm_decoded_private_key(acct.key, password, acct.b58_address, salt, n, self.scheme)
-        return Account(private_key, self.scheme)
+        return self.__decode_account(acct.key, password, acct.b58_address, salt)
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import re
+import sys
+import json
+import mmap
+import codecs
+import struct
+import base64
+import hashlib
+
+from typing import Iterator
+from collections import OrderedDict
+
+from ontology.crypto.scrypt import Scrypt
+from ontology.wallet.wallet import WalletData
+from ontology.account.account import Account
+from ontology.wallet.identity import Identity
+from ontology.wallet.account import AccountData
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+from ontology.crypto.signature_scheme import SignatureScheme
+from ontology.wallet.wallet_journal import WalletJournal
+
+_SPACE = rb'[ \t\n\r]*'
+_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+_POSSESSIVE = b'+' if sys.version_info >= (3, 11) else b''
+
+
+def _nested_pattern(depth: int) -> bytes:
+    text = rb'[^{}\[\]"]*' + _POSSESSIVE
+    pattern = text + rb'(?:' + _STRING + text + rb')*' + _POSSESSIVE
+    for _ in range(depth):
+        pattern = text + rb'(?:(?:' + _STRING + rb'|[{\[]' + pattern + rb'[}\]])' + text + rb')*' + _POSSESSIVE
+    return pattern
+
+
+def _element_pattern(key_name: bytes):
+    key = _SPACE + b'"' + key_name + b'"' + _SPACE + b':' + _SPACE + rb'(' + _STRING + rb')'
+    return re.compile(_SPACE + rb'({' + key + _nested_pattern(5) + rb'})' + _SPACE + rb'([,\]])')
+
+
+class WalletReader(object):
+    """
+    A read-only view of a wallet file, which materializes an account or identity only when it is accessed.
+
+    The first time a wallet file is read, its accounts and identities arrays are scanned one element at a time, and
+    the offset of each element is written into an index file next to the wallet file. The scan only finds the bounds
+    and the key of each element in the memory-mapped bytes, without decoding the file or parsing the elements, but
+    its cost is still proportional to the size of the file. The index records the size and modification time of the
+    wallet file, and is rebuilt by the next reader when they change, i.e. after every save without a journal and
+    every compaction of the journal, which rewrite the wallet file. Saving with a WalletJournal only appends to the
+    journal and keeps the index valid. An opened reader memory-maps both files and finds an element by binary search
+    on the digests of keys, so that only the element accessed is parsed. If the index file cannot be written, the
+    index is kept in memory. The changes in the journal of wallet file, if any, are applied on top of the index.
+
+    :param wallet_path: the path of wallet file.
+    """
+    __MAGIC = b'ONTWIDX\x01'
+    __HEADER = struct.Struct('<8sQQIII')
+    __ENTRY = struct.Struct('<QI')
+    __KEY = struct.Struct('<16sI')
+    __WHITESPACE = re.compile(_SPACE)
+    __STRING = re.compile(_STRING)
+    __VALUE = re.compile(rb'[{\[]' + _nested_pattern(6) + rb'[}\]]|' + _STRING + rb'|[^ \t\n\r,{}\[\]"]+')
+    __TOKEN = re.compile(_STRING + rb'|[{}\[\]]')
+    __ELEMENTS = dict(address=_element_pattern(b'address'), ontid=_element_pattern(b'ontid'))
+
+    def __init__(self, wallet_path: str):
+        if not os.path.isfile(wallet_path):
+            raise SDKException(ErrorCode.param_err('the wallet file does not exist.'))
+        self.__wallet_path = wallet_path
+        self.__wallet_file = open(wallet_path, 'rb')
+        self.__wallet_map = WalletReader.__map_file(self.__wallet_file)
+        self.__index = None
+        try:
+            stat = os.fstat(self.__wallet_file.fileno())
+            self.__index = self.__open_index(stat.st_size, stat.st_mtime_ns)
+            header_len, self.__acct_count, self.__identity_count = WalletReader.__HEADER.unpack_from(self.__index)[3:]
+            header_end = WalletReader.__HEADER.size + header_len
+            self.__header = json.loads(bytes(self.__index[WalletReader.__HEADER.size:header_end]).decode('utf-8'))
+        except BaseException:
+            self.close()
+            raise
+        entry_size, key_size = WalletReader.__ENTRY.size, WalletReader.__KEY.size
+        self.__identity_offset = header_end
+        self.__identity_key_offset = self.__identity_offset + entry_size * self.__identity_count
+        self.__acct_offset = self.__identity_key_offset + key_size * self.__identity_count
+        self.__acct_key_offset = self.__acct_offset + entry_size * self.__acct_count
+        self.__identity_changes = OrderedDict()
+        self.__acct_changes = OrderedDict()
+        for record in WalletJournal.read_records(wallet_path):
+            self.__header = record.get('header', self.__header)
+            self.__identity_changes.update(record.get('identities', dict()))
+            self.__acct_changes.update(record.get('accounts', dict()))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        for buffer in (self.__wallet_map, self.__index):
+            if isinstance(buffer, mmap.mmap):
+                buffer.close()
+        self.__wallet_file.close()
+
+    @staticmethod
+    def get_index_path(wallet_path: str) -> str:
+        return wallet_path + '.index'
+
+    @staticmethod
+    def __map_file(f) -> mmap.mmap or bytes:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __open_index(self, wallet_size: int, wallet_mtime: int) -> mmap.mmap or bytes:
+        index_path = WalletReader.get_index_path(self.__wallet_path)
+        try:
+            with open(index_path, 'rb') as f:
+                index = WalletReader.__map_file(f)
+            header = WalletReader.__HEADER.unpack_from(index)
+            if header[:3] == (WalletReader.__MAGIC, wallet_size, wallet_mtime):
+                return index
+            if isinstance(index, mmap.mmap):
+                index.close()
+        except (OSError, ValueError, struct.error):
+            pass
+        index = self.__build_index(wallet_size, wallet_mtime)
+        try:
+            WalletJournal.write_atomically(index_path, index)
+        except OSError:
+            pass
+        return index
+
+    @staticmethod
+    def __skip_whitespace(content: bytes, position: int) -> int:
+        return WalletReader.__WHITESPACE.match(content, position).end()
+
+    @staticmethod
+    def __expect(content: bytes, position: int, chars: bytes) -> int:
+        position = WalletReader.__skip_whitespace(content, position)
+        if position >= len(content) or content[position] not in chars:
+            raise SDKException(ErrorCode.other_error('invalid wallet file.'))
+        return position
+
+    @staticmethod
+    def __skip_value(content: bytes, position: int) -> int:
+        match = WalletReader.__VALUE.match(content, position)
+        if match is not None:
+            return match.end()
+        depth = 0
+        for token in WalletReader.__TOKEN.finditer(content, position):
+            char = content[token.start()]
+            if char in b'{[':
+                depth += 1
+            elif char in b'}]':
+                depth -= 1
+            if depth <= 0:
+                return token.end()
+        raise SDKException(ErrorCode.other_error('invalid wallet file.'))
+
+    def __read_key(self, position: int, end: int, key_name: str) -> str:
+        try:
+            key = json.loads(self.__decode(position, end - position)).get(key_name)
+        except (ValueError, AttributeError):
+            key = None
+        if not isinstance(key, str):
+            raise SDKException(ErrorCode.other_error('invalid wallet file.'))
+        return key
+
+    def __scan_array(self, position: int, key_name: str) -> tuple:
+        content, element = self.__wallet_map, WalletReader.__ELEMENTS[key_name]
+        entries, keys = bytearray(), list()
+        position = WalletReader.__expect(content, position, b'[') + 1
+        if content[WalletReader.__expect(content, position, b'{]')] == ord(']'):
+            return entries, keys, WalletReader.__skip_whitespace(content, position) + 1
+        while True:
+            match = element.match(content, position)
+            if match is not None:
+                start, end = match.span(1)
+                key = match.group(2)
+                key = key[1:-1].decode('utf-8') if b'\\' not in key else json.loads(key.decode('utf-8'))
+                position = match.end()
+            else:
+                start = WalletReader.__expect(content, position, b'{')
+                end = WalletReader.__skip_value(content, start)
+                key = self.__read_key(start, end, key_name)
+                position = WalletReader.__expect(content, end, b',]') + 1
+            keys.append(WalletReader.__KEY.pack(hashlib.sha256(key.encode('utf-8')).digest()[:16], len(keys)))
+            entries += WalletReader.__ENTRY.pack(start, end - start)
+            if content[position - 1] == ord(']'):
+                return entries, keys, position
+
+    def __build_index(self, wallet_size: int, wallet_mtime: int) -> bytes:
+        content = self.__wallet_map
+        header, arrays = dict(), dict(identities=(bytearray(), list()), accounts=(bytearray(), list()))
+        position = len(codecs.BOM_UTF8) if content[:len(codecs.BOM_UTF8)] == codecs.BOM_UTF8 else 0
+        try:
+            position = WalletReader.__expect(content, position, b'{') + 1
+            while True:
+                key_start = WalletReader.__expect(content, position, b'"')
+                match = WalletReader.__STRING.match(content, key_start)
+                if match is None:
+                    raise ValueError('unterminated string')
+                key = json.loads(self.__decode(key_start, match.end() - key_start))
+                position = WalletReader.__expect(content, match.end(), b':') + 1
+                if key in arrays:
+                    key_name = 'address' if key == 'accounts' else 'ontid'
+                    entries, keys, position = self.__scan_array(position, key_name)
+                    arrays[key] = (entries, keys)
+                else:
+                    value_start = WalletReader.__skip_whitespace(content, position)
+                    position = WalletReader.__skip_value(content, value_start)
+                    header[key] = json.loads(self.__decode(value_start, position - value_start))
+                position = WalletReader.__expect(content, position, b',}') + 1
+                if content[position - 1] == ord('}'):
+                    break
+        except ValueError:
+            raise SDKException(ErrorCode.other_error('invalid wallet file.'))
+        header_bytes = json.dumps(header).encode('utf-8')
+        identity_entries, identity_keys = arrays['identities']
+        acct_entries, acct_keys = arrays['accounts']
+        index = [WalletReader.__HEADER.pack(WalletReader.__MAGIC, wallet_size, wallet_mtime, len(header_bytes),
+                                            len(acct_keys), len(identity_keys)), header_bytes]
+        for entries, keys in ((identity_entries, identity_keys), (acct_entries, acct_keys)):
+            keys.sort()
+            index.append(entries)
+            index.extend(keys)
+        return b''.join(index)
+
+    def __decode(self, offset: int, length: int) -> str:
+        return bytes(self.__wallet_map[offset:offset + length]).decode('utf-8')
+
+    def __find_entry(self, key: str, key_name: str, entry_offset: int, key_offset: int, count: int) -> dict or None:
+        digest = hashlib.sha256(key.encode('utf-8')).digest()[:16]
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            if WalletReader.__KEY.unpack_from(self.__index, key_offset + middle * WalletReader.__KEY.size)[0] < digest:
+                low = middle + 1
+            else:
+                high = middle
+        while low < count:
+            key_digest, position = WalletReader.__KEY.unpack_from(self.__index,
+                                                                   key_offset + low * WalletReader.__KEY.size)
+            if key_digest != digest:
+                break
+            item = self.__read_entry(entry_offset, position)
+            if item.get(key_name) == key:
+                return item
+            low += 1
+        return None
+
+    def __read_entry(self, entry_offset: int, position: int) -> dict:
+        entry_position = entry_offset + position * WalletReader.__ENTRY.size
+        offset, length = WalletReader.__ENTRY.unpack_from(self.__index, entry_position)
+        return json.loads(self.__decode(offset, length))
+
+    def __iter_entries(self, entry_offset: int, count: int, key_name: str, changes: OrderedDict) -> Iterator[dict]:
+        keys = set()
+        for position in range(count):
+            item = self.__read_entry(entry_offset, position)
+            key = item[key_name]
+            keys.add(key)
+            if key not in changes:
+                yield item
+            elif changes[key] is not None:
+                yield changes[key]
+        for key, item in changes.items():
+            if item is not None and key not in keys:
+                yield item
+
+    @property
+    def name(self) -> str:
+        return self.__header.get('name', '')
+
+    @property
+    def version(self) -> str:
+        return self.__header.get('version', '')
+
+    @property
+    def create_time(self) -> str:
+        return self.__header.get('createTime', '')
+
+    @property
+    def default_ont_id(self) -> str:
+        return self.__header.get('defaultOntid', '')
+
+    @property
+    def default_account_address(self) -> str:
+        return self.__header.get('defaultAccountAddress', '')
+
+    @property
+    def scrypt(self) -> Scrypt:
+        scrypt_dict = self.__header.get('scrypt', dict())
+        return Scrypt(scrypt_dict.get('n', 16384), scrypt_dict.get('r', 8), scrypt_dict.get('p', 8),
+                      scrypt_dict.get('dk_len', 64))
+
+    def get_account_data_by_b58_address(self, b58_address: str) -> AccountData:
+        """
+        This interface is used to get the AccountData object of an account in wallet file.
+
+        :param b58_address: a base58 encode address.
+        :return: an AccountData object.
+        """
+        if b58_address in self.__acct_changes:
+            dict_account = self.__acct_changes[b58_address]
+        else:
+            dict_account = self.__find_entry(b58_address, 'address', self.__acct_offset, self.__acct_key_offset,
+                                             self.__acct_count)
+        if dict_account is None:
+            raise SDKException(ErrorCode.other_error(f'Get account {b58_address} failed.'))
+        return WalletData.parse_account(dict_account)
+
+    def get_identity_by_ont_id(self, ont_id: str) -> Identity:
+        """
+        This interface is used to get the Identity object of an identity in wallet file.
+
+        :param ont_id: OntId.
+        :return: an Identity object.
+        """
+        if ont_id in self.__identity_changes:
+            dict_identity = self.__identity_changes[ont_id]
+        else:
+            dict_identity = self.__find_entry(ont_id, 'ontid', self.__identity_offset, self.__identity_key_offset,
+                                              self.__identity_count)
+        if dict_identity is None:
+            raise SDKException(ErrorCode.other_error(f'Get identity {ont_id} failed.'))
+        return WalletData.parse_identity(dict_identity)
+
+    def get_default_account_data(self) -> AccountData:
+        """
+        This interface is used to get the default account in wallet file.
+        """
+        if self.default_account_address != '':
+            return self.get_account_data_by_b58_address(self.default_account_address)
+        for acct in self.iter_accounts():
+            if acct.is_default:
+                return acct
+        raise SDKException(ErrorCode.get_default_account_err)
+
+    def get_account_by_b58_address(self, b58_address: str, password: str,
+                                   scheme: SignatureScheme = SignatureScheme.SHA256withECDSA) -> Account:
+        """
+        This interface is used to decrypt the private key of an account in wallet file.
+
+        :param b58_address: a base58 encode address.
+        :param password: a password which is used to decrypt the encrypted private key.
+        :param scheme: the signature scheme of account.
+        :return: an Account object.
+        """
+        acct = self.get_account_data_by_b58_address(b58_address)
+        salt = base64.b64decode(acct.salt)
+        private_key = Account.get_gcm_decoded_private_key(acct.key, password, b58_address, salt, self.scrypt.n, scheme)
+        return Account(private_key, scheme)
+
+    def iter_accounts(self) -> Iterator[AccountData]:
+        """
+        This interface is used to iterate the accounts in wallet file, each of which is materialized on demand.
+        """
+        for dict_account in self.__iter_entries(self.__acct_offset, self.__acct_count, 'address', self.__acct_changes):
+            yield WalletData.parse_account(dict_account)
+
+    def iter_identities(self) -> Iterator[Identity]:
+        """
+        This interface is used to iterate the identities in wallet file, each of which is materialized on demand.
+        """
+        for dict_identity in self.__iter_entries(self.__identity_offset, self.__identity_count, 'ontid',
+                                                 self.__identity_changes):
+            yield WalletData.parse_identity(dict_identity)
+
+    def to_wallet_data(self) -> WalletData:
+        """
+        This interface is used to materialize the whole wallet.
+        """
+        return WalletData(self.name, self.version, self.create_time, self.default_ont_id, self.default_account_address,
+                          self.scrypt, list(self.iter_identities()), list(self.iter_accounts()))
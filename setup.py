@@ -27,7 +27,8 @@ setup(
         'ecdsa',
         'base58',
         'requests',
-        'websockets'
+        'websockets',
+        'aiohttp'
     ],
     python_requires='>=3.6',
     platforms=["all"],
@@ -4,12 +4,17 @@
 import base64
 import unittest
 
+from unittest.mock import patch
+
 from test import password
 
 from ontology.utils import utils
 from ontology.account.account import Account
 from ontology.wallet.account import AccountData
+from ontology.exception.exception import SDKException
+from ontology.crypto.sign_verify_mode import SignVerifyMode
 from ontology.crypto.signature_scheme import SignatureScheme
+from ontology.crypto.signature_handler import SignatureHandler
 
 
 class TestAccount(unittest.TestCase):
@@ -58,6 +63,42 @@ class TestAccount(unittest.TestCase):
         result = account.verify_signature(msg, signature)
         self.assertEqual(True, result)
 
+    def test_sign_verify_mode(self):
+        account = Account('523c5fcf74823831756f0bcb3634234f10b3beb1c05595058534577752ad2d9f')
+        msg = 'test'.encode('utf-8')
+        for mode in [SignVerifyMode.OFF, SignVerifyMode.SAMPLED, SignVerifyMode.ON]:
+            account.set_sign_verify_mode(mode, 0.5)
+            for _ in range(3):
+                self.assertTrue(account.verify_signature(msg, account.generate_signature(msg)))
+        self.assertRaises(SDKException, account.set_sign_verify_mode, 'off')
+        self.assertRaises(SDKException, Account.set_default_sign_verify_mode, None)
+
+    def test_sign_verify_mode_call_count(self):
+        account = Account('523c5fcf74823831756f0bcb3634234f10b3beb1c05595058534577752ad2d9f')
+        msg = 'test'.encode('utf-8')
+        samples = [0.1, 0.3, 0.2, 0.9, 0.24, 0.25, 0.5, 0.0]
+
+        def count_verify(mode: SignVerifyMode, rate: float = 0.01) -> int:
+            account.set_sign_verify_mode(mode, rate)
+            with patch.object(SignatureHandler, 'verify_signature', autospec=True,
+                              side_effect=SignatureHandler.verify_signature) as verify, \
+                    patch('ontology.account.account.random', side_effect=samples):
+                for _ in range(len(samples)):
+                    account.generate_signature(msg)
+                return verify.call_count
+
+        self.assertEqual(0, count_verify(SignVerifyMode.OFF))
+        self.assertEqual(len(samples), count_verify(SignVerifyMode.ON))
+        self.assertEqual(4, count_verify(SignVerifyMode.SAMPLED, 0.25))
+        self.assertEqual(0, count_verify(SignVerifyMode.SAMPLED, 0))
+        self.assertEqual(len(samples), count_verify(SignVerifyMode.SAMPLED, 1))
+        account.set_sign_verify_mode(None)
+        Account.set_default_sign_verify_mode(SignVerifyMode.OFF)
+        try:
+            self.assertEqual(0, count_verify(None))
+        finally:
+            Account.set_default_sign_verify_mode(SignVerifyMode.ON, 1.0)
+
     def test_get_private_key_bytes(self):
         hex_private_key = '523c5fcf74823831756f0bcb3634234f10b3beb1c05595058534577752ad2d9f'
         account = Account(hex_private_key, SignatureScheme.SHA256withECDSA)
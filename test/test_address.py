@@ -6,6 +6,7 @@ import unittest
 
 from ontology.utils import utils
 from ontology.common.address import Address
+from ontology.exception.exception import SDKException
 from ontology.utils.contract_data_parser import ContractDataParser
 from test import sdk
 
@@ -36,6 +37,38 @@ class TestAddress(unittest.TestCase):
         decode_address = Address.b58decode(b58_address).to_bytes()
         self.assertEqual(rand_code, decode_address)
 
+    def test_address_cache(self):
+        address = Address(utils.get_random_bytes(20))
+        b58_address = address.b58encode()
+        self.assertIs(b58_address, address.b58encode())
+        self.assertIs(address.to_hex_str(), address.to_hex_str())
+        zero = utils.get_random_bytes(20)
+        address.ZERO = zero
+        self.assertEqual(zero, Address.b58decode(address.b58encode()).to_bytes())
+        self.assertEqual(b2a_hex(zero).decode('ascii'), address.to_hex_str())
+        self.assertEqual(b2a_hex(zero[::-1]).decode('ascii'), address.to_reverse_hex_str())
+        pub_key = bytes.fromhex('03036c12be3726eb283d078dff481175e96224f0b0c632c7a37e10eb40fe6be889')
+        pub_key_address = Address.address_from_bytes_pubkey(pub_key)
+        self.assertIs(pub_key_address, Address.address_from_bytes_pubkey(bytearray(pub_key)))
+
+    def test_b58_many(self):
+        script_hashes = [utils.get_random_bytes(20) for _ in range(10)]
+        b58_addresses, errors = Address.b58encode_many(script_hashes + [Address(script_hashes[0]), b'\x00'])
+        self.assertEqual([11], list(errors.keys()))
+        self.assertIsNone(b58_addresses[11])
+        self.assertEqual(b58_addresses[0], b58_addresses[10])
+        self.assertEqual([Address(script_hash).b58encode() for script_hash in script_hashes], b58_addresses[0:10])
+        invalid_checksum = b58_addresses[1][:-1] + ('2' if b58_addresses[1][-1] != '2' else '3')
+        b58_addresses = [b58_addresses[0], invalid_checksum, '1' + b58_addresses[2], b58_addresses[3] + '0',
+                         None, b58_addresses[4][:-1], b58_addresses[5]]
+        addresses, errors = Address.b58decode_many(b58_addresses)
+        self.assertEqual([1, 2, 3, 4, 5], sorted(errors.keys()))
+        self.assertEqual(script_hashes[0], addresses[0].to_bytes())
+        self.assertEqual(script_hashes[5], addresses[6].to_bytes())
+        self.assertIsNone(addresses[1])
+        for b58_address in b58_addresses[1:6]:
+            self.assertRaises(SDKException, Address.b58decode, b58_address)
+
 
 if __name__ == '__main__':
     unittest.main()
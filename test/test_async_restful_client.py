@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import asyncio
+import unittest
+
+from ontology.exception.exception import SDKException
+from ontology.network.async_restful import AsyncRestfulClient
+
+restful_client = AsyncRestfulClient()
+restful_client.connect_to_test_net()
+
+
+def run(coroutine):
+    return asyncio.get_event_loop().run_until_complete(coroutine)
+
+
+class TestAsyncRestfulClient(unittest.TestCase):
+    def test_get_version(self):
+        version = run(restful_client.get_version())
+        self.assertIn('v', version)
+
+    def test_get_block_by_height(self):
+        height = 0
+        block = run(restful_client.get_block_by_height(height))
+        self.assertEqual(block['Header']['Height'], height)
+
+    def test_get_block_count(self):
+        height = run(restful_client.get_block_height())
+        count = run(restful_client.get_block_count())
+        self.assertGreaterEqual(count, height + 1)
+
+    def test_get_balance(self):
+        balance = run(restful_client.get_balance('ANH5bHrrt111XwNEnuPZj6u95Dd6u7G4D6'))
+        self.assertIn('ont', balance)
+        self.assertIn('ong', balance)
+
+    def test_get_smart_contract_event_by_height(self):
+        event_list = run(restful_client.get_smart_contract_event_by_height(0))
+        self.assertTrue(isinstance(event_list, list))
+
+    def test_invalid_address(self):
+        client = AsyncRestfulClient('http://127.0.0.1:1')
+        self.assertRaises(SDKException, run, client.get_version())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import asyncio
+import unittest
+
+from ontology.network.rpc import RpcMethod
+from ontology.exception.exception import SDKException
+from ontology.network.async_rpc import AsyncRpcClient
+from ontology.utils.contract_data_parser import ContractDataParser
+
+rpc_client = AsyncRpcClient()
+rpc_client.connect_to_test_net()
+
+
+def run(coroutine):
+    return asyncio.get_event_loop().run_until_complete(coroutine)
+
+
+class TestAsyncRpcClient(unittest.TestCase):
+    def test_get_version(self):
+        version = run(rpc_client.get_version())
+        self.assertIn('v', version)
+
+    def test_get_block_by_height(self):
+        height = 0
+        block = run(rpc_client.get_block_by_height(height))
+        self.assertEqual(block['Header']['Height'], height)
+
+    def test_get_block_height(self):
+        count = run(rpc_client.get_block_count())
+        height = run(rpc_client.get_block_height())
+        self.assertEqual(count - 1, height)
+
+    def test_get_balance(self):
+        b58_address_list = ['ANH5bHrrt111XwNEnuPZj6u95Dd6u7G4D6', 'ANDfjwrUroaVtvBguDtrWKRMyxFwvVwnZD']
+
+        async def get_balance_list():
+            return await asyncio.gather(*[rpc_client.get_balance(address) for address in b58_address_list])
+
+        balance_list = run(get_balance_list())
+        self.assertEqual(len(b58_address_list), len(balance_list))
+        for balance in balance_list:
+            self.assertIn('ont', balance)
+            self.assertIn('ong', balance)
+
+    def test_get_storage(self):
+        contract_address = '0100000000000000000000000000000000000000'
+        key = '746f74616c537570706c79'
+        value = run(rpc_client.get_storage(contract_address, key))
+        self.assertEqual(1000000000, ContractDataParser.to_int(value))
+
+    def test_send_batch(self):
+        calls = [(RpcMethod.GET_BALANCE, ['invalid address', 1]), RpcMethod.GET_GAS_PRICE]
+        result = run(rpc_client.send_batch(calls))
+        self.assertTrue(isinstance(result[0], SDKException))
+        self.assertGreater(result[1]['gasprice'], 0)
+
+    def test_invalid_address(self):
+        client = AsyncRpcClient('')
+        self.assertRaises(SDKException, run, client.get_version())
+        client.set_address('http://127.0.0.1:1')
+        self.assertRaises(SDKException, run, client.get_version())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import unittest
+
+from ontology.utils import utils
+from ontology.common.define import DID_ONT
+from ontology.wallet.identity import Identity
+from ontology.wallet.account import AccountData
+from ontology.exception.exception import SDKException
+from ontology.wallet.wallet_manager import WalletManager
+from ontology.wallet.binary_wallet import BinaryWallet
+
+path = os.path.join(os.path.dirname(__file__), 'test_binary_wallet.json')
+binary_path = os.path.join(os.path.dirname(__file__), 'test_binary_wallet.bin')
+
+
+class TestBinaryWallet(unittest.TestCase):
+    def tearDown(self):
+        for file_path in (path, binary_path):
+            if os.path.isfile(file_path):
+                os.remove(file_path)
+
+    def test_binary_wallet(self):
+        wm = WalletManager()
+        wm.create_wallet_file(path)
+        wm.open_wallet(path)
+        password = utils.get_random_hex_str(10)
+        acct_list = wm.create_accounts(2, password, labels=['标签', 'label'], max_workers=1)
+        wm.wallet_in_mem.add_account(AccountData(b58_address='address', key='key', salt='salt', public_key='PUBLIC',
+                                                 sig_scheme='SM3withSM2', is_default=False, lock=True))
+        wm.wallet_in_mem.add_identity(Identity(DID_ONT + acct_list[0].b58_address, label='identity'))
+        wm.save()
+        with open(path, 'r') as f:
+            wallet_dict = json.load(f)
+        del wallet_dict['accounts'][1]['publicKey']
+        wallet_dict['accounts'][1]['extra'] = [None, 1]
+        absent_acct = dict(wallet_dict['accounts'][2], address='absent', algorithm=None, signatureScheme=None)
+        for field in ('isDefault', 'lock', 'enc-alg', 'parameters'):
+            del absent_acct[field]
+        wallet_dict['accounts'].append(absent_acct)
+        BinaryWallet.dump(wallet_dict, binary_path)
+        self.assertLess(os.path.getsize(binary_path), len(json.dumps(wallet_dict)))
+        with wm.open_wallet_reader(binary_path) as wallet:
+            self.assertIsInstance(wallet, BinaryWallet)
+            self.assertEqual(wallet_dict, wallet.to_dict())
+            self.assertEqual(4, wallet.account_count)
+            self.assertEqual(absent_acct, wallet.to_dict()['accounts'][3])
+            self.assertEqual('标签', wallet.get_account_data_by_b58_address(acct_list[0].b58_address).label)
+            self.assertEqual(dict(acct_list[0]), dict(wallet.get_default_account_data()))
+            self.assertEqual(dict(wm.wallet_in_mem.accounts[2]), dict(wallet.get_account_data_by_index(2)))
+            self.assertEqual('identity', wallet.get_identity_by_ont_id(DID_ONT + acct_list[0].b58_address).label)
+            self.assertRaises(SDKException, wallet.get_account_data_by_b58_address, 'unknown')
+            self.assertRaises(SDKException, wallet.get_account_data_by_index, 4)
+            acct = wallet.get_account_by_b58_address(acct_list[1].b58_address, password)
+            self.assertEqual(acct_list[1].b58_address, acct.get_address_base58())
+            wallet.export_json(path)
+        with open(path, 'r') as f:
+            self.assertEqual(wallet_dict, json.load(f))
+        BinaryWallet.import_json(path, binary_path)
+        with BinaryWallet(binary_path) as wallet:
+            self.assertEqual(wallet_dict, wallet.to_dict())
+        self.assertRaises(SDKException, BinaryWallet, path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import asyncio
+import unittest
+
+from tempfile import TemporaryDirectory
+
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+from ontology.network.block_fetcher import BlockRangeFetcher
+
+
+class BlockSource(object):
+    def __init__(self, broken_height: int = -1):
+        self.broken_height = broken_height
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_block_by_height(self, height: int) -> dict:
+        self.in_flight += 1
+        self.max_in_flight = max(self.in_flight, self.max_in_flight)
+        await asyncio.sleep(0.001 * (height % 3))
+        self.in_flight -= 1
+        if height == self.broken_height:
+            raise SDKException(ErrorCode.connect_err('ConnectionError'))
+        return dict(Header=dict(Height=height))
+
+    def get_smart_contract_event_by_height(self, height: int) -> list:
+        return [dict(TxHash=str(height))]
+
+
+def run(coroutine):
+    return asyncio.get_event_loop().run_until_complete(coroutine)
+
+
+async def collect(generator) -> list:
+    return [(height, result) async for height, result in generator]
+
+
+class TestBlockRangeFetcher(unittest.TestCase):
+    def test_fetch_blocks(self):
+        source = BlockSource()
+        fetcher = BlockRangeFetcher(source, max_concurrency=4)
+        results = run(collect(fetcher.fetch_blocks(10, 29)))
+        self.assertEqual(list(range(10, 30)), [height for height, _ in results])
+        self.assertEqual(list(range(10, 30)), [block['Header']['Height'] for _, block in results])
+        self.assertEqual(4, source.max_in_flight)
+        self.assertEqual(30, fetcher.checkpoint)
+
+    def test_fetch_events(self):
+        fetcher = BlockRangeFetcher(BlockSource(), max_concurrency=4)
+        results = run(collect(fetcher.fetch_events(0, 9)))
+        fetcher.close()
+        self.assertEqual([[dict(TxHash=str(height))] for height in range(10)], [event for _, event in results])
+
+    def test_resume_from_checkpoint(self):
+        with TemporaryDirectory() as temp_dir:
+            checkpoint_path = os.path.join(temp_dir, 'checkpoint')
+            source = BlockSource(broken_height=15)
+            fetcher = BlockRangeFetcher(source, max_retries=1, retry_delay=0, checkpoint_path=checkpoint_path,
+                                        checkpoint_interval=2)
+            heights = list()
+
+            async def fetch():
+                async for height, _ in fetcher.fetch_blocks(0, 19):
+                    heights.append(height)
+
+            self.assertRaises(SDKException, run, fetch())
+            self.assertEqual(list(range(15)), heights)
+            self.assertEqual(15, fetcher.load_checkpoint())
+            source.broken_height = -1
+            results = run(collect(fetcher.fetch_blocks(0, 19)))
+            self.assertEqual(list(range(15, 20)), [height for height, _ in results])
+            fetcher.clear_checkpoint()
+            self.assertIsNone(fetcher.load_checkpoint())
+
+    def test_invalid_range(self):
+        self.assertRaises(SDKException, BlockRangeFetcher, BlockSource(), 0)
+        fetcher = BlockRangeFetcher(BlockSource())
+        self.assertRaises(SDKException, run, collect(fetcher.fetch_blocks(10, 9)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from test import acct1, acct2
+
+from ontology.core.transaction import Transaction
+from ontology.exception.exception import SDKException
+from ontology.core.bulk_signer import BulkTransactionSigner
+
+
+class TestBulkTransactionSigner(unittest.TestCase):
+    def test_sign(self):
+        payer = acct1.get_address().to_bytes()
+        tx_list = [Transaction(0, 0xd1, nonce, 500, 20000, payer, bytearray(b'\x00\xc6\x6b'), bytearray(), list())
+                   for nonce in range(20)]
+        with BulkTransactionSigner([acct1, acct2], max_workers=2, chunk_size=3) as signer:
+            signed_list = list(signer.sign(iter(tx_list)))
+        self.assertEqual(len(tx_list), len(signed_list))
+        for tx, signed in zip(tx_list, signed_list):
+            signed_tx = Transaction.deserialize_from(signed)
+            self.assertEqual(tx.nonce, signed_tx.nonce)
+            self.assertEqual(tx.hash256_explorer(), signed_tx.hash256_explorer())
+            self.assertEqual(2, len(signed_tx.sigs))
+            self.assertTrue(acct1.verify_signature(tx.hash256_bytes(), signed_tx.sigs[0].sig_data[0]))
+            self.assertTrue(acct2.verify_signature(tx.hash256_bytes(), signed_tx.sigs[1].sig_data[0]))
+
+    def test_invalid_signer(self):
+        self.assertRaises(SDKException, BulkTransactionSigner, list())
+        self.assertRaises(SDKException, BulkTransactionSigner, [acct1], 1, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import base64
 import unittest
 
 from time import time
@@ -121,6 +122,17 @@ class TestClaim(unittest.TestCase):
         claim.blk_proof.proof_node = proof_node
         self.assertFalse(claim.validate_blk_proof())
 
+    def test_validate_malformed_signatures(self):
+        b64_head = Header('did:ont:TRAtosUZHNSiLhzBdHacyxMX4Bg3cjWy3r#keys-1').to_base64()
+        clm_rev = dict(typ='AttestContract', addr='8055b362904715fd84536e754868f4c8d27ca3f6')
+        sub = 'did:ont:SI59Js0zpNSiPOzBdB5cyxu80BO3cjGT70'
+        b64_payload = Payload('0.7.0', 'TRAtosUZHNSiLhzBdHacyxMX4Bg3cjWy3r', sub, 1525465044, 1530735444,
+                              'https://example.com/template/v1', dict(Name='Bob Dylan'), clm_rev).to_base64()
+        b64_empty = base64.b64encode(b'{}').decode('ascii')
+        b64_claims = ['claim', f'{b64_head}.!!!.AAAA.', f'{b64_head}.{b64_empty}.AAAA.',
+                      f'{b64_empty}.{b64_payload}.AAAA.', f'{b64_head}.{b64_payload}.AAAA.', None]
+        self.assertEqual([False] * len(b64_claims), sdk.service.claim().validate_signatures(b64_claims))
+
     def test_compatibility(self):
         b64_claim = ('eyJraWQiOiJkaWQ6b250OkFUWmhhVmlyZEVZa3BzSFFEbjlQTXQ1a0RDcTFWUEhjVHIja2V5cy0xIiwidHlwIjoiSldULVgiL'
                      'CJhbGciOiJPTlQtRVMyNTYifQ==.eyJjbG0tcmV2Ijp7InR5cCI6IkF0dGVzdENvbnRyYWN0IiwiYWRkciI6IjM2YmI1YzA1M'
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import threading
+import unittest
+
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+from ontology.network.rpc import RpcClient
+from ontology.network.restful import RestfulClient
+from ontology.exception.exception import SDKException
+from ontology.network.connection_pool import HttpConnectionPool
+
+
+class MockNodeHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def __send_json(self, data: dict):
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        payload = json.loads(self.rfile.read(length).decode('utf-8'))
+        self.__send_json(dict(desc='SUCCESS', error=0, id=payload['id'], jsonrpc='2.0', result='v1.0.0'))
+
+    def do_GET(self):
+        self.__send_json(dict(Action='getversion', Desc='SUCCESS', Error=0, Result='v1.0.0', Version='1.0.0'))
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHttpConnectionPool(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = HTTPServer(('127.0.0.1', 0), MockNodeHandler)
+        cls.url = f'http://127.0.0.1:{cls.server.server_port}'
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_keep_alive(self):
+        pool = HttpConnectionPool(pool_maxsize=2)
+        rpc = RpcClient(self.url, pool=pool)
+        restful = RestfulClient(self.url, pool=pool)
+        for _ in range(5):
+            self.assertEqual('v1.0.0', rpc.get_version())
+            self.assertEqual('v1.0.0', restful.get_version())
+        statistics = pool.get_statistics()
+        self.assertEqual(1, statistics['new_connections'])
+        self.assertEqual(9, statistics['hits'])
+        self.assertEqual(0, statistics['in_flight'])
+        pool.close()
+        self.assertEqual(0, pool.get_statistics()['new_connections'])
+
+    def test_default_pool(self):
+        self.assertIs(HttpConnectionPool.get_default_pool(), RpcClient().get_connection_pool())
+        self.assertIs(HttpConnectionPool.get_default_pool(), RestfulClient().get_connection_pool())
+
+    def test_invalid_pool(self):
+        self.assertRaises(SDKException, HttpConnectionPool, 0)
+        self.assertRaises(SDKException, RpcClient().set_connection_pool, None)
+
+
+if __name__ == '__main__':
+    unittest.main()
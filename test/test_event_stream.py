@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import asyncio
+import unittest
+
+import websockets
+
+from ontology.exception.exception import SDKException
+from ontology.network.websocket import WebsocketClient
+from ontology.network.event_stream import ContractEventStream, BackpressurePolicy
+
+OEP4_CONTRACT_ADDRESS = '1ddbb682743e9d9e2b71ff419e97a9358c5c4ee9'
+OTHER_CONTRACT_ADDRESS = '0300000000000000000000000000000000000000'
+
+
+class NotifySource(object):
+    def __init__(self, responses: list):
+        self.subscription = None
+        self.__responses = list(responses)
+
+    async def subscribe(self, contract_address_list, is_event: bool = False):
+        self.subscription = (contract_address_list, is_event)
+
+    async def recv_subscribe_info(self, is_full: bool = False):
+        if len(self.__responses) == 0:
+            await asyncio.Event().wait()
+        await asyncio.sleep(0)
+        return self.__responses.pop(0)
+
+
+def transfer_notify(amount: str) -> dict:
+    states = ['7472616e73666572', '46b1a18af6b7c9f8c4ff9a6be4e61d2d6a0b7bba',
+              'feec06b79ed299ea06fcb94abac41aaf3ead7658', amount]
+    return dict(ContractAddress=OEP4_CONTRACT_ADDRESS, States=states)
+
+
+def event_response(tx_hash: str, notify_list: list) -> dict:
+    result = dict(TxHash=tx_hash, State=1, GasConsumed=0, Notify=notify_list)
+    return dict(Action='Notify', Desc='SUCCESS', Error=0, Result=result, Version='1.0.0')
+
+
+def run(coroutine):
+    return asyncio.get_event_loop().run_until_complete(coroutine)
+
+
+class TestContractEventStream(unittest.TestCase):
+    def test_filter_and_decode(self):
+        approve = dict(ContractAddress=OEP4_CONTRACT_ADDRESS, States=['617070726f7665', '00', '00', '01'])
+        other = dict(ContractAddress=OTHER_CONTRACT_ADDRESS, States=['7472616e73666572'])
+        responses = [event_response('00', [approve, transfer_notify('e803'), other]),
+                     dict(Action='Notify', Desc='INVALID', Error=42001, Result='', Version='1.0.0')]
+        source = NotifySource(responses)
+
+        async def collect():
+            async with ContractEventStream(source, OEP4_CONTRACT_ADDRESS, ['transfer'],
+                                           is_oep4_transfer=True) as stream:
+                async for event in stream:
+                    return event
+
+        event = run(collect())
+        self.assertEqual(([OEP4_CONTRACT_ADDRESS], True), source.subscription)
+        self.assertEqual('00', event['TxHash'])
+        self.assertEqual('transfer', event['EventName'])
+        states = ['transfer', 'ANDfjwrUroaVxwqCi33YizNVPMmaxYVHa5', 'Af1n2cZHhMZumNqKgw9sfCNoTWu9de4NDn', 1000]
+        self.assertEqual(states, event['States'])
+
+    def test_backpressure(self):
+        responses = [event_response(str(index), [transfer_notify('0%d' % index)]) for index in range(8)]
+
+        async def consume(policy: BackpressurePolicy) -> tuple:
+            stream = ContractEventStream(NotifySource(responses), OEP4_CONTRACT_ADDRESS, max_size=2, policy=policy)
+            await stream.start()
+            for _ in range(20):
+                await asyncio.sleep(0)
+            pending = stream.get_statistics()['pending']
+            await stream.close()
+            tx_hash_list = [event['TxHash'] async for event in stream]
+            return pending, tx_hash_list, stream.get_statistics()
+
+        pending, tx_hash_list, statistics = run(consume(BackpressurePolicy.BLOCK))
+        self.assertEqual(2, pending)
+        self.assertEqual(['0', '1'], tx_hash_list)
+        self.assertEqual(0, statistics['dropped'])
+        pending, tx_hash_list, statistics = run(consume(BackpressurePolicy.DROP_OLDEST))
+        self.assertEqual(['6', '7'], tx_hash_list)
+        self.assertEqual(6, statistics['dropped'])
+        pending, tx_hash_list, statistics = run(consume(BackpressurePolicy.COALESCE))
+        self.assertEqual(['7'], tx_hash_list)
+        self.assertEqual(7, statistics['coalesced'])
+
+    def test_multiplexed_backpressure(self):
+        async def serve(ws_client, *args):
+            async for message in ws_client:
+                msg = json.loads(message)
+                response = dict(Action=msg['Action'], Desc='SUCCESS', Error=0, Id=msg['Id'], Result=100)
+                await ws_client.send(json.dumps(response))
+                if msg['Action'] == 'subscribe':
+                    for index in range(20):
+                        await ws_client.send(json.dumps(event_response(str(index), [transfer_notify('01')])))
+
+        async def consume(policy: BackpressurePolicy) -> tuple:
+            server = await websockets.serve(serve, '127.0.0.1', 0)
+            client = WebsocketClient(f'ws://127.0.0.1:{server.sockets[0].getsockname()[1]}', is_multiplexed=True)
+            try:
+                async with ContractEventStream(client, OEP4_CONTRACT_ADDRESS, max_size=4, policy=policy) as stream:
+                    await asyncio.sleep(0.2)
+                    statistics = stream.get_statistics(), client.get_subscribe_statistics()
+                    height = await asyncio.wait_for(client.get_block_height(), 1)
+            finally:
+                await client.close_connect()
+                server.close()
+                await server.wait_closed()
+            return statistics, height
+
+        (stream_statistics, client_statistics), height = run(consume(BackpressurePolicy.BLOCK))
+        self.assertEqual(100, height)
+        self.assertEqual(4, stream_statistics['pending'])
+        self.assertEqual(4, client_statistics['pending'])
+        self.assertEqual(0, stream_statistics['dropped'] + client_statistics['dropped'])
+        (stream_statistics, client_statistics), height = run(consume(BackpressurePolicy.DROP_OLDEST))
+        self.assertEqual(100, height)
+        self.assertEqual(4, stream_statistics['pending'])
+        self.assertEqual(16, stream_statistics['dropped'] + client_statistics['dropped'])
+        (stream_statistics, client_statistics), height = run(consume(BackpressurePolicy.COALESCE))
+        self.assertEqual(100, height)
+        self.assertEqual(1, stream_statistics['pending'])
+        self.assertEqual(19, stream_statistics['coalesced'])
+        self.assertEqual(0, stream_statistics['dropped'] + client_statistics['dropped'])
+        self.assertEqual(BackpressurePolicy.BLOCK.value, client_statistics['policy'])
+        self.assertRaises(SDKException, WebsocketClient, max_subscribe_queue_size=-1)
+        self.assertRaises(SDKException, WebsocketClient, subscribe_policy=BackpressurePolicy.COALESCE)
+        self.assertRaises(SDKException, WebsocketClient().set_subscribe_buffer, 4, BackpressurePolicy.COALESCE)
+
+    def test_invalid_stream(self):
+        self.assertRaises(SDKException, ContractEventStream, NotifySource([]), OEP4_CONTRACT_ADDRESS, max_size=0)
+        self.assertRaises(SDKException, ContractEventStream, NotifySource([]), OEP4_CONTRACT_ADDRESS, policy='block')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import copy
+import pickle
+import unittest
+
+from ontology.common.define import DID_ONT
+from ontology.wallet.control import Control
+from ontology.wallet.identity import Identity
+from ontology.wallet.wallet import WalletData
+from ontology.wallet.account import AccountData
+from ontology.wallet.indexed_list import IndexedList
+from ontology.exception.exception import SDKException
+
+
+class CountedItem(object):
+    read_count = 0
+
+    def __init__(self, key: str):
+        self.__key = key
+
+    @property
+    def key(self):
+        CountedItem.read_count += 1
+        return self.__key
+
+    @key.setter
+    def key(self, key: str):
+        old_key, self.__key = self.__key, key
+        IndexedList.notify_key_changed(self, 'key', old_key)
+
+
+class TestIndexedList(unittest.TestCase):
+    def test_find(self):
+        acct_list = IndexedList([AccountData(b58_address=str(index)) for index in range(5)], 'b58_address')
+        self.assertEqual('3', acct_list.find('b58_address', '3').b58_address)
+        self.assertIsNone(acct_list.find('b58_address', '5'))
+        acct_list.append(AccountData(b58_address='5'))
+        acct_list.extend([AccountData(b58_address='6')])
+        acct_list += [AccountData(b58_address='7')]
+        self.assertEqual('7', acct_list.find('b58_address', '7').b58_address)
+        acct_list.remove(acct_list.find('b58_address', '5'))
+        self.assertIsNone(acct_list.find('b58_address', '5'))
+        del acct_list[0]
+        self.assertIsNone(acct_list.find('b58_address', '0'))
+        acct_list.pop()
+        self.assertIsNone(acct_list.find('b58_address', '7'))
+        acct_list[0].b58_address = 'changed'
+        self.assertIsNone(acct_list.find('b58_address', '1'))
+        self.assertIs(acct_list[0], acct_list.find('b58_address', 'changed'))
+        acct_list.insert(0, AccountData(b58_address='changed'))
+        self.assertIs(acct_list[0], acct_list.find('b58_address', 'changed'))
+        acct_list.remove(acct_list[0])
+        self.assertIs(acct_list[0], acct_list.find('b58_address', 'changed'))
+        acct_list.clear()
+        self.assertIsNone(acct_list.find('b58_address', 'changed'))
+
+    def test_key_changed(self):
+        item_list = IndexedList([CountedItem(str(index)) for index in range(100)], 'key')
+        other_list = IndexedList([CountedItem('a')], 'key')
+        shared_item = item_list[50]
+        other_list.append(shared_item)
+        other_list[0].key = 'b'
+        shared_item.key = 'c'
+        CountedItem.read_count = 0
+        self.assertIs(item_list[3], item_list.find('key', '3'))
+        self.assertIs(shared_item, item_list.find('key', 'c'))
+        self.assertIsNone(item_list.find('key', '50'))
+        self.assertEqual(2, CountedItem.read_count)
+        self.assertIs(shared_item, other_list.find('key', 'c'))
+        self.assertIs(other_list[0], other_list.find('key', 'b'))
+        self.assertIsNone(other_list.find('key', 'a'))
+        item_list[3].key = '4'
+        self.assertIs(item_list[3], item_list.find('key', '4'))
+        item_list.remove(item_list[3])
+        self.assertIs(item_list[3], item_list.find('key', '4'))
+        removed_item = item_list.pop(0)
+        removed_item.key = 'removed'
+        self.assertIsNone(item_list.find('key', 'removed'))
+
+    def test_copy(self):
+        acct_list = IndexedList([AccountData(b58_address=str(index)) for index in range(5)], 'b58_address')
+        copied_list = copy.deepcopy(acct_list)
+        self.assertIsInstance(copied_list, IndexedList)
+        self.assertIsNot(acct_list.find('b58_address', '3'), copied_list.find('b58_address', '3'))
+        self.assertIs(copied_list[3], copied_list.find('b58_address', '3'))
+        copied_list[3].b58_address = 'copied'
+        self.assertIs(acct_list[3], acct_list.find('b58_address', '3'))
+        self.assertIs(copied_list[3], copied_list.find('b58_address', 'copied'))
+        self.assertEqual(1, len(copied_list[3]._IndexedList__owners))
+        identity = Identity(DID_ONT + 'address0', controls=[Control('keys-1')])
+        loaded_list = pickle.loads(pickle.dumps(IndexedList([identity], 'ont_id')))
+        loaded_identity = loaded_list.find('ont_id', DID_ONT + 'address0')
+        self.assertEqual(dict(identity), dict(loaded_identity))
+        self.assertIs(loaded_identity, loaded_identity.controls._IndexedList__parent)
+
+    def test_wallet_data(self):
+        wallet = WalletData()
+        wallet.accounts = [AccountData(b58_address=str(index), is_default=False) for index in range(3)]
+        self.assertIsInstance(wallet.accounts, IndexedList)
+        wallet.set_default_account_by_address('1')
+        wallet.set_default_account_by_index(0)
+        wallet.set_default_account_by_address('2')
+        self.assertEqual([False, False, True], [acct.is_default for acct in wallet.accounts])
+        self.assertEqual('2', wallet.get_default_account_address())
+        self.assertEqual('2', wallet.get_account_by_b58_address('2').b58_address)
+        wallet.remove_account('2')
+        self.assertRaises(SDKException, wallet.get_account_by_b58_address, '2')
+        ont_id = DID_ONT + 'AazEvfQPcQ2GEFFPLF1ZLwQ7K5jDn81hve'
+        identity = Identity(ont_id, controls=[Control(kid='keys-1', address='AazEvfQPcQ2GEFFPLF1ZLwQ7K5jDn81hve')])
+        wallet.add_identity(identity)
+        self.assertRaises(SDKException, wallet.add_identity, Identity(ont_id))
+        self.assertIs(identity, wallet.get_identity_by_ont_id(ont_id))
+        self.assertIs(identity.controls[0], wallet.get_control_by_kid(f'{ont_id}#keys-1'))
+        self.assertIs(identity.controls[0], identity.get_control_by_b58_address('AazEvfQPcQ2GEFFPLF1ZLwQ7K5jDn81hve'))
+        self.assertRaises(SDKException, wallet.get_control_by_kid, f'{ont_id}#keys-2')
+        self.assertEqual(dict(wallet), dict(copy.deepcopy(wallet)))
+        wallet.remove_identity(ont_id)
+        self.assertRaises(SDKException, wallet.get_identity_by_ont_id, ont_id)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import time
+import asyncio
+import threading
+import unittest
+
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from ontology.exception.error_code import ErrorCode
+from ontology.exception.exception import SDKException
+from ontology.network.restful import RestfulClient
+from ontology.network.connection_pool import HttpConnectionPool
+from ontology.network.load_balancer import LoadBalancer, BalanceStrategy
+
+
+class MockNodeHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    stall = 0
+
+    def do_GET(self):
+        time.sleep(self.stall)
+        body = json.dumps(dict(Action='getversion', Desc='SUCCESS', Error=0, Result='v1.0.0', Version='1.0.0'))
+        body = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class StalledNodeHandler(MockNodeHandler):
+    stall = 1
+
+
+class TestLoadBalancer(unittest.TestCase):
+    def test_round_robin(self):
+        balancer = LoadBalancer(['a', 'b', 'c'], BalanceStrategy.ROUND_ROBIN)
+        self.assertEqual(['a', 'b', 'c', 'a'], [balancer.select() for _ in range(4)])
+
+    def test_ewma(self):
+        balancer = LoadBalancer(['a', 'b'], alpha=0.5)
+        self.assertEqual('a', balancer.select())
+        balancer.record_success('a', 0.4)
+        self.assertEqual('b', balancer.select())
+        balancer.record_success('b', 0.2)
+        self.assertEqual('b', balancer.select())
+        balancer.record_success('b', 1.0)
+        self.assertAlmostEqual(0.6, balancer.get_statistics()[1]['latency'])
+        self.assertEqual('a', balancer.select())
+
+    def test_circuit_breaker(self):
+        balancer = LoadBalancer(['a', 'b'], failure_threshold=2, recovery_timeout=0.05)
+        balancer.record_failure('a', 0.1)
+        self.assertTrue(balancer.get_statistics()[0]['isHealthy'])
+        balancer.record_failure('a', 0.1)
+        self.assertFalse(balancer.get_statistics()[0]['isHealthy'])
+        self.assertEqual('b', balancer.select())
+        balancer.record_failure('b', 0.1)
+        balancer.record_failure('b', 0.1)
+        self.assertEqual('a', balancer.select())
+        time.sleep(0.1)
+        self.assertTrue(balancer.get_statistics()[0]['isHealthy'])
+        balancer.record_success('a', 0.1)
+        self.assertEqual(0, balancer.get_statistics()[0]['failures'])
+
+    def test_request_failover(self):
+        balancer = LoadBalancer(['a', 'b', 'c'])
+        tried = list()
+
+        def send(url: str):
+            tried.append(url)
+            if url != 'c':
+                raise SDKException(ErrorCode.other_error(''.join(['ConnectionError: ', url])))
+            return url
+
+        self.assertEqual('c', balancer.request(send))
+        self.assertEqual(['a', 'b', 'c'], tried)
+        tried.clear()
+        self.assertRaises(SDKException, balancer.request, send, False, ['c'])
+        self.assertEqual(1, len(tried))
+
+    def test_restful_read_timeout_failover(self):
+        servers = [ThreadingHTTPServer(('127.0.0.1', 0), handler) for handler in [StalledNodeHandler, MockNodeHandler]]
+        for server in servers:
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+        urls = [f'http://127.0.0.1:{server.server_port}' for server in servers]
+        try:
+            restful = RestfulClient(urls[0], HttpConnectionPool(read_timeout=0.2))
+            self.assertRaises(SDKException, restful.get_version)
+            restful.set_endpoints(urls, BalanceStrategy.ROUND_ROBIN, failure_threshold=1)
+            self.assertEqual('v1.0.0', restful.get_version())
+            statistics = restful.get_load_balancer().get_statistics()
+            self.assertFalse(statistics[0]['isHealthy'])
+            self.assertEqual(0, statistics[1]['failures'])
+        finally:
+            for server in servers:
+                server.shutdown()
+                server.server_close()
+
+    def test_request_async_failover(self):
+        balancer = LoadBalancer(['a', 'b'])
+
+        async def send(url: str):
+            if url == 'a':
+                raise SDKException(ErrorCode.other_error(''.join(['ConnectionError: ', url])))
+            return url
+
+        self.assertEqual('b', asyncio.get_event_loop().run_until_complete(balancer.request_async(send)))
+        self.assertEqual('b', balancer.select())
+
+    def test_invalid_params(self):
+        self.assertRaises(SDKException, LoadBalancer, [])
+        self.assertRaises(SDKException, LoadBalancer, ['a'], 'ewma')
+        self.assertRaises(SDKException, LoadBalancer, ['a'], alpha=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import asyncio
+import threading
+import unittest
+
+from types import SimpleNamespace
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from ontology.network.rpc import RpcClient, RpcMethod
+from ontology.network.async_rpc import AsyncRpcClient
+from ontology.smart_contract.native_contract.asset import Asset
+from ontology.exception.exception import SDKException
+from ontology.network.query_cache import QueryCache
+
+
+class MockNodeHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    block_count = 100
+    gas_price_count = 0
+    token_name = 'ONT Token'
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        payload = json.loads(self.rfile.read(length).decode('utf-8'))
+        if payload['method'] == RpcMethod.GET_GAS_PRICE:
+            MockNodeHandler.gas_price_count += 1
+            result = dict(gasprice=500, height=MockNodeHandler.block_count - 1)
+        elif payload['method'] == RpcMethod.SEND_TRANSACTION:
+            result = dict(State=1, Gas=20000, Result=MockNodeHandler.token_name.encode('utf-8').hex())
+        else:
+            result = MockNodeHandler.block_count
+        body = json.dumps(dict(desc='SUCCESS', error=0, id=payload['id'], jsonrpc='2.0', result=result))
+        body = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class Counter(object):
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self):
+        self.count += 1
+        return self.count
+
+
+class TestQueryCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), MockNodeHandler)
+        cls.url = f'http://127.0.0.1:{cls.server.server_port}'
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_block_height_invalidation(self):
+        cache = QueryCache()
+        query = Counter()
+        cache.set_block_height(10)
+        self.assertEqual(1, cache.get_or_query(('balanceOf', 'ont'), query))
+        self.assertEqual(1, cache.get_or_query(('balanceOf', 'ont'), query))
+        cache.set_block_height(9)
+        self.assertEqual(1, cache.get_or_query(('balanceOf', 'ont'), query))
+        cache.set_block_height(11)
+        self.assertEqual(2, cache.get_or_query(('balanceOf', 'ont'), query))
+        cache.invalidate(('balanceOf', 'ont'))
+        self.assertEqual(3, cache.get_or_query(('balanceOf', 'ont'), query))
+        statistics = cache.get_statistics()
+        self.assertEqual(2, statistics['hits'])
+        self.assertEqual(3, statistics['misses'])
+
+    def test_permanent(self):
+        cache = QueryCache()
+        query = Counter()
+        self.assertEqual(1, cache.get_or_query(('decimals', 'ont'), query, True))
+        cache.set_block_height(100)
+        self.assertEqual(1, cache.get_or_query(('decimals', 'ont'), query, True))
+        cache.invalidate()
+        self.assertEqual(2, cache.get_or_query(('decimals', 'ont'), query, True))
+        self.assertRaises(SDKException, QueryCache, 0)
+
+    def test_ttl(self):
+        cache = QueryCache(ttl=1e-9)
+        query = Counter()
+        self.assertEqual(1, cache.get_or_query(('gasprice',), query))
+        self.assertEqual(2, cache.get_or_query(('gasprice',), query))
+
+    def test_gas_price(self):
+        rpc = RpcClient(self.url)
+        rpc.set_query_cache(QueryCache(height_check_interval=0))
+        count = MockNodeHandler.gas_price_count
+        self.assertEqual(500, rpc.get_gas_price())
+        self.assertEqual(500, rpc.get_gas_price())
+        self.assertEqual(count + 1, MockNodeHandler.gas_price_count)
+        MockNodeHandler.block_count += 1
+        self.assertEqual(500, rpc.get_gas_price())
+        self.assertEqual(count + 2, MockNodeHandler.gas_price_count)
+        self.assertEqual(MockNodeHandler.block_count - 1, rpc.get_query_cache().block_height)
+        self.assertRaises(SDKException, rpc.set_query_cache, dict())
+
+    def test_permanent_by_address(self):
+        rpc = RpcClient(self.url)
+        rpc.set_query_cache(QueryCache())
+        asset = Asset(SimpleNamespace(rpc=rpc))
+        MockNodeHandler.token_name = 'ONT Token'
+        self.assertEqual('ONT Token', asset.query_name('ont'))
+        MockNodeHandler.token_name = 'Other Token'
+        self.assertEqual('ONT Token', asset.query_name('ont'))
+        rpc.set_address(self.url.replace('127.0.0.1', 'localhost'))
+        self.assertEqual('Other Token', asset.query_name('ont'))
+        self.assertEqual(2, rpc.get_query_cache().get_statistics()['permanent'])
+
+    def test_async_gas_price(self):
+        rpc = AsyncRpcClient(self.url)
+        rpc.set_query_cache(QueryCache(height_check_interval=0))
+        count = MockNodeHandler.gas_price_count
+
+        async def get_gas_price_list():
+            return [await rpc.get_gas_price() for _ in range(2)]
+
+        self.assertEqual([500, 500], asyncio.run(get_gas_price_list()))
+        self.assertEqual(count + 1, MockNodeHandler.gas_price_count)
+        MockNodeHandler.block_count += 1
+        self.assertEqual(500, asyncio.run(rpc.get_gas_price()))
+        self.assertEqual(count + 2, MockNodeHandler.gas_price_count)
+        self.assertEqual(MockNodeHandler.block_count - 1, rpc.get_query_cache().block_height)
+        self.assertEqual(MockNodeHandler.block_count, asyncio.run(rpc.get_block_count()))
+        asyncio.run(rpc.get_connection_pool().close())
+
+
+if __name__ == '__main__':
+    unittest.main()
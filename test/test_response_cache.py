@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import threading
+import unittest
+
+from tempfile import TemporaryDirectory
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from ontology.network.rpc import RpcClient
+from ontology.exception.exception import SDKException
+from ontology.network.response_cache import ResponseCache
+
+
+class MockNodeHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    request_count = 0
+
+    def do_POST(self):
+        MockNodeHandler.request_count += 1
+        length = int(self.headers.get('Content-Length', 0))
+        payload = json.loads(self.rfile.read(length).decode('utf-8'))
+        result = dict(Hash=payload['params'][0], Header=dict(Height=payload['params'][0]))
+        body = json.dumps(dict(desc='SUCCESS', error=0, id=payload['id'], jsonrpc='2.0', result=result))
+        body = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestResponseCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), MockNodeHandler)
+        cls.url = f'http://127.0.0.1:{cls.server.server_port}'
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_lru(self):
+        cache = ResponseCache(max_size=2)
+        for height in range(3):
+            cache.put(ResponseCache.generate_key('getblock', [height, 1]), dict(result=height))
+        self.assertIsNone(cache.get(ResponseCache.generate_key('getblock', [0, 1])))
+        response = cache.get(ResponseCache.generate_key('getblock', [1, 1]))
+        self.assertEqual(dict(result=1), response)
+        response['result'] = 0
+        self.assertEqual(dict(result=1), cache.get(ResponseCache.generate_key('getblock', [1, 1])))
+        self.assertEqual(dict(hits=2, disk_hits=0, misses=1, size=2), cache.get_statistics())
+        self.assertRaises(SDKException, ResponseCache, 0)
+
+    def test_disk_cache(self):
+        with TemporaryDirectory() as temp_dir:
+            cache_path = os.path.join(temp_dir, 'cache.db')
+            cache = ResponseCache(max_size=1, cache_path=cache_path)
+            cache.put('a', dict(result='a'))
+            cache.put('b', dict(result='b'))
+            cache.close()
+            cache = ResponseCache(cache_path=cache_path)
+            self.assertEqual(dict(result='a'), cache.get('a'))
+            self.assertEqual(dict(result='a'), cache.get('a'))
+            self.assertEqual(dict(hits=2, disk_hits=1, misses=0, size=1), cache.get_statistics())
+            cache.clear()
+            self.assertIsNone(cache.get('b'))
+            cache.close()
+
+    def test_rpc_client(self):
+        rpc = RpcClient(self.url)
+        rpc.set_response_cache(ResponseCache())
+        count = MockNodeHandler.request_count
+        for _ in range(3):
+            self.assertEqual(10, rpc.get_block_by_height(10)['Header']['Height'])
+            self.assertEqual('ab' * 32, rpc.get_merkle_proof('ab' * 32)['Hash'])
+        self.assertEqual(count + 2, MockNodeHandler.request_count)
+        self.assertEqual(4, rpc.get_response_cache().get_statistics()['hits'])
+        self.assertRaises(SDKException, rpc.set_response_cache, dict())
+
+
+if __name__ == '__main__':
+    unittest.main()
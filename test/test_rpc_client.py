@@ -8,6 +8,7 @@ from test import acct1, acct2, acct3
 
 from ontology.exception.exception import SDKException
 from ontology.ont_sdk import OntologySdk
+from ontology.network.rpc import RpcMethod
 from ontology.common.address import Address
 from ontology.account.account import Account
 from ontology.utils.utils import get_random_hex_str
@@ -157,6 +158,22 @@ class TestRpcClient(unittest.TestCase):
         value = ContractDataParser.to_int(value)
         self.assertEqual(1000000000, value)
 
+    def test_send_batch(self):
+        sdk = OntologySdk()
+        sdk.rpc.connect_to_test_net()
+        contract_address = '0100000000000000000000000000000000000000'
+        calls = [(RpcMethod.GET_BALANCE, ['ANH5bHrrt111XwNEnuPZj6u95Dd6u7G4D6', 1]),
+                 (RpcMethod.GET_STORAGE, [contract_address, '746f74616c537570706c79', 1]),
+                 (RpcMethod.GET_BALANCE, ['invalid address', 1]), RpcMethod.GET_GAS_PRICE]
+        result = sdk.rpc.send_batch(calls)
+        self.assertEqual(len(calls), len(result))
+        self.assertIn('ont', result[0])
+        self.assertIn('ong', result[0])
+        self.assertEqual(1000000000, ContractDataParser.to_int(result[1]))
+        self.assertTrue(isinstance(result[2], SDKException))
+        self.assertGreater(result[3]['gasprice'], 0)
+        self.assertEqual([], sdk.rpc.send_batch([]))
+
     def test_get_smart_contract_event_by_tx_hash(self):
         sdk = OntologySdk()
         sdk.rpc.connect_to_test_net()
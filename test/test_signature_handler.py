@@ -8,6 +8,7 @@ from ontology.crypto.signature_scheme import SignatureScheme
 from test import sdk, acct1, acct2
 
 from ontology.crypto.key_type import KeyType
+from ontology.exception.exception import SDKException
 from ontology.crypto.signature_handler import SignatureHandler
 
 
@@ -44,3 +45,28 @@ class TestSignatureHandler(unittest.TestCase):
         handler = SignatureHandler(KeyType.ECDSA, SignatureScheme.SHA256withECDSA)
         result = handler.verify_signature(binascii.a2b_hex(pk), msg, binascii.a2b_hex(sign))
         self.assertTrue(result)
+
+    def test_verify_uncompressed_public_key(self):
+        msg = b'123'
+        sign = '0b6912568942a1e646b3a532dc904e965eb1085bab877bc34fe06768257f07b3' \
+               '079af3fa69fc759b51fa2bf894a7fd748ab5bc326c8663a01f90dcc518184e65'
+        pk = binascii.a2b_hex('03036c12be3726eb283d078dff481175e96224f0b0c632c7a37e10eb40fe6be889')
+        uncompressed_pk = b'\x04' + SignatureHandler.uncompress_public_key(pk)
+        self.assertTrue(SignatureHandler.verify_signature(uncompressed_pk, msg, binascii.a2b_hex(sign)))
+        self.assertFalse(SignatureHandler.verify_signature(pk, b'1234', binascii.a2b_hex(sign)))
+        self.assertFalse(SignatureHandler.verify_signature(pk, msg, binascii.a2b_hex(sign)[:-1]))
+        self.assertIs(SignatureHandler.load_public_key(pk), SignatureHandler.load_public_key(pk))
+        self.assertRaises(SDKException, SignatureHandler.verify_signature, b'\x05' + pk[1:], msg, sign)
+
+    def test_verify_many(self):
+        msg = b'123'
+        sign = binascii.a2b_hex('0b6912568942a1e646b3a532dc904e965eb1085bab877bc34fe06768257f07b3'
+                                '079af3fa69fc759b51fa2bf894a7fd748ab5bc326c8663a01f90dcc518184e65')
+        pk = binascii.a2b_hex('03036c12be3726eb283d078dff481175e96224f0b0c632c7a37e10eb40fe6be889')
+        uncompressed_pk = b'\x04' + SignatureHandler.uncompress_public_key(pk)
+        items = [(pk, msg, sign), (pk, b'1234', sign), (b'\x05' + pk[1:], msg, sign), (uncompressed_pk, msg, sign),
+                 (bytearray(pk), msg, sign[:-1])]
+        expected = [True, False, False, True, False]
+        self.assertEqual(expected, SignatureHandler.verify_many(items))
+        self.assertEqual(expected, SignatureHandler.verify_many(items, max_workers=4))
+        self.assertEqual(list(), SignatureHandler.verify_many(list()))
@@ -11,6 +11,7 @@ from ontology.utils import utils
 from ontology.ont_sdk import OntologySdk
 from ontology.common.address import Address
 from ontology.core.transaction import Transaction
+from ontology.exception.exception import SDKException
 from ontology.utils.contract_event_parser import ContractEventParser
 
 
@@ -31,6 +32,47 @@ class TestTransaction(unittest.TestCase):
         self.assertGreaterEqual(tx.gas_limit, 0)
         self.assertGreaterEqual(tx.gas_price, 0)
         self.assertGreaterEqual(tx.nonce, 0)
+        self.assertEqual(tx_hex, tx.serialize(is_hex=True).decode('ascii'))
+        self.assertEqual(utils.hex_to_bytes(tx_hex), tx.serialize())
+        self.assertEqual(tx.serialize_unsigned(), tx.serialize(is_hex=True)[:len(tx.serialize_unsigned())])
+
+    def test_hash_cache(self):
+        tx = Transaction(0, 0xd1, 1, 500, 20000, None, bytearray(b'\x00\xc6\x6b'), bytearray(), list())
+        tx_hash = tx.hash256_explorer()
+        tx.sigs = list()
+        self.assertEqual(tx_hash, tx.hash256_explorer())
+        tx.nonce = 2
+        self.assertNotEqual(tx_hash, tx.hash256_explorer())
+        tx.nonce = 1
+        self.assertEqual(tx_hash, tx.hash256_explorer())
+        for field, value in [('gas_price', 0), ('gas_limit', 0), ('payer', b'\x01' * 20), ('payload', b'\x00'),
+                             ('attributes', bytearray(b'\x00'))]:
+            origin = getattr(tx, field)
+            setattr(tx, field, value)
+            self.assertNotEqual(tx_hash, tx.hash256_explorer())
+            setattr(tx, field, origin)
+            self.assertEqual(tx_hash, tx.hash256_explorer())
+        self.assertEqual(tx_hash, tx.hash256_bytes()[::-1].hex())
+        self.assertEqual(tx.hash256_hex(), tx.hash256_bytes().hex())
+
+    def test_sign_batch(self):
+        pub_keys = [acct1.get_public_key_bytes(), acct2.get_public_key_bytes(), acct3.get_public_key_bytes()]
+        tx1 = Transaction(0, 0xd1, 1, 500, 20000, None, bytearray(b'\x00\xc6\x6b'), bytearray(), list())
+        tx1.sign_transaction(acct1)
+        tx1.add_sign_transaction(acct2)
+        tx1.add_multi_sign_transaction(2, list(pub_keys), acct1)
+        tx1.add_multi_sign_transaction(2, list(pub_keys), acct3)
+        tx2 = Transaction(0, 0xd1, 1, 500, 20000, None, bytearray(b'\x00\xc6\x6b'), bytearray(), list())
+        tx2.sign_batch([acct1, acct2], [(2, pub_keys, [acct1, acct3])], max_workers=4)
+        self.assertEqual(len(tx1.sigs), len(tx2.sigs))
+        for sig1, sig2 in zip(tx1.sigs, tx2.sigs):
+            self.assertEqual(sig1.public_keys, sig2.public_keys)
+            self.assertEqual(sig1.m, sig2.m)
+            self.assertEqual(len(sig1.sig_data), len(sig2.sig_data))
+        tx_hash = tx2.hash256_bytes()
+        self.assertTrue(acct2.verify_signature(tx_hash, tx2.sigs[1].sig_data[0]))
+        self.assertTrue(acct3.verify_signature(tx_hash, tx2.sigs[2].sig_data[1]))
+        self.assertRaises(SDKException, tx2.sign_batch, None, [(2, pub_keys, [acct2, acct3])])
 
     def test_multi_serialize(self):
         pub_keys = [acct1.get_public_key_bytes(), acct2.get_public_key_bytes(), acct3.get_public_key_bytes()]
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import unittest
+
+from ontology.utils import utils
+from ontology.account.account import Account
+from ontology.exception.exception import SDKException
+from ontology.wallet.wallet_manager import WalletManager
+from ontology.wallet.unlock_cache import UnlockedAccountCache
+
+path = os.path.join(os.path.dirname(__file__), 'test_unlock_cache.json')
+
+
+class TestUnlockedAccountCache(unittest.TestCase):
+    def test_get_put(self):
+        cache = UnlockedAccountCache(max_size=2)
+        acct_list = [Account(utils.get_random_hex_str(64)) for _ in range(3)]
+        for acct in acct_list:
+            cache.put(acct.get_address_base58(), 'key', 'password', acct)
+        self.assertEqual(2, len(cache))
+        self.assertNotIn(acct_list[0].get_address_base58(), cache)
+        b58_address = acct_list[1].get_address_base58()
+        self.assertIsNone(cache.get(b58_address, 'key', 'wrong password'))
+        self.assertIsNone(cache.get(b58_address, 'another key', 'password'))
+        unlocked_acct = cache.get(b58_address, 'key', 'password')
+        self.assertIs(acct_list[1], unlocked_acct)
+        cache.lock(b58_address)
+        self.assertIsNone(cache.get(b58_address, 'key', 'password'))
+        cache.lock()
+        self.assertEqual(0, len(cache))
+        self.assertEqual(dict(hits=1, misses=3, size=0), cache.get_statistics())
+        self.assertRaises(SDKException, UnlockedAccountCache, 0)
+
+    def test_timeout(self):
+        acct = Account(utils.get_random_hex_str(64))
+        cache = UnlockedAccountCache(idle_timeout=1e-9)
+        cache.put(acct.get_address_base58(), 'key', 'password', acct)
+        self.assertIsNone(cache.get(acct.get_address_base58(), 'key', 'password'))
+        cache = UnlockedAccountCache(ttl=1e-9)
+        cache.put(acct.get_address_base58(), 'key', 'password', acct)
+        cache.evict_expired()
+        self.assertEqual(0, len(cache))
+
+    def test_wallet_manager(self):
+        wm = WalletManager()
+        wm.create_wallet_file(path)
+        try:
+            wm.open_wallet(path)
+            password = utils.get_random_hex_str(10)
+            b58_address = wm.create_account('label', password).b58_address
+            acct = wm.unlock_account(b58_address, password)
+            cache = wm.get_unlock_cache()
+            self.assertIn(b58_address, cache)
+            self.assertIs(acct, wm.get_default_account(password))
+            self.assertEqual(1, cache.get_statistics()['hits'])
+            self.assertRaises(SDKException, wm.get_account_by_b58_address, b58_address, 'wrong password')
+            wm.lock_account(b58_address)
+            self.assertNotIn(b58_address, cache)
+            wm.set_unlock_cache(None)
+            self.assertRaises(SDKException, wm.set_unlock_cache, dict())
+        finally:
+            wm.del_wallet_file()
+
+
+if __name__ == '__main__':
+    unittest.main()
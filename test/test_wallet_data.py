@@ -44,6 +44,15 @@ class TestWalletData(unittest.TestCase):
             address_list.remove(rand_address)
             self.assertEqual(len(wallet.accounts), size - i - 1)
 
+    def test_set_default_account_without_default_address(self):
+        accounts = [AccountData(b58_address='A1', is_default=True), AccountData(b58_address='A2', is_default=False)]
+        wallet = WalletData(default_address='', accounts=accounts)
+        wallet.set_default_account_by_address('A2')
+        self.assertEqual(['A2'], [acct.b58_address for acct in wallet.accounts if acct.is_default])
+        wallet.default_account_address = 'stale'
+        wallet.set_default_account_by_index(0)
+        self.assertEqual(['A1'], [acct.b58_address for acct in wallet.accounts if acct.is_default])
+
     def test_get_account_by_index(self):
         test_id = "test_ont_id"
         wallet = WalletData(default_id=test_id)
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import unittest
+
+from unittest.mock import patch
+
+from ontology.common.define import DID_ONT
+from ontology.wallet.identity import Identity
+from ontology.wallet.control import Control
+from ontology.wallet.account import AccountData
+from ontology.exception.exception import SDKException
+from ontology.wallet.wallet_manager import WalletManager
+from ontology.wallet.wallet_journal import WalletJournal
+
+path = os.path.join(os.path.dirname(__file__), 'test_wallet_journal.json')
+journal_path = WalletJournal.get_journal_path(path)
+
+
+class TestWalletJournal(unittest.TestCase):
+    def tearDown(self):
+        for file_path in (path, journal_path):
+            if os.path.isfile(file_path):
+                os.remove(file_path)
+
+    @staticmethod
+    def open_wallet(compact_threshold: int = 1000) -> WalletManager:
+        wm = WalletManager()
+        wm.set_wallet_journal(WalletJournal(compact_threshold))
+        wm.open_wallet(path)
+        return wm
+
+    @staticmethod
+    def read_journal() -> list:
+        with open(journal_path, 'r') as f:
+            return [json.loads(line) for line in f]
+
+    def test_journal(self):
+        wm = self.open_wallet()
+        self.assertFalse(os.path.isfile(journal_path))
+        for index in range(3):
+            wm.wallet_in_mem.add_account(AccountData(b58_address=f'address{index}', label=f'label{index}'))
+            wm.write_wallet()
+        wm.wallet_in_mem.add_identity(Identity(DID_ONT + 'address0'))
+        wm.wallet_in_mem.get_account_by_b58_address('address1').label = 'new label'
+        wm.wallet_in_mem.remove_account('address0')
+        wm.wallet_in_mem.default_account_address = 'address2'
+        wm.save()
+        wm.save()
+        records = self.read_journal()
+        self.assertEqual(4, len(records))
+        self.assertEqual(['address0'], list(records[0]['accounts'].keys()))
+        self.assertEqual(dict(address1=dict(wm.wallet_in_mem.accounts[0]), address0=None), records[3]['accounts'])
+        self.assertEqual('address2', records[3]['header']['defaultAccountAddress'])
+        self.assertEqual(3, len(wm.wallet_file.accounts))
+        expected = dict(wm.wallet_in_mem)
+        self.assertEqual(expected, dict(self.open_wallet().wallet_in_mem))
+        with open(journal_path, 'ab') as f:
+            f.write(b'{"accounts": {"address1"')
+        self.assertEqual(expected, dict(self.open_wallet().wallet_in_mem))
+        wm.set_wallet_journal(None)
+        self.assertFalse(os.path.isfile(journal_path))
+        wm = WalletManager()
+        wm.open_wallet(path)
+        self.assertEqual(expected, dict(wm.wallet_in_mem))
+
+    def test_compact(self):
+        wm = self.open_wallet(compact_threshold=3)
+        for index in range(2):
+            wm.wallet_in_mem.add_account(AccountData(b58_address=f'address{index}'))
+            wm.save()
+        self.assertEqual(2, len(self.read_journal()))
+        wm.wallet_in_mem.add_account(AccountData(b58_address='address2'))
+        wm.save()
+        self.assertFalse(os.path.isfile(journal_path))
+        wm.wallet_in_mem.add_account(AccountData(b58_address='address3'))
+        wm.save()
+        self.assertEqual(1, len(self.read_journal()))
+        wm.wallet_in_mem.accounts.reverse()
+        wm.save()
+        self.assertFalse(os.path.isfile(journal_path))
+        with open(path, 'r') as f:
+            self.assertEqual(json.dumps(dict(wm.wallet_in_mem), indent=4), f.read())
+        wm.write_wallet()
+        wm.wallet_in_mem.accounts.clear()
+        wm.reset_wallet()
+        self.assertEqual('address3', wm.wallet_in_mem.accounts[0].b58_address)
+        self.assertRaises(SDKException, WalletJournal, 0)
+
+    def test_torn_tail(self):
+        wm = self.open_wallet()
+        wm.wallet_in_mem.add_account(AccountData(b58_address='address0'))
+        wm.save()
+        wm.wallet_in_mem.add_account(AccountData(b58_address='address1'))
+        wm.save()
+        for torn_tail in (b'{"accounts": {"address2"', b'{}'):
+            record_count = len(self.read_journal())
+            with open(journal_path, 'ab') as f:
+                f.write(torn_tail)
+            wm = self.open_wallet()
+            wm.wallet_in_mem.add_account(AccountData(b58_address='address2'))
+            wm.save()
+            wm.wallet_in_mem.add_account(AccountData(b58_address='address3'))
+            wm.save()
+            self.assertEqual(record_count + 2, len(self.read_journal()))
+            accounts = self.open_wallet().wallet_in_mem.accounts
+            self.assertEqual([f'address{index}' for index in range(4)], [acct.b58_address for acct in accounts])
+            wm.wallet_in_mem.remove_account('address3')
+            wm.wallet_in_mem.remove_account('address2')
+            wm.save()
+
+    def test_tracked_changes(self):
+        wm = self.open_wallet()
+        for index in range(4):
+            wm.wallet_in_mem.add_account(AccountData(b58_address=f'address{index}'))
+        wm.wallet_in_mem.add_identity(Identity(DID_ONT + 'address0', controls=[Control('keys-1')]))
+        wm.save()
+        serialized = list()
+        acct_iter = AccountData.__iter__
+
+        def counted_iter(acct):
+            serialized.append(acct.b58_address)
+            return acct_iter(acct)
+
+        with patch.object(AccountData, '__iter__', counted_iter):
+            wm.wallet_in_mem.get_account_by_b58_address('address1').label = 'new label'
+            wm.wallet_in_mem.remove_account('address0')
+            wm.wallet_in_mem.add_account(AccountData(b58_address='address4'))
+            wm.wallet_in_mem.add_account(AccountData(b58_address='address5'))
+            wm.wallet_in_mem.remove_account('address5')
+            wm.wallet_in_mem.identities[0].controls[0].salt = 'salt'
+            wm.save()
+            self.assertEqual(['address1', 'address4'], serialized)
+            record = self.read_journal()[-1]
+            self.assertEqual(['address0', 'address1', 'address4'], list(record['accounts'].keys()))
+            self.assertIsNone(record['accounts']['address0'])
+            self.assertEqual('salt', record['identities'][DID_ONT + 'address0']['controls'][0]['salt'])
+            serialized.clear()
+            wm.save()
+            self.assertEqual([], serialized)
+        wm.wallet_in_mem.add_account(AccountData(b58_address='address0'))
+        wm.save()
+        self.assertEqual(['address0'], list(self.read_journal()[-1]['accounts'].keys()))
+        wm.wallet_in_mem.get_account_by_b58_address('address0').b58_address = 'address6'
+        wm.save()
+        self.assertEqual({'address0', 'address6'}, set(self.read_journal()[-1]['accounts'].keys()))
+        wm.wallet_in_mem.get_account_by_b58_address('address1').b58_address = 'address7'
+        wm.save()
+        self.assertFalse(os.path.isfile(journal_path))
+        expected = dict(wm.wallet_in_mem)
+        self.assertEqual(expected, dict(self.open_wallet().wallet_in_mem))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -307,6 +307,38 @@ class TestWalletManager(unittest.TestCase):
         finally:
             wm.del_wallet_file()
 
+    def test_create_and_import_accounts(self):
+        wm = WalletManager()
+        wm.create_wallet_file(path)
+        try:
+            wm.open_wallet(path)
+            random_password = utils.get_random_hex_str(10)
+            acct_data_list = wm.create_accounts(4, random_password, max_workers=2)
+            self.assertEqual(4, len(wm.wallet_in_mem.accounts))
+            self.assertEqual([True, False, False, False], [acct_data.is_default for acct_data in acct_data_list])
+            self.assertEqual(acct_data_list[0].b58_address, wm.wallet_in_mem.default_account_address)
+            acct = wm.get_account_by_b58_address(acct_data_list[3].b58_address, random_password)
+            self.assertEqual(acct_data_list[3].public_key, acct.get_public_key_hex())
+            self.assertRaises(SDKException, wm.create_accounts, 2, random_password, ['label'])
+            acct_list = [(acct_data.label, acct_data.key, random_password, acct_data.b58_address, acct_data.salt)
+                         for acct_data in acct_data_list]
+            self.assertRaises(SDKException, wm.import_accounts, acct_list[0:1])
+            wm.write_wallet()
+        finally:
+            wm.del_wallet_file()
+        wm = WalletManager()
+        wm.create_wallet_file(path)
+        try:
+            wm.open_wallet(path)
+            imported_list = wm.import_accounts(acct_list, max_workers=2)
+            self.assertEqual([dict(acct_data) for acct_data in acct_data_list],
+                             [dict(acct_data) for acct_data in imported_list])
+            invalid_list = [acct_list[0][0:2] + ('wrong password',) + acct_list[0][3:]]
+            self.assertRaises(SDKException, wm.import_accounts, invalid_list, 1)
+            self.assertEqual(4, len(wm.wallet_in_mem.accounts))
+        finally:
+            wm.del_wallet_file()
+
     def test_create_account_from_private_key(self):
         wm = WalletManager()
         self.assertRaises(SDKException, wm.open_wallet)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import codecs
+import unittest
+
+from ontology.utils import utils
+from ontology.common.define import DID_ONT
+from ontology.wallet.identity import Identity
+from ontology.wallet.account import AccountData
+from ontology.exception.exception import SDKException
+from ontology.wallet.wallet_manager import WalletManager
+from ontology.wallet.wallet_reader import WalletReader
+from ontology.wallet.wallet_journal import WalletJournal
+
+path = os.path.join(os.path.dirname(__file__), 'test_wallet_reader.json')
+index_path = WalletReader.get_index_path(path)
+
+
+class TestWalletReader(unittest.TestCase):
+    def tearDown(self):
+        for file_path in (path, index_path, WalletJournal.get_journal_path(path)):
+            if os.path.isfile(file_path):
+                os.remove(file_path)
+
+    def test_reader(self):
+        wm = WalletManager()
+        wm.create_wallet_file(path)
+        wm.open_wallet(path)
+        wm.wallet_in_mem.name = '钱包'
+        password = utils.get_random_hex_str(10)
+        acct_list = wm.create_accounts(3, password, labels=['标签', 'label1', 'label2'], max_workers=1)
+        wm.wallet_in_mem.add_identity(Identity(DID_ONT + acct_list[0].b58_address, label='identity'))
+        wm.save()
+        with wm.open_wallet_reader() as reader:
+            self.assertTrue(os.path.isfile(index_path))
+            self.assertEqual('钱包', reader.name)
+            self.assertEqual('标签', reader.get_account_data_by_b58_address(acct_list[0].b58_address).label)
+            self.assertEqual(dict(acct_list[0]), dict(reader.get_default_account_data()))
+            self.assertEqual('identity', reader.get_identity_by_ont_id(DID_ONT + acct_list[0].b58_address).label)
+            self.assertRaises(SDKException, reader.get_account_data_by_b58_address, 'address')
+            self.assertRaises(SDKException, reader.get_identity_by_ont_id, DID_ONT + 'address')
+            acct = reader.get_account_by_b58_address(acct_list[1].b58_address, password)
+            self.assertEqual(acct_list[1].b58_address, acct.get_address_base58())
+            self.assertEqual(dict(wm.wallet_in_mem), dict(reader.to_wallet_data()))
+        wm.wallet_in_mem.remove_account(acct_list[2].b58_address)
+        wm.wallet_in_mem.add_account(AccountData(b58_address='address', label='label'))
+        wm.save()
+        with WalletReader(path) as reader:
+            self.assertEqual(['标签', 'label1', 'label'], [acct.label for acct in reader.iter_accounts()])
+        self.assertRaises(SDKException, wm.open_wallet_reader, path + '.missing')
+
+    def test_journal(self):
+        wm = WalletManager()
+        wm.set_wallet_journal(WalletJournal())
+        wm.open_wallet(path)
+        for index in range(3):
+            wm.wallet_in_mem.add_account(AccountData(b58_address=f'address{index}', label=f'label{index}'))
+        wm.save()
+        wm.wallet_in_mem.remove_account('address0')
+        wm.wallet_in_mem.get_account_by_b58_address('address1').label = 'new label'
+        wm.wallet_in_mem.add_account(AccountData(b58_address='address3'))
+        wm.save()
+        with WalletReader(path) as reader:
+            self.assertEqual(dict(wm.wallet_in_mem), dict(reader.to_wallet_data()))
+            self.assertEqual('new label', reader.get_account_data_by_b58_address('address1').label)
+            self.assertRaises(SDKException, reader.get_account_data_by_b58_address, 'address0')
+        with open(path, 'w') as f:
+            f.write('{"accounts": [{"label": "label"}]}')
+        self.assertRaises(SDKException, WalletReader, path)
+
+    def test_scan(self):
+        parameters = dict(curve='P-256')
+        for _ in range(8):
+            parameters = dict(nested=[parameters])
+        accounts = [dict(AccountData(b58_address='address0', label='{[}]",\\')),
+                    dict(AccountData(b58_address='address"1', param=parameters)),
+                    dict(AccountData(b58_address='地址2', label='标签')),
+                    dict(reversed(list(dict(AccountData(b58_address='address3')).items())))]
+        identities = [dict(Identity(DID_ONT + 'address0', label='}'))]
+        wallet_dict = dict(name='{"name"}', identities=identities, accounts=accounts, scrypt=dict(n=16384))
+        for indent, ensure_ascii in ((None, True), (4, False)):
+            content = json.dumps(wallet_dict, indent=indent, ensure_ascii=ensure_ascii).encode('utf-8')
+            with open(path, 'wb') as f:
+                f.write(codecs.BOM_UTF8 + content)
+            if os.path.isfile(index_path):
+                os.remove(index_path)
+            with WalletReader(path) as reader:
+                self.assertEqual('{"name"}', reader.name)
+                self.assertEqual(16384, reader.scrypt.n)
+                for acct in accounts:
+                    self.assertEqual(acct, dict(reader.get_account_data_by_b58_address(acct['address'])))
+                self.assertEqual(identities[0], dict(reader.get_identity_by_ont_id(DID_ONT + 'address0')))
+                self.assertEqual(accounts, [dict(acct) for acct in reader.iter_accounts()])
+        with open(path, 'wb') as f:
+            f.write(json.dumps(wallet_dict).encode('utf-8')[:-20])
+        self.assertRaises(SDKException, WalletReader, path)
+
+
+if __name__ == '__main__':
+    unittest.main()
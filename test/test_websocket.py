@@ -1,15 +1,19 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import json
 import asyncio
 import unittest
 
+import websockets
+
 from test import acct1, acct2, acct3, acct4
 
 from ontology.exception.error_code import ErrorCode
 from ontology.exception.exception import SDKException
 from ontology.ont_sdk import OntologySdk
 from ontology.account.account import Account
+from ontology.network.websocket import WebsocketClient
 from ontology.crypto.signature_scheme import SignatureScheme
 from ontology.utils.contract_data_parser import ContractDataParser
 from ontology.utils.contract_event_parser import ContractEventParser
@@ -134,6 +138,61 @@ class TestWebsocketClient(unittest.TestCase):
         value = ContractDataParser.to_int(value)
         self.assertEqual(1000000000, value)
 
+    @staticmethod
+    async def multiplexed_get_storage_case(hex_contract_address: str, key: str, count: int):
+        client = WebsocketClient(websocket_client.get_address(), is_multiplexed=True)
+        storage_list = await asyncio.gather(*[client.get_storage(hex_contract_address, key) for _ in range(count)])
+        balance = await client.get_balance(acct4.get_address_base58())
+        await client.close_connect()
+        return storage_list, balance
+
+    def test_multiplexed_get_storage(self):
+        hex_contract_address = '0100000000000000000000000000000000000000'
+        key = '746f74616c537570706c79'
+        event_loop = asyncio.get_event_loop()
+        storage_list, balance = event_loop.run_until_complete(
+            TestWebsocketClient.multiplexed_get_storage_case(hex_contract_address, key, 50))
+        self.assertEqual(50, len(storage_list))
+        for value in storage_list:
+            self.assertEqual(1000000000, ContractDataParser.to_int(value))
+        self.assertGreaterEqual(balance['ont'], 1)
+
+    @staticmethod
+    async def unmatched_id_case(request_count: int):
+        async def answer_without_id(ws_client, *args):
+            async for message in ws_client:
+                msg = json.loads(message)
+                await ws_client.send(json.dumps(dict(Action=msg['Action'], Desc='SUCCESS', Error=0, Result=100)))
+
+        server = await websockets.serve(answer_without_id, '127.0.0.1', 0)
+        client = WebsocketClient(f'ws://127.0.0.1:{server.sockets[0].getsockname()[1]}', is_multiplexed=True)
+        try:
+            height_list = await asyncio.gather(
+                *[asyncio.wait_for(client.get_block_height(), 0.5) for _ in range(request_count)],
+                return_exceptions=True)
+            unmatched_count = 0
+            while True:
+                try:
+                    await asyncio.wait_for(client.recv_subscribe_info(), 0.1)
+                except asyncio.TimeoutError:
+                    break
+                unmatched_count += 1
+        finally:
+            await client.close_connect()
+            server.close()
+            await server.wait_closed()
+        return height_list, unmatched_count
+
+    def test_unmatched_id(self):
+        event_loop = asyncio.get_event_loop()
+        height_list, unmatched_count = event_loop.run_until_complete(TestWebsocketClient.unmatched_id_case(1))
+        self.assertEqual([100], height_list)
+        self.assertEqual(0, unmatched_count)
+        height_list, unmatched_count = event_loop.run_until_complete(TestWebsocketClient.unmatched_id_case(2))
+        for height in height_list:
+            self.assertTrue(isinstance(height, asyncio.TimeoutError))
+        self.assertEqual(2, unmatched_count)
+
     @staticmethod
     async def get_smart_contract_case(hex_contract_address: str):
         response = await websocket_client.get_smart_contract(hex_contract_address)
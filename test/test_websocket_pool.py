@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import asyncio
+import unittest
+
+from ontology.exception.exception import SDKException
+from ontology.network.websocket_pool import WebsocketPool
+from ontology.network.websocket import TEST_WS_ADDRESS, BackpressurePolicy
+
+
+class TestWebsocketPool(unittest.TestCase):
+    @staticmethod
+    async def get_block_height_case(pool: WebsocketPool, count: int):
+        await pool.start()
+        height_list = await asyncio.gather(*[pool.get_client().get_block_height() for _ in range(count)])
+        await pool.close()
+        return height_list
+
+    def test_get_block_height(self):
+        pool = WebsocketPool(TEST_WS_ADDRESS, size=2)
+        event_loop = asyncio.get_event_loop()
+        height_list = event_loop.run_until_complete(TestWebsocketPool.get_block_height_case(pool, 10))
+        self.assertEqual(10, len(height_list))
+        for height in height_list:
+            self.assertGreater(height, 0)
+
+    @staticmethod
+    async def reconnect_case(pool: WebsocketPool):
+        await pool.start()
+        ws_client = pool.get_client()
+        await ws_client.close_connect()
+        await asyncio.sleep(2)
+        is_connected = ws_client.is_connected
+        height = await ws_client.get_block_height()
+        await pool.close()
+        return is_connected, height
+
+    def test_reconnect(self):
+        pool = WebsocketPool(TEST_WS_ADDRESS[0], size=1, heartbeat_interval=1, reconnect_base_delay=0.1)
+        event_loop = asyncio.get_event_loop()
+        is_connected, height = event_loop.run_until_complete(TestWebsocketPool.reconnect_case(pool))
+        self.assertTrue(is_connected)
+        self.assertGreater(height, 0)
+        self.assertEqual(1, pool.reconnect_count)
+
+    def test_invalid_size(self):
+        self.assertRaises(SDKException, WebsocketPool, TEST_WS_ADDRESS[0], 0)
+        self.assertRaises(SDKException, WebsocketPool, TEST_WS_ADDRESS[0], subscribe_policy=BackpressurePolicy.COALESCE)
+
+
+if __name__ == '__main__':
+    unittest.main()